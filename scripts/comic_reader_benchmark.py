@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Page Scraper Benchmark
+
+Runs selenium_webscraping_pages.py against the local reader fixture
+(comic_reader_mock_server.py) and reports seconds per page, pages per
+issue and whether every issue boundary was detected correctly.
+Usage: python comic_reader_benchmark.py [--modes page fast] [--issues 4]
+
+Each mode scrapes the whole fixture volume into a fresh temporary
+directory: discovery, then every issue in order. "page" drives a headless
+Chrome through the page-by-page reader (needs Chrome); "fast" uses the
+"All pages" reader over plain HTTP. An issue is correct when exactly its
+real pages were kept - no page lost, no duplicate or next-issue page
+saved.
+"""
+
+import io
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+from pathlib import Path
+
+from comic_reader_mock_server import MockReader, start_server, DEFAULT_ISSUE_COUNT, DEFAULT_BASE_PAGES
+from stage_metrics import StageMetrics
+
+
+# Configuration
+UNTHROTTLED_RATE = 10000.0  # Reader requests per second used when limits are disabled
+DEFAULT_MODES = ["page", "fast"]
+REPORTED_STAGES = ["page_load", "navigate", "download", "validate"]
+
+
+def check_issue(issue_dir: Path, expected_pages: int) -> tuple[bool, int]:
+    """
+    Compare a scraped issue with the fixture.
+
+    Returns:
+        (correct, kept_pages) tuple
+    """
+    pages_dir = issue_dir / "pages"
+    kept = sorted(path.name for path in pages_dir.glob("page_*")) if pages_dir.exists() else []
+    expected = [f"page_{n:03d}.jpg" for n in range(1, expected_pages + 1)]
+
+    total_pages = None
+    metadata_path = issue_dir / "metadata.json"
+    if metadata_path.exists():
+        with open(metadata_path, "r", encoding="utf-8") as f:
+            total_pages = json.load(f).get("total_pages")
+
+    return kept == expected and total_pages == expected_pages, len(kept)
+
+
+def run_mode(mode: str, mock: MockReader, args) -> dict:
+    """Scrape the fixture volume once in `mode` and return its measurements."""
+    import selenium_webscraping_pages as scraper
+    from comicvine_ratelimit import TokenBucket
+
+    rate = scraper.HOST_RATE if args.throttled else UNTHROTTLED_RATE
+    limiter = TokenBucket(rate=rate, capacity=scraper.HOST_BURST)
+    scraper.metrics = StageMetrics(f"{scraper.METRICS_JOB}_bench_{mode}")
+
+    browser = None
+    if mode == "page":
+        browser = scraper.BrowserSession(headless=True, blocked_urls=scraper.build_blocked_urls(),
+                                         load_images=not args.no_images, capture=args.capture)
+
+    issues = []
+    start_time = time.monotonic()
+
+    with tempfile.TemporaryDirectory(prefix="reader_bench_") as work_dir:
+        scraper.OUTPUT_BASE_PATH = Path(work_dir)
+        output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+
+        try:
+            with output:
+                discovered = scraper.discover_issues(mock.volume_name, limiter)
+
+            for issue_id, url in discovered:
+                issue_start = time.monotonic()
+                with output:
+                    scraper.scrape_issue(mock.volume_name, issue_id, url, headless=True,
+                                         stop_at_next_issue=True, fast=(mode == "fast"),
+                                         workers=args.workers, browser=browser,
+                                         limiter=limiter, capture=args.capture)
+                seconds = time.monotonic() - issue_start
+
+                expected = mock.expected_pages(issue_id)
+                issue_dir = scraper.OUTPUT_BASE_PATH / scraper.sanitize_filename(mock.volume_name) / "issues" / issue_id
+                correct, kept = check_issue(issue_dir, expected)
+                issues.append({
+                    "issue": issue_id,
+                    "expected_pages": expected,
+                    "kept_pages": kept,
+                    "correct": correct,
+                    "seconds": round(seconds, 3),
+                })
+                print(f"  [{'OK' if correct else 'FAIL'}] {mode} Issue #{issue_id}: "
+                      f"{kept}/{expected} pages in {seconds:.2f}s")
+        finally:
+            if browser:
+                browser.quit()
+
+    elapsed = time.monotonic() - start_time
+    pages = sum(issue["kept_pages"] for issue in issues)
+    stages = scraper.metrics.summary()["stages"]
+
+    return {
+        "mode": mode,
+        "issues": len(issues),
+        "discovered": len(issues) == len(mock.issues),
+        "pages": pages,
+        "seconds": round(elapsed, 3),
+        "seconds_per_page": round(elapsed / pages, 3) if pages else 0.0,
+        "pages_per_issue": round(pages / len(issues), 1) if issues else 0.0,
+        "boundaries_correct": sum(issue["correct"] for issue in issues),
+        "per_issue": issues,
+        "stages": {stage: stages[stage] for stage in REPORTED_STAGES if stage in stages},
+    }
+
+
+def run_benchmark(args) -> list[dict]:
+    """Start the fixture server and run every mode against it."""
+    import selenium_webscraping_pages as scraper
+
+    mock = MockReader(issue_count=args.issues, base_pages=args.pages,
+                      page_latency=args.page_latency, image_latency=args.image_latency,
+                      error_rate=args.error_rate)
+    server = start_server(mock)
+    scraper.COMIC_BASE_URL = mock.base_url
+    results = []
+
+    try:
+        for mode in args.modes:
+            print(f"Running {mode} mode...", flush=True)
+            try:
+                results.append(run_mode(mode, mock, args))
+            except Exception as e:
+                print(f"[FAIL] {mode} mode: {e}")
+    finally:
+        server.shutdown()
+
+    return results
+
+
+def main():
+    """Main execution flow."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark selenium_webscraping_pages.py against a local reader fixture",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python comic_reader_benchmark.py
+
+  # Only the plain HTTP fast path (no Chrome needed)
+  python comic_reader_benchmark.py --modes fast
+
+  # Slow reader and image host with 8 download workers
+  python comic_reader_benchmark.py --page-latency 0.3 --image-latency 0.1 --workers 8
+
+  # Use the scraper's real host rate limit instead of an unthrottled limiter
+  python comic_reader_benchmark.py --modes page --throttled
+        """
+    )
+
+    parser.add_argument("--modes", nargs="+", choices=DEFAULT_MODES, default=DEFAULT_MODES,
+                        help="Scrape modes to benchmark (default: page fast)")
+    parser.add_argument("--issues", type=int, default=DEFAULT_ISSUE_COUNT,
+                        help=f"Issues in the fixture volume (default: {DEFAULT_ISSUE_COUNT})")
+    parser.add_argument("--pages", type=int, default=DEFAULT_BASE_PAGES,
+                        help=f"Pages of issue 1 (default: {DEFAULT_BASE_PAGES})")
+    parser.add_argument("--workers", type=int, default=4, help="Download workers (default: 4)")
+    parser.add_argument("--throttled", action="store_true", help="Use the scraper's real HOST_RATE")
+    parser.add_argument("--no-images", action="store_true", help="Run the browser without loading images")
+    parser.add_argument("--capture", action="store_true", help="Take page bytes from the browser")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Fixture reader latency in seconds")
+    parser.add_argument("--image-latency", type=float, default=0.0, help="Fixture image latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fixture HTTP 503 rate for page images")
+    parser.add_argument("--verbose", action="store_true", help="Show the scraper's own output")
+    parser.add_argument("--json", metavar="FILE", help="Also write results to a JSON file")
+
+    args = parser.parse_args()
+
+    if args.capture and args.no_images:
+        parser.error("--capture needs the browser to load images; drop --no-images")
+
+    results = run_benchmark(args)
+
+    # Print summary
+    print("\n" + "=" * 78)
+    print("Benchmark Summary")
+    print("=" * 78)
+    print(f"{'Mode':<6} {'Issues':>7} {'Pages':>6} {'Seconds':>8} {'s/page':>7} "
+          f"{'Pages/issue':>12} {'Boundaries':>11} {'Discovery':>10}")
+    for r in results:
+        print(f"{r['mode']:<6} {r['issues']:>7} {r['pages']:>6} {r['seconds']:>8} "
+              f"{r['seconds_per_page']:>7} {r['pages_per_issue']:>12} "
+              f"{str(r['boundaries_correct']) + '/' + str(r['issues']):>11} "
+              f"{'OK' if r['discovered'] else 'FAIL':>10}")
+    print("=" * 78)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nBenchmark cancelled by user.")
+        sys.exit(0)
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Reader Mock Server
+
+Local stand-in for the readcomiconline.li reader, used to exercise and
+benchmark selenium_webscraping_pages.py offline.
+Usage: python comic_reader_mock_server.py [--port 8710] [--image-latency 0.05]
+
+Serves:
+  /Comic/<Volume>                     volume landing page with issue links
+  /Comic/<Volume>/Issue-<n>[#page]    page-by-page reader (#btnNext, page
+                                      indicator, server and quality links)
+  /Comic/<Volume>/Issue-<n>?readType=1
+                                      "All pages" reader with lstImages.push(...)
+  /bp.blogspot.com/<volume>/<n>/<page>.jpg
+                                      synthetic page images
+
+The generated issues cover the reader's issue-boundary cases: "Next" on an
+issue's last page rolls over into the next issue, some issues end with a
+duplicate of their first page, and some show no page indicator, so the
+scraper has to rely on the rollover or the duplicate to stop.
+"""
+
+import io
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, unquote
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError as e:
+    print(f"Error: Missing required dependency: {e}")
+    print("Install with: pip install pillow")
+    sys.exit(1)
+
+
+# Configuration
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8710
+DEFAULT_VOLUME_NAME = "Mock Reader"
+DEFAULT_ISSUE_COUNT = 4
+DEFAULT_BASE_PAGES = 8  # Pages of issue 1; later issues vary around it
+DUPLICATE_EVERY = 3  # Every third issue ends with a duplicate of its first page
+INDICATOR_EVERY = 2  # Every second issue shows a "Page N/T" indicator
+IMAGE_SIZE = (600, 900)  # Synthetic page size (passes the scraper's validation)
+IMAGE_TILE = (60, 90)  # Random tile scaled up to IMAGE_SIZE, so pages are distinct but small
+ISSUE_ID_BASE = 1000  # Reader ?id= values start here
+
+# Page images are served under a blogspot-like path: the scraper only
+# accepts page images whose URL mentions blogspot.com
+IMAGE_PATH_PREFIX = "bp.blogspot.com"
+
+
+def url_segment(name: str) -> str:
+    """Volume name as it appears in reader URLs (e.g. "Mock Reader" -> "Mock-Reader")."""
+    return "-".join(name.split())
+
+
+class MockReader:
+    """
+    Generated volume plus request accounting.
+
+    Issue n has DEFAULT_BASE_PAGES + (n - 1) % 3 * 2 real pages. Issues
+    whose number is a multiple of `duplicate_every` get one extra page with
+    the same image bytes as their page 1; issues whose number is a
+    multiple of `indicator_every` show the page indicator.
+    """
+
+    def __init__(self, volume_name: str = DEFAULT_VOLUME_NAME,
+                 issue_count: int = DEFAULT_ISSUE_COUNT, base_pages: int = DEFAULT_BASE_PAGES,
+                 page_latency: float = 0.0, image_latency: float = 0.0,
+                 error_rate: float = 0.0, duplicate_every: int = DUPLICATE_EVERY,
+                 indicator_every: int = INDICATOR_EVERY):
+        self.volume_name = volume_name
+        self.segment = url_segment(volume_name)
+        self.page_latency = page_latency
+        self.image_latency = image_latency
+        self.error_rate = error_rate
+        self.base_url = ""
+
+        self.issues = {}
+        for number in range(1, issue_count + 1):
+            self.issues[str(number)] = {
+                "pages": base_pages + (number - 1) % 3 * 2,
+                "duplicate_last": bool(duplicate_every) and number % duplicate_every == 0,
+                "indicator": bool(indicator_every) and number % indicator_every == 0,
+            }
+
+        self._images = {}
+        self._lock = threading.Lock()
+        self.reader_requests = 0
+        self.image_requests = 0
+        self.image_bytes = 0
+        self.image_errors = 0
+
+    def expected_pages(self, issue_id: str) -> int:
+        """Real pages of an issue (what a correct scrape keeps)."""
+        return self.issues[issue_id]["pages"]
+
+    def served_pages(self, issue_id: str) -> int:
+        """Pages the reader shows for an issue, including a duplicate last page."""
+        issue = self.issues[issue_id]
+        return issue["pages"] + (1 if issue["duplicate_last"] else 0)
+
+    def issue_url(self, issue_id: str) -> str:
+        return f"{self.base_url}/Comic/{self.segment}/Issue-{issue_id}"
+
+    def next_issue(self, issue_id: str) -> str | None:
+        ids = list(self.issues)
+        index = ids.index(issue_id)
+        return ids[index + 1] if index + 1 < len(ids) else None
+
+    def image_url(self, issue_id: str, page: int) -> str:
+        return f"{self.base_url}/{IMAGE_PATH_PREFIX}/{self.segment}/{issue_id}/{page:03d}.jpg"
+
+    def image_bytes_for(self, issue_id: str, page: int) -> bytes:
+        """Deterministic JPEG for a page (the duplicate last page repeats page 1)."""
+        if self.issues[issue_id]["duplicate_last"] and page == self.served_pages(issue_id):
+            page = 1
+
+        key = (issue_id, page)
+        with self._lock:
+            if key in self._images:
+                return self._images[key]
+
+        rng = random.Random(f"{self.segment}/{issue_id}/{page}")
+        tile = Image.frombytes("RGB", IMAGE_TILE, rng.randbytes(IMAGE_TILE[0] * IMAGE_TILE[1] * 3))
+        image = tile.resize(IMAGE_SIZE, Image.NEAREST)
+        ImageDraw.Draw(image).text((20, 20), f"Issue {issue_id} - Page {page}", fill="white")
+        buffer = io.BytesIO()
+        image.save(buffer, "JPEG", quality=85)
+        data = buffer.getvalue()
+
+        with self._lock:
+            self._images[key] = data
+        return data
+
+    def stats(self) -> dict:
+        """Request counters since startup."""
+        with self._lock:
+            return {
+                "reader_requests": self.reader_requests,
+                "image_requests": self.image_requests,
+                "image_bytes": self.image_bytes,
+                "image_errors": self.image_errors,
+            }
+
+
+# Page-by-page reader: the "#N" fragment selects the page, "Next" on the
+# last page loads the next issue
+READER_SCRIPT = """
+var pages = %(pages)s;
+var nextIssueUrl = %(next_issue_url)s;
+function currentPage() {
+    var n = parseInt(location.hash.slice(1), 10);
+    return n >= 1 && n <= pages.length ? n : 1;
+}
+function render() {
+    var n = currentPage();
+    document.getElementById('imgCurrent').src = pages[n - 1];
+    var indicator = document.getElementById('pageIndicator');
+    if (indicator) indicator.textContent = 'Page ' + n + '/' + pages.length;
+    var next = document.getElementById('btnNext');
+    next.className = (n >= pages.length && !nextIssueUrl) ? 'disabled' : '';
+}
+function setOption(name, value) {
+    document.body.setAttribute('data-' + name, value);
+}
+document.getElementById('btnNext').onclick = function () {
+    var n = currentPage();
+    if (n < pages.length) location.hash = n + 1;
+    else if (nextIssueUrl) location.href = nextIssueUrl + '#1';
+};
+document.getElementById('btnPrev').onclick = function () {
+    var n = currentPage();
+    if (n > 1) location.hash = n - 1;
+};
+window.addEventListener('hashchange', render);
+render();
+"""
+
+
+def render_reader(mock: MockReader, issue_id: str, all_pages: bool) -> str:
+    """HTML of an issue's reader page."""
+    title = f"{mock.volume_name} Issue #{issue_id}"
+    urls = [mock.image_url(issue_id, page) for page in range(1, mock.served_pages(issue_id) + 1)]
+
+    if all_pages:
+        pushes = "\n".join(f'lstImages.push("{url}");' for url in urls)
+        images = "\n".join(f'<img src="{url}" style="width: 800px"><br>' for url in urls)
+        return f"""<!DOCTYPE html>
+<html><head><title>{title} - Read {title} comic online</title></head>
+<body>
+<div id="divImage">
+{images}
+</div>
+<script>
+var lstImages = new Array();
+{pushes}
+</script>
+</body></html>
+"""
+
+    next_issue = mock.next_issue(issue_id)
+    script = READER_SCRIPT % {
+        "pages": json.dumps(urls),
+        "next_issue_url": json.dumps(mock.issue_url(next_issue) if next_issue else None),
+    }
+    indicator = ('<span id="pageIndicator" class="pageIndicator"></span>'
+                 if mock.issues[issue_id]["indicator"] else "")
+
+    return f"""<!DOCTYPE html>
+<html><head><title>{title} - Read {title} comic online</title></head>
+<body>
+<div id="selectServer">
+<a href="javascript:void(0)" onclick="setOption('server', '1')">Server 1</a>
+<a href="javascript:void(0)" onclick="setOption('server', '2')">Server 2</a>
+</div>
+<div id="selectQuality">
+<a href="javascript:void(0)" onclick="setOption('quality', 'hq')">High quality</a>
+<a href="javascript:void(0)" onclick="setOption('quality', 'lq')">Low quality</a>
+</div>
+{indicator}
+<div id="divImage"><img id="imgCurrent" style="width: 800px"></div>
+<a id="btnPrev" href="javascript:void(0)">Prev</a>
+<a id="btnNext" href="javascript:void(0)">Next</a>
+<script>{script}</script>
+</body></html>
+"""
+
+
+def render_volume(mock: MockReader) -> str:
+    """HTML of the volume landing page."""
+    rows = "\n".join(
+        f'<tr><td><a href="/Comic/{mock.segment}/Issue-{issue_id}?id={ISSUE_ID_BASE + index}">'
+        f'{mock.volume_name} Issue #{issue_id}</a></td></tr>'
+        for index, issue_id in enumerate(reversed(list(mock.issues)))
+    )
+    return f"""<!DOCTYPE html>
+<html><head><title>{mock.volume_name} comic | Read {mock.volume_name} comic online</title></head>
+<body>
+<table class="listing">
+{rows}
+</table>
+</body></html>
+"""
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching reader and image routes to the dataset."""
+
+    mock: MockReader = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, body: bytes, content_type: str, status: int = 200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_not_found(self):
+        self.send_body(b"<html><body><h1>404 - Not found</h1></body></html>",
+                       "text/html; charset=utf-8", status=404)
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        parts = [unquote(part) for part in parsed.path.split("/") if part]
+
+        if len(parts) == 4 and parts[0] == IMAGE_PATH_PREFIX:
+            self.handle_image(parts[2], parts[3])
+        elif len(parts) in (2, 3) and parts[0] == "Comic" and parts[1] == self.mock.segment:
+            self.handle_reader(parts[2] if len(parts) == 3 else None, params)
+        else:
+            self.send_not_found()
+
+    def handle_reader(self, segment: str | None, params: dict):
+        mock = self.mock
+        time.sleep(mock.page_latency)
+
+        with mock._lock:
+            mock.reader_requests += 1
+
+        if segment is None:
+            self.send_body(render_volume(mock).encode("utf-8"), "text/html; charset=utf-8")
+            return
+
+        issue_id = segment[len("Issue-"):] if segment.startswith("Issue-") else None
+        if issue_id not in mock.issues:
+            self.send_not_found()
+            return
+
+        html = render_reader(mock, issue_id, all_pages=params.get("readType") == "1")
+        self.send_body(html.encode("utf-8"), "text/html; charset=utf-8")
+
+    def handle_image(self, issue_id: str, filename: str):
+        mock = self.mock
+        time.sleep(mock.image_latency)
+
+        page = filename.split(".")[0]
+        if (issue_id not in mock.issues or not page.isdigit()
+                or not 1 <= int(page) <= mock.served_pages(issue_id)):
+            self.send_not_found()
+            return
+
+        if mock.error_rate and random.random() < mock.error_rate:
+            with mock._lock:
+                mock.image_errors += 1
+            self.send_body(b"", "text/plain", status=503)
+            return
+
+        data = mock.image_bytes_for(issue_id, int(page))
+        self.send_body(data, "image/jpeg")
+
+        with mock._lock:
+            mock.image_requests += 1
+            mock.image_bytes += len(data)
+
+
+def create_server(mock: MockReader, host: str = DEFAULT_HOST,
+                  port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a server for a mock volume.
+
+    Pass port=0 to bind a free port; mock.base_url is set to the bound address.
+    """
+    handler = type("BoundMockHandler", (MockHandler,), {"mock": mock})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    mock.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+
+def start_server(mock: MockReader, host: str = DEFAULT_HOST,
+                 port: int = 0) -> ThreadingHTTPServer:
+    """Start a mock server on a background thread and return it."""
+    server = create_server(mock, host, port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    """Main execution flow."""
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the readcomiconline.li reader",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python comic_reader_mock_server.py
+
+  # Slow reader and image host, 2% failed page images
+  python comic_reader_mock_server.py --page-latency 0.5 --image-latency 0.2 --error-rate 0.02
+
+Point the scraper at it by setting COMIC_BASE_URL to http://127.0.0.1:<port>
+        """
+    )
+
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--volume", default=DEFAULT_VOLUME_NAME,
+                        help=f"Name of the generated volume (default: {DEFAULT_VOLUME_NAME})")
+    parser.add_argument("--issues", type=int, default=DEFAULT_ISSUE_COUNT,
+                        help=f"Issues in the volume (default: {DEFAULT_ISSUE_COUNT})")
+    parser.add_argument("--pages", type=int, default=DEFAULT_BASE_PAGES,
+                        help=f"Pages of issue 1 (default: {DEFAULT_BASE_PAGES})")
+    parser.add_argument("--page-latency", type=float, default=0.0, help="Seconds added to each reader page")
+    parser.add_argument("--image-latency", type=float, default=0.0, help="Seconds added to each page image")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of page images answered with HTTP 503")
+
+    args = parser.parse_args()
+
+    mock = MockReader(args.volume, args.issues, args.pages, args.page_latency,
+                      args.image_latency, args.error_rate)
+    server = create_server(mock, args.host, args.port)
+
+    print(f"Mock reader listening on {mock.base_url}")
+    for issue_id, issue in mock.issues.items():
+        extras = []
+        if issue["duplicate_last"]:
+            extras.append("duplicate last page")
+        if issue["indicator"]:
+            extras.append("page indicator")
+        print(f"  {mock.issue_url(issue_id)} ({issue['pages']} pages"
+              f"{', ' + ', '.join(extras) if extras else ''})")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {json.dumps(mock.stats())}")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
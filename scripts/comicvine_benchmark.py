@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Vine Downloader Benchmark
+
+Runs comicvine_download_covers.py end to end against the local mock server
+and reports covers/sec, API calls per volume and peak RSS.
+Usage: python comicvine_benchmark.py [--sizes 10 100 1000] [--workers 8]
+
+Each volume size runs in a fresh subprocess so peak RSS is measured per
+case; the mock server runs in the parent process.
+"""
+
+import sys
+import io
+import json
+import time
+import argparse
+import tempfile
+import resource
+import subprocess
+import contextlib
+from pathlib import Path
+
+from comicvine_mock_server import MockComicVine, start_server, volume_name_for, DEFAULT_VOLUME_SIZES
+
+
+# Configuration
+SCRIPT_DIR = Path(__file__).parent
+UNTHROTTLED_RATE = 10000.0  # Requests per second used when limits are disabled
+
+
+def run_case(args) -> dict:
+    """Sync one mock volume in this process and return its measurements."""
+    import comicvine_download_covers as downloader
+    from comicvine_cache import ResponseCache
+    from comicvine_ratelimit import TokenBucket, QuotaScheduler
+
+    work_dir = Path(args.work_dir)
+    downloader.API_BASE_URL = f"{args.base_url}/api"
+    downloader.OUTPUT_BASE_PATH = work_dir / "assets"
+
+    if args.throttled:
+        api_rate = 1.0 / downloader.REQUEST_DELAY
+        cdn_rate, cdn_burst = downloader.CDN_RATE, downloader.CDN_BURST
+    else:
+        api_rate = cdn_rate = UNTHROTTLED_RATE
+        cdn_burst = args.workers
+
+    session = downloader.create_session(args.workers)
+    api_limiter = QuotaScheduler(work_dir / "quota.sqlite3",
+                                 velocity=TokenBucket(rate=api_rate))
+    cdn_limiter = TokenBucket(rate=cdn_rate, capacity=cdn_burst)
+    cache = ResponseCache(work_dir / "cache.sqlite3")
+
+    def sync():
+        volume = downloader.search_volume(volume_name_for(args.case), "mock-key", session,
+                                          api_limiter, cache)
+        return downloader.sync_volume(volume, "mock-key", session, api_limiter, cdn_limiter,
+                                      cache, args.workers, args.stream)
+
+    # Cold run: everything is fetched
+    with contextlib.redirect_stdout(io.StringIO()):
+        cold = sync()
+    cold_api_calls = cache.live_requests
+
+    # Warm run: cached API responses and an up-to-date manifest
+    with contextlib.redirect_stdout(io.StringIO()):
+        warm = sync()
+
+    counts = cold["counts"]
+    return {
+        "issues": cold["total"],
+        "downloaded": counts[downloader.STATUS_OK],
+        "failed": counts[downloader.STATUS_FAIL],
+        "seconds": round(cold["elapsed"], 3),
+        "covers_per_sec": round(counts[downloader.STATUS_OK] / cold["elapsed"], 1) if cold["elapsed"] else 0.0,
+        "api_calls": cold_api_calls,
+        "resync_seconds": round(warm["elapsed"], 3),
+        "resync_api_calls": cache.live_requests - cold_api_calls,
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                             / (1024 * 1024 if sys.platform == "darwin" else 1024), 1),
+    }
+
+
+def run_benchmark(args) -> list[dict]:
+    """Start the mock server and run every case in its own subprocess."""
+    mock = MockComicVine(args.sizes, args.api_latency, args.image_latency, args.error_rate)
+    server = start_server(mock)
+    results = []
+
+    try:
+        for size in args.sizes:
+            with tempfile.TemporaryDirectory(prefix="cv_bench_") as work_dir:
+                command = [
+                    sys.executable, str(Path(__file__).resolve()),
+                    "--case", str(size),
+                    "--base-url", mock.base_url,
+                    "--work-dir", work_dir,
+                    "--workers", str(args.workers),
+                ]
+                if args.stream:
+                    command.append("--stream")
+                if args.throttled:
+                    command.append("--throttled")
+
+                print(f"Running {size} issues...", flush=True)
+                start_time = time.monotonic()
+                output = subprocess.run(command, capture_output=True, text=True, cwd=SCRIPT_DIR)
+                if output.returncode != 0:
+                    print(f"[FAIL] {size} issues: {output.stderr.strip()[-500:]}")
+                    continue
+
+                result = json.loads(output.stdout.strip().splitlines()[-1])
+                result["wall_seconds"] = round(time.monotonic() - start_time, 3)
+                results.append(result)
+    finally:
+        server.shutdown()
+
+    return results
+
+
+def main():
+    """Main execution flow."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark comicvine_download_covers.py against a local mock server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python comicvine_benchmark.py
+
+  # Streaming mode with 8 workers and a slow API
+  python comicvine_benchmark.py --workers 8 --stream --api-latency 0.2
+
+  # Use the real API and CDN limits instead of unthrottled limiters
+  python comicvine_benchmark.py --sizes 10 --throttled
+        """
+    )
+
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_VOLUME_SIZES,
+                        help="Issue counts to benchmark (default: 10 100 1000)")
+    parser.add_argument("--workers", type=int, default=8, help="Download workers (default: 8)")
+    parser.add_argument("--stream", action="store_true", help="Benchmark the streaming pipeline")
+    parser.add_argument("--throttled", action="store_true",
+                        help="Use the downloader's real REQUEST_DELAY and CDN limits")
+    parser.add_argument("--api-latency", type=float, default=0.05, help="Mock API latency in seconds")
+    parser.add_argument("--image-latency", type=float, default=0.01, help="Mock cover latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Mock HTTP 503 rate")
+    parser.add_argument("--json", metavar="FILE", help="Also write results to a JSON file")
+
+    # Internal: run a single case (used by the subprocesses)
+    parser.add_argument("--case", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--base-url", help=argparse.SUPPRESS)
+    parser.add_argument("--work-dir", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(args)))
+        return
+
+    results = run_benchmark(args)
+
+    # Print summary
+    print("\n" + "=" * 78)
+    print("Benchmark Summary")
+    print("=" * 78)
+    print(f"{'Issues':>7} {'Covers/s':>9} {'Seconds':>8} {'API calls':>10} "
+          f"{'Resync s':>9} {'Resync API':>11} {'Peak RSS MB':>12} {'Failed':>7}")
+    for r in results:
+        print(f"{r['issues']:>7} {r['covers_per_sec']:>9} {r['seconds']:>8} {r['api_calls']:>10} "
+              f"{r['resync_seconds']:>9} {r['resync_api_calls']:>11} {r['peak_rss_mb']:>12} "
+              f"{r['failed']:>7}")
+    print("=" * 78)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\nBenchmark cancelled by user.")
+        sys.exit(0)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Vine Response Cache
+
+SQLite-backed cache for Comic Vine API responses, shared by the scripts in
+this directory. Entries are keyed by endpoint plus normalized query params
+(with api_key removed) and expire after a per-resource TTL.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+# Configuration
+SCRIPT_DIR = Path(__file__).parent
+CACHE_PATH = SCRIPT_DIR / ".cache" / "comicvine.sqlite3"
+DEFAULT_TTL = 24 * 3600  # Seconds
+
+# Per-resource TTLs in seconds (resource is the first path segment of the endpoint)
+RESOURCE_TTLS = {
+    "volumes": 7 * 24 * 3600,  # Volume search results rarely change
+    "issues": 24 * 3600,  # New issues and cover updates appear daily at most
+    "issue": 30 * 24 * 3600,
+}
+
+# Params that never affect the response and must not leak into cache keys
+IGNORED_PARAMS = {"api_key"}
+
+
+def make_cache_key(endpoint: str, params: dict) -> str:
+    """
+    Build a stable cache key from an endpoint and its query params.
+
+    Params are sorted and stringified so equivalent requests share a key.
+    """
+    normalized = {
+        str(key): str(value)
+        for key, value in params.items()
+        if key not in IGNORED_PARAMS
+    }
+    return f"{endpoint.strip('/')}?{json.dumps(normalized, sort_keys=True)}"
+
+
+def resource_of(endpoint: str) -> str:
+    """Return the resource name of an endpoint (e.g. "issue/4000-1" -> "issue")."""
+    return endpoint.strip("/").split("/")[0]
+
+
+class ResponseCache:
+    """
+    Persistent cache of Comic Vine API responses with quota accounting.
+
+    Tracks how many lookups were served from cache and how many live API
+    requests were made during this run.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH, refresh: bool = False):
+        """
+        Args:
+            path: SQLite database file
+            refresh: Ignore cached entries (fresh responses are still stored)
+        """
+        self.path = Path(path)
+        self.refresh = refresh
+        self.hits = 0
+        self.live_requests = 0
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " resource TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " body TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, endpoint: str, params: dict) -> dict | None:
+        """Return a cached response if present and not expired, None otherwise."""
+        if self.refresh:
+            return None
+
+        resource = resource_of(endpoint)
+        ttl = RESOURCE_TTLS.get(resource, DEFAULT_TTL)
+        key = make_cache_key(endpoint, params)
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+            if not row or time.time() - row[0] > ttl:
+                return None
+
+            self.hits += 1
+
+        return json.loads(row[1])
+
+    def put(self, endpoint: str, params: dict, data: dict):
+        """Store a successful API response."""
+        key = make_cache_key(endpoint, params)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, resource, fetched_at, body)"
+                " VALUES (?, ?, ?, ?)",
+                (key, resource_of(endpoint), time.time(), json.dumps(data))
+            )
+            self._conn.commit()
+
+    def record_live_request(self):
+        """Count a request that actually went to the API."""
+        with self._lock:
+            self.live_requests += 1
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -4,19 +4,32 @@
 Comic Vine Cover Downloader
 
 Downloads all issue covers from a specified comic volume using the Comic Vine API.
-Usage: python comicvine_download_covers.py "Volume Name"
+Usage: python comicvine_download_covers.py "Volume Name" [--workers N]
+       python comicvine_download_covers.py --batch volumes.txt
 """
 
 import sys
 import os
 import re
+import json
 import time
+import hashlib
+import argparse
+import itertools
+import threading
 from pathlib import Path
+from datetime import datetime
+from typing import Iterator
 from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
     from dotenv import load_dotenv
+    from comicvine_cache import ResponseCache, resource_of
+    from comicvine_ratelimit import TokenBucket, QuotaScheduler, ApiLimiter, RATE_LIMIT_BACKOFF
+    from stage_metrics import StageMetrics, METRICS_DIR
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("Install with: pip install requests python-dotenv")
@@ -28,7 +41,28 @@ API_BASE_URL = "https://comicvine.gamespot.com/api"
 # Path is relative to project root (parent of scripts directory)
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_BASE_PATH = SCRIPT_DIR / "assets"
-REQUEST_DELAY = 1.0  # Seconds between API requests (respects 200/hour limit)
+REQUEST_DELAY = 1.0  # Minimum seconds between API requests (velocity guard)
+MAX_RATE_LIMIT_RETRIES = 3  # Retries of one API request after rate-limit responses
+RATE_LIMIT_STATUS_CODE = 107  # Comic Vine status_code for "Rate limit exceeded"
+CDN_RATE = 4.0  # Cover image requests per second (image CDN, not the API)
+CDN_BURST = 4  # Cover image requests allowed back-to-back before throttling
+DEFAULT_WORKERS = 1  # Concurrent cover downloads and issue page requests
+DEFAULT_VOLUME_WORKERS = 2  # Volumes synced concurrently in batch mode
+ISSUES_PAGE_LIMIT = 100  # Maximum results per page allowed by the API
+ISSUE_PAGE_RETRIES = 1  # Extra attempts for an issue listing page that failed
+MANIFEST_FILENAME = "manifest.json"  # Per-volume covers manifest (inside covers/)
+DETAILS_FILENAME = "details.json"  # Per-volume issue details (inside covers/)
+DEFAULT_ENRICH_FIELDS = "id,issue_number,name,cover_date,description,character_credits,story_arc_credits"
+PART_SUFFIX = ".part"  # In-progress downloads, renamed into place when complete
+PART_META_SUFFIX = ".json"  # Source URL and validators of a .part file (<name>.part.json)
+
+# Download results
+STATUS_OK = "ok"
+STATUS_SKIP = "skip"
+STATUS_FAIL = "fail"
+
+# Per-stage timings for this run (written to METRICS_DIR at the end)
+metrics = StageMetrics("comicvine_covers")
 
 # HTTP Headers required by Comic Vine API
 HEADERS = {
@@ -36,6 +70,18 @@ HEADERS = {
 }
 
 
+def create_session(workers: int = DEFAULT_WORKERS) -> requests.Session:
+    """Create a requests session whose connection pool fits all download workers."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(10, workers))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
 def load_api_key():
     """Load Comic Vine API key from .env file."""
     env_path = Path(__file__).parent / ".env"
@@ -80,7 +126,95 @@ def sanitize_filename(name: str) -> str:
     return name
 
 
-def search_volume(volume_name: str, api_key: str, session: requests.Session) -> dict | None:
+def is_rate_limited(response: requests.Response) -> bool:
+    """
+    Check whether a Comic Vine response signals a rate limit.
+
+    Comic Vine answers with HTTP 420 (or 429), or with status_code 107 /
+    a "rate limit" error in the JSON payload.
+    """
+    if response.status_code in (420, 429):
+        return True
+
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+
+    if not isinstance(data, dict):
+        return False
+
+    return (data.get("status_code") == RATE_LIMIT_STATUS_CODE
+            or "rate limit" in str(data.get("error", "")).lower())
+
+
+def api_get(endpoint: str, params: dict, session: requests.Session,
+            limiter: ApiLimiter | None = None, cache: ResponseCache | None = None) -> dict:
+    """
+    Perform a GET request against the Comic Vine API.
+
+    Cached responses are returned without touching the network or the
+    limiter. Successful live responses are stored in the cache. Rate-limit
+    responses pause the limiter until capacity frees up and the request
+    is retried, up to MAX_RATE_LIMIT_RETRIES times.
+
+    Args:
+        endpoint: API endpoint relative to API_BASE_URL (e.g. "issues")
+        params: Query parameters, including api_key
+        session: Requests session for connection pooling
+        limiter: Optional API rate limiter (TokenBucket or QuotaScheduler)
+        cache: Optional response cache
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        requests.RequestException: On network or HTTP errors
+    """
+    if cache:
+        cached = cache.get(endpoint, params)
+        if cached is not None:
+            metrics.count("api_cache_hits")
+            return cached
+
+    resource = resource_of(endpoint)
+
+    for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+        if limiter:
+            with metrics.span("api_wait"):
+                limiter.acquire(resource)
+        with metrics.span("api") as span:
+            response = session.get(f"{API_BASE_URL}/{endpoint}", params=params)
+            span.bytes = len(response.content)
+        if cache:
+            cache.record_live_request()
+
+        if not is_rate_limited(response) or attempt == MAX_RATE_LIMIT_RETRIES:
+            break
+
+        # Pause until capacity frees up, then retry the same request
+        metrics.count("api_rate_limited")
+        retry_after = response.headers.get("Retry-After", "")
+        retry_after = float(retry_after) if retry_after.isdigit() else None
+        if limiter:
+            wait = limiter.rate_limited(resource, retry_after)
+        else:
+            wait = retry_after or RATE_LIMIT_BACKOFF
+            time.sleep(wait)
+        print(f"[WAIT] Rate limited on /{resource}; retrying in {wait:.0f}s")
+
+    response.raise_for_status()
+    data = response.json()
+
+    if cache and data.get("status_code") == 1:
+        cache.put(endpoint, params, data)
+
+    return data
+
+
+def search_volume(volume_name: str, api_key: str, session: requests.Session,
+                  limiter: ApiLimiter | None = None,
+                  cache: ResponseCache | None = None) -> dict | None:
     """
     Search for a comic volume by name using the Comic Vine API.
 
@@ -88,6 +222,8 @@ def search_volume(volume_name: str, api_key: str, session: requests.Session) ->
         volume_name: Name of the volume to search for
         api_key: Comic Vine API key
         session: Requests session for connection pooling
+        limiter: Optional rate limiter for API requests
+        cache: Optional response cache
 
     Returns:
         Volume dictionary if found, None otherwise
@@ -102,9 +238,7 @@ def search_volume(volume_name: str, api_key: str, session: requests.Session) ->
     }
 
     try:
-        response = session.get(f"{API_BASE_URL}/volumes", params=params)
-        response.raise_for_status()
-        data = response.json()
+        data = api_get("volumes", params, session, limiter, cache)
 
         if data.get("status_code") != 1:
             print(f"API Error: {data.get('error', 'Unknown error')}")
@@ -138,81 +272,430 @@ def search_volume(volume_name: str, api_key: str, session: requests.Session) ->
         return None
 
 
-def get_volume_issues(volume_id: int, api_key: str, session: requests.Session) -> list[dict]:
+def fetch_issues_page(volume_id: int, offset: int, api_key: str, session: requests.Session,
+                      limiter: ApiLimiter | None = None,
+                      cache: ResponseCache | None = None) -> dict | None:
+    """
+    Fetch one page of a volume's issues.
+
+    Returns:
+        API response dictionary, or None on error
+    """
+    params = {
+        "filter": f"volume:{volume_id}",
+        "field_list": "id,issue_number,name,image,cover_date",
+        "format": "json",
+        "limit": ISSUES_PAGE_LIMIT,
+        "offset": offset,
+        "api_key": api_key
+    }
+
+    try:
+        data = api_get("issues", params, session, limiter, cache)
+    except requests.RequestException as e:
+        print(f"Error fetching issues (offset {offset}): {e}")
+        return None
+
+    if data.get("status_code") != 1:
+        print(f"API Error: {data.get('error', 'Unknown error')}")
+        return None
+
+    return data
+
+
+def plan_issue_offsets(first_page: dict) -> list[int]:
+    """
+    Plan the remaining page offsets from the first page of an issue listing.
+
+    Uses number_of_total_results so every page after the first can be
+    requested up front instead of discovered one at a time.
+    """
+    results = first_page.get("results", [])
+    total = first_page.get("number_of_total_results")
+
+    if total is None:
+        # Without a total we can only tell that more pages may exist
+        total = len(results) + (ISSUES_PAGE_LIMIT if len(results) >= ISSUES_PAGE_LIMIT else 0)
+
+    return list(range(ISSUES_PAGE_LIMIT, int(total), ISSUES_PAGE_LIMIT))
+
+
+def sort_issues(issues: list[dict]):
+    """Sort issues in place by numeric issue_number, keeping order if non-numeric."""
+    try:
+        issues.sort(key=lambda x: float(x.get("issue_number", 0)))
+    except (ValueError, TypeError):
+        # If issue_number is not numeric, keep original order
+        pass
+
+
+def iter_issue_pages(volume_id: int, api_key: str, session: requests.Session,
+                     limiter: ApiLimiter | None = None,
+                     cache: ResponseCache | None = None,
+                     workers: int = DEFAULT_WORKERS,
+                     missing: list[int] | None = None) -> Iterator[tuple[int, dict]]:
+    """
+    Yield each page of a volume's issue listing as soon as it arrives.
+
+    The first page is always yielded first; its number_of_total_results
+    determines the remaining offsets. With a limiter and more than one
+    worker, up to `workers` pages are in flight at once and are yielded in
+    completion order, so consumers can start on early pages while later
+    ones are still being fetched. Without a limiter, pages are fetched
+    sequentially with REQUEST_DELAY sleeps in between.
+
+    In both modes a page that fails does not end the listing: the other
+    pages are fetched first, then failed pages are requested again one at
+    a time, up to ISSUE_PAGE_RETRIES more times. Offsets that still fail
+    are appended to `missing`, so callers can tell a partly listed volume
+    from a short one.
+
+    Yields:
+        (offset, response) tuples
+    """
+    def fetch(offset):
+        return fetch_issues_page(volume_id, offset, api_key, session, limiter, cache)
+
+    first_page = fetch(0)
+    for _ in range(ISSUE_PAGE_RETRIES):
+        if first_page:
+            break
+        time.sleep(REQUEST_DELAY)
+        first_page = fetch(0)
+
+    if not first_page:
+        if missing is not None:
+            missing.append(0)
+        return
+
+    yield 0, first_page
+
+    offsets = plan_issue_offsets(first_page)
+    if not offsets:
+        return
+
+    print(f"Fetching {len(offsets)} more pages "
+          f"({first_page.get('number_of_total_results', 'unknown')} issues)...")
+
+    failed = []
+
+    if not limiter or workers <= 1:
+        for offset in offsets:
+            if not limiter:
+                time.sleep(REQUEST_DELAY)
+
+            data = fetch(offset)
+            if data:
+                yield offset, data
+            else:
+                failed.append(offset)
+    else:
+        remaining = iter(offsets)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Keep at most `workers` pages in flight so memory stays bounded
+            pending = {executor.submit(fetch, offset): offset
+                       for offset in itertools.islice(remaining, workers)}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    offset = pending.pop(future)
+                    next_offset = next(remaining, None)
+                    if next_offset is not None:
+                        pending[executor.submit(fetch, next_offset)] = next_offset
+
+                    data = future.result()
+                    if data:
+                        yield offset, data
+                    else:
+                        failed.append(offset)
+
+    # Retry failed pages one at a time once the rest of the listing is in
+    for _ in range(ISSUE_PAGE_RETRIES):
+        if not failed:
+            break
+
+        print(f"[RETRY] Fetching {len(failed)} failed issue page(s) again...")
+        retrying, failed = sorted(failed), []
+        for offset in retrying:
+            time.sleep(REQUEST_DELAY)
+            data = fetch(offset)
+            if data:
+                yield offset, data
+            else:
+                failed.append(offset)
+
+    if failed and missing is not None:
+        missing.extend(sorted(failed))
+
+
+def get_volume_issues(volume_id: int, api_key: str, session: requests.Session,
+                      limiter: ApiLimiter | None = None,
+                      cache: ResponseCache | None = None,
+                      workers: int = DEFAULT_WORKERS,
+                      missing: list[int] | None = None) -> list[dict]:
     """
     Retrieve all issues for a given volume using pagination.
 
+    Pages are fetched by iter_issue_pages (concurrently when a limiter and
+    more than one worker are given) and merged in offset order.
+
     Args:
         volume_id: Comic Vine volume ID
         api_key: Comic Vine API key
         session: Requests session for connection pooling
+        limiter: Optional rate limiter for API requests (falls back to
+            REQUEST_DELAY sleeps between pages when not given)
+        cache: Optional response cache
+        workers: Maximum concurrent page requests
+        missing: Optional list that receives the offsets of listing pages
+            that could not be fetched
 
     Returns:
         List of issue dictionaries sorted by issue_number
     """
-    issues = []
-    offset = 0
-    limit = 100
-
     print(f"Fetching issues for volume ID: {volume_id}")
 
-    while True:
-        params = {
-            "filter": f"volume:{volume_id}",
-            "field_list": "id,issue_number,name,image,cover_date",
-            "format": "json",
-            "limit": limit,
-            "offset": offset,
-            "api_key": api_key
-        }
+    pages = {}
+    for offset, data in iter_issue_pages(volume_id, api_key, session, limiter, cache,
+                                         workers, missing):
+        pages[offset] = data.get("results", [])
+        if offset:
+            print(f"Fetched {sum(len(p) for p in pages.values())} issues so far...")
 
-        try:
-            response = session.get(f"{API_BASE_URL}/issues", params=params)
-            response.raise_for_status()
-            data = response.json()
+    # Merge pages in offset order, then sort by issue_number
+    issues = [issue for offset in sorted(pages) for issue in pages[offset]]
+    sort_issues(issues)
 
-            if data.get("status_code") != 1:
-                print(f"API Error: {data.get('error', 'Unknown error')}")
-                break
+    return issues
 
-            page_results = data.get("results", [])
-            issues.extend(page_results)
 
-            # Check if we've fetched all issues
-            if len(page_results) < limit:
-                break
+class CoverManifest:
+    """
+    Per-volume record of downloaded covers, keyed by Comic Vine issue id.
 
-            offset += limit
-            print(f"Fetched {len(issues)} issues so far...")
-            time.sleep(REQUEST_DELAY)
+    Each entry stores filename, size, MD5 hash, source URL and cover_date,
+    so sync decisions are made from the manifest instead of rebuilding
+    filenames and stat-ing every file. The covers directory is listed once
+    on load to notice files removed by hand.
+    """
 
-        except requests.RequestException as e:
-            print(f"Error fetching issues: {e}")
-            break
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = {}
+        self.files = set()
+        self._lock = threading.Lock()
+
+        if path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.entries = json.load(f).get("issues", {})
+            except (IOError, OSError, ValueError) as e:
+                print(f"[WARN] Ignoring unreadable manifest {path}: {e}")
+
+        if path.parent.is_dir():
+            self.files = set(os.listdir(path.parent))
+
+    def get(self, issue_id) -> dict | None:
+        """Return the entry for an issue if its file is still present."""
+        with self._lock:
+            entry = self.entries.get(str(issue_id))
+            if entry and entry.get("filename") in self.files:
+                return entry
+            return None
+
+    def record(self, issue_id, entry: dict, previous_filename: str | None = None):
+        """Store an entry, replacing any file name it previously used."""
+        with self._lock:
+            self.entries[str(issue_id)] = entry
+            if previous_filename:
+                self.files.discard(previous_filename)
+            self.files.add(entry["filename"])
+
+    def save(self):
+        """Write the manifest atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+
+        with self._lock:
+            data = {"issues": self.entries, "updated_at": datetime.now().isoformat()}
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        os.replace(tmp_path, self.path)
+
+
+def build_manifest_entry(issue: dict, filename: str, cover_url: str,
+                         size: int, file_hash: str) -> dict:
+    """Build a manifest entry for a stored cover."""
+    return {
+        "issue_number": issue.get("issue_number"),
+        "filename": filename,
+        "size": size,
+        "hash": file_hash,
+        "source_url": cover_url,
+        "cover_date": issue.get("cover_date"),
+    }
+
+
+def hash_file(path: Path) -> tuple[int, str]:
+    """Return (size, MD5 hex digest) of a file."""
+    digest = hashlib.md5()
+    size = 0
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return size, digest.hexdigest()
+
+
+def expected_download_size(response: requests.Response) -> int | None:
+    """
+    Return the full size of the resource being downloaded, if known.
+
+    Uses the total from Content-Range for partial responses and
+    Content-Length otherwise. Encoded (e.g. gzip) bodies are not checked
+    because their decoded size differs from the header.
+    """
+    if response.headers.get("Content-Encoding", "identity") != "identity":
+        return None
+
+    if response.status_code == 206:
+        match = re.search(r"/(\d+)$", response.headers.get("Content-Range", ""))
+        return int(match.group(1)) if match else None
 
-    # Sort by issue_number
+    length = response.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def load_part_meta(meta_path: Path) -> dict | None:
+    """Return the source URL and validators recorded for a .part file, if any."""
     try:
-        issues.sort(key=lambda x: float(x.get("issue_number", 0)))
-    except (ValueError, TypeError):
-        # If issue_number is not numeric, keep original order
-        pass
+        with open(meta_path, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    return meta if isinstance(meta, dict) else None
 
-    return issues
 
+def save_part_meta(meta_path: Path, url: str, response: requests.Response):
+    """Record which resource (and which version of it) a .part file holds."""
+    meta = {
+        "url": url,
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+
+def content_range_start(response: requests.Response) -> int | None:
+    """Return the first byte offset of a 206 response's Content-Range."""
+    match = re.match(r"bytes\s+(\d+)-", response.headers.get("Content-Range", ""))
+    return int(match.group(1)) if match else None
+
+
+def download_to_part(url: str, part_path: Path, session: requests.Session) -> tuple[int, str]:
+    """
+    Download a URL into a .part file, resuming a previous partial download.
+
+    Each .part file has a <name>.part.json sidecar with the URL it was
+    downloaded from and the response's ETag / Last-Modified. A .part file
+    is only continued when it came from the same URL; the Range request
+    carries If-Range with the recorded validator, so a changed resource
+    is sent in full (200) instead of being spliced onto old bytes. A .part
+    file from another URL, without a sidecar, rejected with 416, or
+    answered with a Content-Range that does not start where it ends is
+    discarded and the file is fetched again. The final size is verified
+    against Content-Length / Content-Range.
+
+    Returns:
+        (size, MD5 hex digest) of the complete file
 
-def download_cover(issue: dict, output_dir: Path, session: requests.Session) -> bool:
+    Raises:
+        requests.RequestException: On network or HTTP errors
+        IOError: If the download ends short of the expected size (the
+            .part file is kept so the next run can resume it)
+    """
+    meta_path = part_path.with_name(part_path.name + PART_META_SUFFIX)
+    resume_from = part_path.stat().st_size if part_path.exists() else 0
+    headers = {}
+
+    if resume_from:
+        meta = load_part_meta(meta_path)
+        if meta and meta.get("url") == url:
+            headers["Range"] = f"bytes={resume_from}-"
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+        else:
+            # Partial bytes of another (or an unknown) resource
+            part_path.unlink(missing_ok=True)
+            resume_from = 0
+
+    response = session.get(url, stream=True, headers=headers)
+    if response.status_code == 416 or (response.status_code == 206
+                                       and content_range_start(response) != resume_from):
+        response.close()
+        part_path.unlink(missing_ok=True)
+        resume_from = 0
+        response = session.get(url, stream=True)
+    response.raise_for_status()
+
+    if response.status_code != 206:
+        save_part_meta(meta_path, url, response)
+
+    expected_size = expected_download_size(response)
+    digest = hashlib.md5()
+
+    if response.status_code == 206:
+        # Hash the bytes we already have, then append the rest
+        with open(part_path, "rb") as f:
+            for chunk in iter(lambda: f.read(65536), b""):
+                digest.update(chunk)
+        mode = "ab"
+        size = resume_from
+    else:
+        mode = "wb"
+        size = 0
+
+    with open(part_path, mode) as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+            digest.update(chunk)
+            size += len(chunk)
+
+    if expected_size is not None and size != expected_size:
+        raise IOError(f"incomplete download ({size} of {expected_size} bytes)")
+
+    meta_path.unlink(missing_ok=True)
+    return size, digest.hexdigest()
+
+
+def download_cover(issue: dict, output_dir: Path, session: requests.Session,
+                   limiter: TokenBucket | None = None, progress: str = "",
+                   manifest: CoverManifest | None = None) -> str:
     """
     Download a single issue cover image.
 
+    With a manifest, an issue is only fetched when it is new or its
+    image.super_url changed. Covers whose issue name changed are renamed
+    locally instead of being downloaded again.
+
     Args:
         issue: Issue dictionary from Comic Vine API
         output_dir: Directory to save the cover image
         session: Requests session for connection pooling
+        limiter: Optional rate limiter for image CDN requests. Only consulted
+            when a request is actually made, so skips cost no budget.
+        progress: Prefix for the status line (e.g. "[3/20] ")
+        manifest: Optional covers manifest for incremental sync
 
     Returns:
-        True if download successful, False otherwise
+        STATUS_OK, STATUS_SKIP or STATUS_FAIL
     """
     # Extract issue data
+    issue_id = issue.get("id")
     issue_number = issue.get("issue_number", "Unknown")
     issue_name = issue.get("name") or "Unnamed"
 
@@ -221,8 +704,8 @@ def download_cover(issue: dict, output_dir: Path, session: requests.Session) ->
     cover_url = image_data.get("super_url")
 
     if not cover_url:
-        print(f"[FAIL] Issue {issue_number}: No cover image available")
-        return False
+        print(f"{progress}[FAIL] Issue {issue_number}: No cover image available")
+        return STATUS_FAIL
 
     # Sanitize issue name for filename
     sanitized_name = sanitize_filename(issue_name)
@@ -235,109 +718,680 @@ def download_cover(issue: dict, output_dir: Path, session: requests.Session) ->
     filename = f"{issue_number}-{sanitized_name}{ext}"
     output_path = output_dir / filename
 
-    # Skip if file already exists
-    if output_path.exists():
-        print(f"[SKIP] Issue {issue_number}: Already downloaded")
-        return True
+    entry = manifest.get(issue_id) if manifest and issue_id is not None else None
+
+    # Cover unchanged: skip, renaming locally if the issue name changed
+    if entry and entry.get("source_url") == cover_url:
+        if entry["filename"] == filename:
+            print(f"{progress}[SKIP] Issue {issue_number}: Already downloaded")
+            return STATUS_SKIP
+
+        try:
+            (output_dir / entry["filename"]).rename(output_path)
+        except (IOError, OSError) as e:
+            print(f"{progress}[FAIL] Issue {issue_number}: Rename failed - {e}")
+            return STATUS_FAIL
+
+        manifest.record(issue_id, {**entry, "filename": filename}, entry["filename"])
+        print(f"{progress}[SKIP] Issue {issue_number}: Renamed from {entry['filename']}")
+        return STATUS_SKIP
+
+    # Skip if file already exists (adopting it into the manifest)
+    already_exists = (filename in manifest.files) if manifest else output_path.exists()
+    if not entry and already_exists:
+        if manifest and issue_id is not None:
+            try:
+                size, file_hash = hash_file(output_path)
+            except (IOError, OSError) as e:
+                print(f"{progress}[FAIL] Issue {issue_number}: Reading existing file failed - {e}")
+                return STATUS_FAIL
+            manifest.record(issue_id, build_manifest_entry(issue, filename, cover_url,
+                                                           size, file_hash))
+        print(f"{progress}[SKIP] Issue {issue_number}: Already downloaded")
+        return STATUS_SKIP
 
     # Download image
     try:
-        response = session.get(cover_url, stream=True)
-        response.raise_for_status()
+        if limiter:
+            with metrics.span("cdn_wait") as wait_span:
+                limiter.acquire()
 
         # Create parent directories if they don't exist
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Save file
-        with open(output_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-
-        print(f"[OK] Issue {issue_number}: Downloaded")
-        return True
+        part_path = output_path.with_name(output_path.name + PART_SUFFIX)
+        with metrics.span("download") as download_span:
+            size, file_hash = download_to_part(cover_url, part_path, session)
+            download_span.bytes = size
+
+        # Commit the completed file
+        os.replace(part_path, output_path)
+
+        if manifest and issue_id is not None:
+            previous_filename = entry["filename"] if entry else None
+            if previous_filename and previous_filename != filename:
+                # Cover changed under a new name: drop the outdated file
+                (output_dir / previous_filename).unlink(missing_ok=True)
+            manifest.record(issue_id, build_manifest_entry(issue, filename, cover_url,
+                                                           size, file_hash),
+                            previous_filename)
+
+        print(f"{progress}[OK] Issue {issue_number}: Downloaded")
+        metrics.page_line(f"{progress}Issue {issue_number}: {size / 1000:.0f} KB, "
+                          f"wait {wait_span.seconds if limiter else 0.0:.2f}s, "
+                          f"download {download_span.seconds:.2f}s")
+        return STATUS_OK
 
     except requests.RequestException as e:
-        print(f"[FAIL] Issue {issue_number}: Download failed - {e}")
-        return False
+        print(f"{progress}[FAIL] Issue {issue_number}: Download failed - {e}")
+        return STATUS_FAIL
     except (IOError, OSError) as e:
-        print(f"[FAIL] Issue {issue_number}: File save failed - {e}")
-        return False
+        print(f"{progress}[FAIL] Issue {issue_number}: File save failed - {e}")
+        return STATUS_FAIL
 
 
-def main():
-    """Main execution flow."""
-    # Parse command-line arguments
-    if len(sys.argv) < 2:
-        print("Usage: python comicvine_download_covers.py <volume_name>")
-        print("Example: python comicvine_download_covers.py \"Absolute Batman\"")
-        sys.exit(1)
+def download_covers(issues: list[dict], output_dir: Path, session: requests.Session,
+                    limiter: TokenBucket, workers: int = DEFAULT_WORKERS,
+                    manifest: CoverManifest | None = None, label: str = "") -> dict:
+    """
+    Download covers for a list of issues, optionally with a worker pool.
 
-    if sys.argv[1] in ["--help", "-h"]:
-        print("Comic Vine Cover Downloader")
-        print("\nUsage:")
-        print("  python comicvine_download_covers.py <volume_name>")
-        print("\nExample:")
-        print("  python comicvine_download_covers.py \"Absolute Batman\"")
-        print("\nDescription:")
-        print("  Downloads all issue covers for a given comic volume from Comic Vine.")
-        print("  Covers are saved to scripts/assets/<Volume_Name>/covers/")
-        sys.exit(0)
+    All workers share the session's connection pool and the CDN limiter.
+    `label` prefixes every progress line (used to tell volumes apart in
+    batch mode).
 
-    volume_name = sys.argv[1]
+    Returns:
+        Dictionary mapping each status to its count
+    """
+    counts = {STATUS_OK: 0, STATUS_SKIP: 0, STATUS_FAIL: 0}
+    total = len(issues)
+
+    def task(item):
+        i, issue = item
+        status = download_cover(issue, output_dir, session, limiter,
+                                progress=f"{label}[{i}/{total}] ", manifest=manifest)
+        metrics.count(f"covers_{status}")
+        return status
+
+    if workers <= 1:
+        for status in map(task, enumerate(issues, 1)):
+            counts[status] += 1
+        return counts
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for status in executor.map(task, enumerate(issues, 1)):
+            counts[status] += 1
+
+    return counts
+
+
+def stream_volume_covers(volume_id: int, api_key: str, output_dir: Path,
+                         session: requests.Session, api_limiter: ApiLimiter,
+                         cdn_limiter: TokenBucket, cache: ResponseCache | None = None,
+                         workers: int = DEFAULT_WORKERS,
+                         manifest: CoverManifest | None = None,
+                         label: str = "",
+                         missing: list[int] | None = None) -> tuple[dict, list[dict]]:
+    """
+    Download covers while the issue listing is still being paginated.
 
-    # Load API key
-    api_key = load_api_key()
+    Each page's issues are handed to the download pool as soon as the page
+    arrives. In-flight downloads are capped, which applies backpressure to
+    pagination and keeps memory bounded for very large volumes. Offsets of
+    listing pages that could not be fetched are appended to `missing`.
 
-    # Create requests session for connection pooling
-    session = requests.Session()
-    session.headers.update(HEADERS)
+    Returns:
+        (counts, failed) tuple where counts maps each status to its count and
+        failed lists the issues that could not be downloaded, sorted by
+        issue_number
+    """
+    counts = {STATUS_OK: 0, STATUS_SKIP: 0, STATUS_FAIL: 0}
+    failed = []
+    max_in_flight = max(1, workers) * 2
+
+    def collect(futures):
+        for future in futures:
+            issue = in_flight.pop(future)
+            status = future.result()
+            counts[status] += 1
+            metrics.count(f"covers_{status}")
+            if status == STATUS_FAIL:
+                failed.append(issue)
+
+    in_flight = {}
+    submitted = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pages = iter_issue_pages(volume_id, api_key, session, api_limiter, cache,
+                                 workers, missing)
+        for offset, data in pages:
+            total = data.get("number_of_total_results", "?")
+
+            for issue in data.get("results", []):
+                if len(in_flight) >= max_in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+
+                submitted += 1
+                future = executor.submit(download_cover, issue, output_dir, session,
+                                         cdn_limiter, f"{label}[{submitted}/{total}] ", manifest)
+                in_flight[future] = {
+                    "id": issue.get("id"),
+                    "issue_number": issue.get("issue_number"),
+                    "name": issue.get("name"),
+                }
+
+        collect(list(in_flight))
+
+    sort_issues(failed)
+    return counts, failed
+
+
+def fetch_volumes_by_id(volume_ids: list[int], api_key: str, session: requests.Session,
+                        limiter: ApiLimiter | None = None,
+                        cache: ResponseCache | None = None) -> dict[int, dict]:
+    """
+    Look up volumes by id, up to ISSUES_PAGE_LIMIT ids per /volumes request.
+
+    Returns:
+        Dictionary mapping volume id to volume dictionary
+    """
+    volumes = {}
+    unique_ids = sorted(set(volume_ids))
+
+    for i in range(0, len(unique_ids), ISSUES_PAGE_LIMIT):
+        chunk = unique_ids[i:i + ISSUES_PAGE_LIMIT]
+        params = {
+            "filter": "id:" + "|".join(str(volume_id) for volume_id in chunk),
+            "field_list": "id,name,publisher,start_year,count_of_issues",
+            "format": "json",
+            "limit": ISSUES_PAGE_LIMIT,
+            "api_key": api_key
+        }
+
+        try:
+            data = api_get("volumes", params, session, limiter, cache)
+        except requests.RequestException as e:
+            print(f"Error looking up volumes by id: {e}")
+            continue
+
+        if data.get("status_code") != 1:
+            print(f"API Error: {data.get('error', 'Unknown error')}")
+            continue
+
+        for volume in data.get("results", []):
+            volumes[volume["id"]] = volume
+
+    return volumes
+
+
+def read_batch_file(path: Path) -> list[str]:
+    """
+    Read a batch manifest: one volume name or Comic Vine id per line.
+
+    Blank lines and lines starting with '#' are ignored. Ids need the
+    volume prefix ("4050-796") or "id:" ("id:796"); any other line,
+    including a bare number such as "1602", is a volume name.
+    """
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(line)
+    return entries
+
+
+def resolve_volumes(entries: list[str], api_key: str, session: requests.Session,
+                    limiter: ApiLimiter | None = None,
+                    cache: ResponseCache | None = None) -> list[dict]:
+    """
+    Resolve batch entries to volume dictionaries, in manifest order.
+
+    All ids are resolved with batched /volumes?filter=id:a|b|c requests;
+    names need one search each, deduplicated case-insensitively (and
+    served from the response cache on later runs).
+    """
+    # Bare numbers are names (e.g. "1602"); ids must be marked as such
+    id_pattern = re.compile(r"^(?:4050-|id:)(\d+)$")
+
+    volume_ids = [int(m.group(1)) for m in map(id_pattern.match, entries) if m]
+    by_id = fetch_volumes_by_id(volume_ids, api_key, session, limiter, cache) if volume_ids else {}
+
+    by_name = {}
+    volumes = []
+    seen = set()
+
+    for entry in entries:
+        match = id_pattern.match(entry)
+        if match:
+            volume = by_id.get(int(match.group(1)))
+            if not volume:
+                print(f"[FAIL] No volume found with id: {match.group(1)}")
+        else:
+            key = entry.lower()
+            if key not in by_name:
+                by_name[key] = search_volume(entry, api_key, session, limiter, cache)
+            volume = by_name[key]
+
+        if volume and volume["id"] not in seen:
+            seen.add(volume["id"])
+            volumes.append(volume)
+
+    return volumes
 
-    # Search for volume
-    volume = search_volume(volume_name, api_key, session)
-    if not volume:
-        sys.exit(1)
 
+def fetch_issue_details(issue_ids: list[int], fields: str, api_key: str,
+                        session: requests.Session, limiter: ApiLimiter | None = None,
+                        cache: ResponseCache | None = None,
+                        workers: int = DEFAULT_WORKERS) -> dict[int, dict]:
+    """
+    Fetch issue details in batches with /issues?filter=id:a|b|c.
+
+    Up to ISSUES_PAGE_LIMIT issues are requested per call instead of one
+    /issue/4000-<id> call each. Batches run concurrently when a limiter
+    and more than one worker are given.
+
+    Returns:
+        Dictionary mapping issue id to its detail fields
+    """
+    unique_ids = sorted(set(issue_ids))
+    chunks = [unique_ids[i:i + ISSUES_PAGE_LIMIT]
+              for i in range(0, len(unique_ids), ISSUES_PAGE_LIMIT)]
+    field_list = ",".join(dict.fromkeys(["id"] + fields.split(",")))
+
+    def fetch(chunk):
+        params = {
+            "filter": "id:" + "|".join(str(issue_id) for issue_id in chunk),
+            "field_list": field_list,
+            "format": "json",
+            "limit": ISSUES_PAGE_LIMIT,
+            "api_key": api_key
+        }
+
+        try:
+            data = api_get("issues", params, session, limiter, cache)
+        except requests.RequestException as e:
+            print(f"Error fetching issue details: {e}")
+            return []
+
+        if data.get("status_code") != 1:
+            print(f"API Error: {data.get('error', 'Unknown error')}")
+            return []
+
+        return data.get("results", [])
+
+    if limiter and workers > 1 and len(chunks) > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+            pages = list(executor.map(fetch, chunks))
+    else:
+        pages = [fetch(chunk) for chunk in chunks]
+
+    return {issue["id"]: issue for page in pages for issue in page}
+
+
+def enrich_volume(output_dir: Path, issue_ids: list[int], fields: str, api_key: str,
+                  session: requests.Session, limiter: ApiLimiter | None = None,
+                  cache: ResponseCache | None = None, workers: int = DEFAULT_WORKERS,
+                  label: str = "") -> int:
+    """
+    Store issue details for a volume in covers/details.json.
+
+    Only issues missing from the file are fetched; changing the field list
+    refetches everything. The file is keyed by issue id, like the covers
+    manifest, so the layout stage can join the two without API calls.
+
+    Returns:
+        Number of issues fetched from the API (or its cache)
+    """
+    details_path = output_dir / DETAILS_FILENAME
+    details = {}
+
+    if details_path.exists():
+        try:
+            with open(details_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            if stored.get("fields") == fields:
+                details = stored.get("issues", {})
+        except (IOError, OSError, ValueError) as e:
+            print(f"{label}[WARN] Ignoring unreadable details file {details_path}: {e}")
+
+    missing = [issue_id for issue_id in issue_ids if str(issue_id) not in details]
+    if not missing:
+        print(f"{label}[SKIP] Issue details up to date")
+        return 0
+
+    print(f"{label}Fetching details for {len(missing)} issues...")
+    fetched = fetch_issue_details(missing, fields, api_key, session, limiter, cache, workers)
+    for issue_id, issue in fetched.items():
+        details[str(issue_id)] = issue
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    tmp_path = details_path.with_name(details_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"fields": fields, "issues": details, "updated_at": datetime.now().isoformat()},
+                  f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, details_path)
+
+    print(f"{label}[OK] Stored details for {len(fetched)} issues")
+    return len(fetched)
+
+
+def sync_volume(volume: dict, api_key: str, session: requests.Session,
+                api_limiter: ApiLimiter, cdn_limiter: TokenBucket,
+                cache: ResponseCache | None = None, workers: int = DEFAULT_WORKERS,
+                stream: bool = False, label: str = "", enrich_fields: str | None = None) -> dict:
+    """
+    Download all covers of one volume.
+
+    With `enrich_fields`, issue details are also stored in
+    covers/details.json (see enrich_volume).
+
+    Returns:
+        Result dictionary with the volume name, output directory, issue
+        total, status counts, failed issues, offsets of issue listing
+        pages that could not be fetched and elapsed seconds
+    """
     # Create output directory
     sanitized_volume_name = sanitize_filename(volume["name"])
     output_dir = OUTPUT_BASE_PATH / sanitized_volume_name / "covers"
 
-    # Get all issues
-    issues = get_volume_issues(volume["id"], api_key, session)
-    time.sleep(REQUEST_DELAY)
+    # Covers already on disk are tracked by issue id
+    manifest = CoverManifest(output_dir / MANIFEST_FILENAME)
+
+    failed = []
+    missing_pages = []
+    start_time = time.monotonic()
+
+    if stream:
+        # Overlap issue listing with cover downloads
+        print(f"{label}Output directory: {output_dir}")
+        print(f"{label}Workers: {workers} (streaming)\n")
+        counts, failed = stream_volume_covers(volume["id"], api_key, output_dir, session,
+                                              api_limiter, cdn_limiter, cache, workers,
+                                              manifest, label, missing_pages)
+        total_issues = sum(counts.values())
+        issue_ids = [int(issue_id) for issue_id in manifest.entries]
+        issue_ids += [issue["id"] for issue in failed if issue["id"] is not None]
+    else:
+        # Get all issues
+        issues = get_volume_issues(volume["id"], api_key, session, api_limiter, cache,
+                                   workers, missing_pages)
+        total_issues = len(issues)
+
+        if issues:
+            print(f"\n{label}Found {len(issues)} issues for {volume['name']}")
+            print(f"{label}Output directory: {output_dir}")
+            print(f"{label}Workers: {workers}\n")
+
+        # Download covers
+        counts = download_covers(issues, output_dir, session, cdn_limiter, workers,
+                                 manifest, label)
+        issue_ids = [issue["id"] for issue in issues if issue.get("id") is not None]
+
+    if total_issues:
+        manifest.save()
+        if enrich_fields:
+            enrich_volume(output_dir, issue_ids, enrich_fields, api_key, session,
+                          api_limiter, cache, workers, label)
+    elif not missing_pages:
+        print(f"{label}Warning: No issues found for volume: {volume['name']}")
+
+    if missing_pages:
+        print(f"{label}[WARN] Issue listing incomplete: {len(missing_pages)} page(s) of up to "
+              f"{ISSUES_PAGE_LIMIT} issues could not be fetched (offsets "
+              f"{', '.join(map(str, missing_pages))}); run again to pick up the rest")
+
+    return {
+        "volume": volume["name"],
+        "output_dir": output_dir,
+        "total": total_issues,
+        "counts": counts,
+        "failed": failed,
+        "missing_pages": missing_pages,
+        "elapsed": time.monotonic() - start_time,
+    }
 
-    if not issues:
-        print(f"Warning: No issues found for volume: {volume_name}")
-        sys.exit(0)
 
-    print(f"\nFound {len(issues)} issues for {volume_name}")
-    print(f"Output directory: {output_dir}\n")
+def print_volume_summary(result: dict):
+    """Print the download summary for one volume."""
+    counts = result["counts"]
+    elapsed = result["elapsed"]
+    throughput = counts[STATUS_OK] / elapsed if elapsed > 0 else 0.0
+
+    print(f"Total issues: {result['total']}")
+    print(f"Successful: {counts[STATUS_OK]}")
+    print(f"Skipped: {counts[STATUS_SKIP]}")
+    print(f"Failed: {counts[STATUS_FAIL]}")
+    for issue in result["failed"]:
+        print(f"  - Issue {issue['issue_number']}: {issue['name'] or 'Unnamed'}")
+    if result["missing_pages"]:
+        print(f"Issue listing: incomplete ({len(result['missing_pages'])} page(s) not fetched)")
+    print(f"Elapsed: {elapsed:.1f}s ({throughput:.2f} covers/sec)")
+    print(f"Output directory: {result['output_dir'].absolute()}")
+
+
+def print_quota_usage(scheduler: QuotaScheduler):
+    """Print per-resource API quota usage for the current window."""
+    usage = scheduler.usage()
+    if usage:
+        used = ", ".join(f"/{resource} {count}/{scheduler.limit}"
+                         for resource, count in sorted(usage.items()))
+        print(f"API quota (last hour): {used}")
+
+
+def report_metrics(metrics_dir: Path | None):
+    """Print per-stage timings and write them as JSON and a Prometheus textfile."""
+    print()
+    metrics.print_summary()
+    if metrics_dir:
+        json_path, prom_path = metrics.write(metrics_dir)
+        print(f"[INFO] Metrics written to {json_path} and {prom_path.name}")
+
+
+def run_batch(entries: list[str], api_key: str, session: requests.Session,
+              api_limiter: ApiLimiter, cdn_limiter: TokenBucket,
+              cache: ResponseCache | None = None, workers: int = DEFAULT_WORKERS,
+              volume_workers: int = DEFAULT_VOLUME_WORKERS, stream: bool = False,
+              enrich_fields: str | None = None) -> list[dict]:
+    """
+    Download covers for many volumes under one shared API and CDN budget.
 
-    # Download covers
-    success_count = 0
-    failure_count = 0
-    skip_count = 0
+    Up to `volume_workers` volumes are synced at once. Every volume draws
+    from the same limiters and connection pool, so adding volumes never
+    raises the overall request rate.
 
-    for i, issue in enumerate(issues, 1):
-        print(f"[{i}/{len(issues)}] ", end="")
+    Returns:
+        List of per-volume results, in manifest order
+    """
+    volumes = resolve_volumes(entries, api_key, session, api_limiter, cache)
+    if not volumes:
+        return []
 
-        result = download_cover(issue, output_dir, session)
+    print(f"\nResolved {len(volumes)} of {len(entries)} volumes")
 
-        if result:
-            success_count += 1
-        else:
-            failure_count += 1
+    def task(volume):
+        label = f"[{volume['name']}] "
+        return sync_volume(volume, api_key, session, api_limiter, cdn_limiter, cache,
+                           workers, stream, label, enrich_fields)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(volume_workers, len(volumes)))) as executor:
+        return list(executor.map(task, volumes))
 
-        # Rate limiting for downloads
-        time.sleep(REQUEST_DELAY / 2)
+
+def main():
+    """Main execution flow."""
+    parser = argparse.ArgumentParser(
+        description="Downloads all issue covers for a given comic volume from Comic Vine.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python comicvine_download_covers.py "Absolute Batman"
+
+  # Download 8 covers at a time
+  python comicvine_download_covers.py "Absolute Batman" --workers 8
+
+  # Start downloading covers while the issue list is still paginating
+  python comicvine_download_covers.py "Detective Comics" --workers 8 --stream
+
+  # Download every volume listed in a file (names, 4050-<id> or id:<id>, one per line)
+  python comicvine_download_covers.py --batch volumes.txt --workers 4
+
+  # Also store character/story arc credits and descriptions for each issue
+  python comicvine_download_covers.py "Absolute Batman" --enrich
+
+  # Ignore cached API responses
+  python comicvine_download_covers.py "Absolute Batman" --refresh
+
+  # Print a timing line per cover and write metrics for node_exporter
+  python comicvine_download_covers.py "Absolute Batman" --live --metrics-dir /var/lib/node_exporter
+
+Covers are saved to scripts/assets/<Volume_Name>/covers/
+        """
+    )
+
+    parser.add_argument(
+        "volume",
+        nargs="?",
+        default=None,
+        help="Comic volume name (e.g., 'Absolute Batman'). Omit when using --batch"
+    )
+
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help="File with one volume name or Comic Vine volume id (4050-<id> or id:<id>) per line"
+    )
+
+    parser.add_argument(
+        "--volume-workers",
+        type=int,
+        default=DEFAULT_VOLUME_WORKERS,
+        help=f"Volumes synced at once in batch mode (default: {DEFAULT_VOLUME_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of concurrent cover downloads and issue page requests (default: {DEFAULT_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Ignore cached API responses and query Comic Vine again"
+    )
+
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Download covers as each page of issues arrives instead of after listing all issues"
+    )
+
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Also store issue details (credits, description) in covers/details.json"
+    )
+
+    parser.add_argument(
+        "--enrich-fields",
+        default=DEFAULT_ENRICH_FIELDS,
+        help=f"Comma-separated issue fields for --enrich (default: {DEFAULT_ENRICH_FIELDS})"
+    )
+
+    parser.add_argument(
+        "--metrics-dir",
+        type=Path,
+        default=METRICS_DIR,
+        help=f"Directory for per-stage timings as JSON and Prometheus textfile (default: {METRICS_DIR})"
+    )
+
+    parser.add_argument(
+        "--no-metrics",
+        action="store_true",
+        help="Do not write the metrics files (the timing table is still printed)"
+    )
+
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Print a timing line for every downloaded cover"
+    )
+
+    args = parser.parse_args()
+    workers = max(1, args.workers)
+    metrics.live = args.live
+    metrics_dir = None if args.no_metrics else args.metrics_dir
+    enrich_fields = args.enrich_fields if args.enrich else None
+
+    if not args.volume and not args.batch:
+        parser.error("a volume name or --batch FILE is required")
+
+    # Load API key
+    api_key = load_api_key()
+
+    # Create requests session for connection pooling
+    session = create_session(workers * max(1, args.volume_workers) if args.batch else workers)
+
+    # API and image CDN requests are throttled independently. The API
+    # limiter enforces the hourly per-resource quota shared across runs.
+    api_limiter = QuotaScheduler(velocity=TokenBucket(rate=1.0 / REQUEST_DELAY))
+    cdn_limiter = TokenBucket(rate=CDN_RATE, capacity=CDN_BURST)
+
+    # Cache API responses across runs
+    cache = ResponseCache(refresh=args.refresh)
+
+    if args.batch:
+        start_time = time.monotonic()
+        results = run_batch(read_batch_file(Path(args.batch)), api_key, session,
+                            api_limiter, cdn_limiter, cache, workers,
+                            args.volume_workers, args.stream, enrich_fields)
+        if not results:
+            print("Error: No volumes could be resolved from the batch file")
+            report_metrics(metrics_dir)
+            sys.exit(1)
+
+        # Print summary
+        print("\n" + "=" * 50)
+        print("Batch Summary")
+        print("=" * 50)
+        for result in results:
+            print(f"\n{result['volume']}")
+            print_volume_summary(result)
+        print()
+        print(f"Volumes: {len(results)}")
+        print(f"Total covers downloaded: {sum(r['counts'][STATUS_OK] for r in results)}")
+        print(f"Total elapsed: {time.monotonic() - start_time:.1f}s")
+        print(f"API requests: {cache.live_requests} live, {cache.hits} cached")
+        print_quota_usage(api_limiter)
+        report_metrics(metrics_dir)
+        print("=" * 50)
+        return
+
+    # Search for volume
+    volume = search_volume(args.volume, api_key, session, api_limiter, cache)
+    if not volume:
+        report_metrics(metrics_dir)
+        sys.exit(1)
+
+    result = sync_volume(volume, api_key, session, api_limiter, cdn_limiter, cache,
+                         workers, args.stream, enrich_fields=enrich_fields)
+    if not result["total"] and not result["missing_pages"]:
+        # Nothing to summarize, but the API and cache spans still count
+        report_metrics(metrics_dir)
+        sys.exit(0)
 
     # Print summary
     print("\n" + "=" * 50)
     print("Download Summary")
     print("=" * 50)
-    print(f"Total issues: {len(issues)}")
-    print(f"Successful: {success_count}")
-    print(f"Failed: {failure_count}")
-    print(f"Output directory: {output_dir.absolute()}")
+    print_volume_summary(result)
+    print(f"API requests: {cache.live_requests} live, {cache.hits} cached")
+    print_quota_usage(api_limiter)
+    report_metrics(metrics_dir)
     print("=" * 50)
 
 
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Vine Mock Server
+
+Local stand-in for the Comic Vine API and image CDN, used to exercise and
+benchmark comicvine_download_covers.py offline.
+Usage: python comicvine_mock_server.py [--port 8700] [--api-latency 0.1]
+
+Serves:
+  /api/volumes          filter=name:<name> or filter=id:<a|b|c>
+  /api/issues           filter=volume:<id> or filter=id:<a|b|c>, limit/offset pagination
+  /api/issue/4000-<id>  single issue details
+  /covers/<id>.jpg      synthetic cover images (supports Range)
+
+Responses follow the live API envelope (status_code, error, limit, offset,
+number_of_page_results, number_of_total_results, results). Latency, error
+rate and per-resource rate limiting are configurable.
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+from collections import defaultdict, deque
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+
+# Configuration
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8700
+DEFAULT_VOLUME_SIZES = [10, 100, 1000]  # Issues per generated volume
+VOLUME_ID_BASE = 90000  # Generated volume ids start here
+PAGE_LIMIT = 100  # Maximum results per page (matches the live API)
+COVER_SIZE = 50000  # Bytes per synthetic cover
+
+# Comic Vine status codes
+STATUS_OK = 1
+STATUS_NOT_FOUND = 101
+STATUS_FILTER_ERROR = 104
+STATUS_RATE_LIMIT = 107
+
+
+def volume_name_for(issue_count: int) -> str:
+    """Name of the generated volume with `issue_count` issues."""
+    return f"Mock Volume {issue_count}"
+
+
+class MockComicVine:
+    """
+    In-memory Comic Vine dataset plus request accounting.
+
+    Volumes are generated from a list of issue counts; every issue gets a
+    cover URL on this server and the detail fields used by enrichment.
+    """
+
+    def __init__(self, volume_sizes: list[int] = DEFAULT_VOLUME_SIZES,
+                 api_latency: float = 0.0, image_latency: float = 0.0,
+                 error_rate: float = 0.0, rate_limit: int = 0, rate_window: float = 3600,
+                 cover_size: int = COVER_SIZE):
+        self.api_latency = api_latency
+        self.image_latency = image_latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.rate_window = rate_window
+        self.cover_size = cover_size
+        self.base_url = ""
+
+        self.volumes = {}
+        self.issues = {}
+        self.volume_issues = defaultdict(list)
+
+        next_issue_id = 1
+        for index, count in enumerate(volume_sizes):
+            volume_id = VOLUME_ID_BASE + index
+            self.volumes[volume_id] = {
+                "id": volume_id,
+                "name": volume_name_for(count),
+                "publisher": {"id": 10, "name": "Mock Comics"},
+                "start_year": "2024",
+                "count_of_issues": count,
+            }
+
+            for number in range(1, count + 1):
+                issue_id = next_issue_id
+                next_issue_id += 1
+                self.issues[issue_id] = {
+                    "id": issue_id,
+                    "issue_number": str(number),
+                    "name": f"Chapter {number}",
+                    "cover_date": f"{2024 + number // 12:04d}-{number % 12 + 1:02d}-01",
+                    "volume": {"id": volume_id, "name": volume_name_for(count)},
+                    "description": f"<p>Synthetic issue {number}.</p>",
+                    "character_credits": [{"id": 1, "name": "Mock Hero"}],
+                    "story_arc_credits": [{"id": 2, "name": f"Arc {number // 6 + 1}"}],
+                }
+                self.volume_issues[volume_id].append(issue_id)
+
+        self._lock = threading.Lock()
+        self._recent = defaultdict(deque)
+        self.api_requests = defaultdict(int)
+        self.image_requests = 0
+        self.image_bytes = 0
+
+    def cover_bytes(self, issue_id: int) -> bytes:
+        """Deterministic synthetic cover payload for an issue."""
+        seed = hashlib.sha256(str(issue_id).encode()).digest()
+        header = b"\xff\xd8\xff\xe0"  # JPEG SOI + APP0 marker
+        body = (seed * (self.cover_size // len(seed) + 1))[:self.cover_size - len(header)]
+        return header + body
+
+    def issue_view(self, issue: dict) -> dict:
+        """Issue as returned by the API, with image URLs on this server."""
+        cover_url = f"{self.base_url}/covers/{issue['id']}.jpg"
+        return {
+            **issue,
+            "image": {
+                "super_url": cover_url,
+                "medium_url": cover_url,
+                "thumb_url": cover_url,
+            },
+        }
+
+    def check_rate_limit(self, resource: str) -> bool:
+        """Record an API request; return True if it exceeds the configured limit."""
+        now = time.monotonic()
+        with self._lock:
+            self.api_requests[resource] += 1
+            if not self.rate_limit:
+                return False
+
+            recent = self._recent[resource]
+            while recent and recent[0] <= now - self.rate_window:
+                recent.popleft()
+            if len(recent) >= self.rate_limit:
+                return True
+            recent.append(now)
+            return False
+
+    def stats(self) -> dict:
+        """Request counters since startup."""
+        with self._lock:
+            return {
+                "api_requests": dict(self.api_requests),
+                "image_requests": self.image_requests,
+                "image_bytes": self.image_bytes,
+            }
+
+
+def envelope(results, status_code: int = STATUS_OK, error: str = "OK",
+             limit: int = PAGE_LIMIT, offset: int = 0, total: int | None = None) -> dict:
+    """Wrap results in the Comic Vine response envelope."""
+    page_count = len(results) if isinstance(results, list) else 1
+    return {
+        "error": error,
+        "limit": limit,
+        "offset": offset,
+        "number_of_page_results": page_count if results else 0,
+        "number_of_total_results": total if total is not None else page_count if results else 0,
+        "status_code": status_code,
+        "results": results,
+        "version": "1.0",
+    }
+
+
+def select_fields(item: dict, field_list: str | None) -> dict:
+    """Apply a field_list param to one result."""
+    if not field_list:
+        return item
+    fields = {field.strip() for field in field_list.split(",")}
+    return {key: value for key, value in item.items() if key in fields}
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    """Request handler dispatching API and image routes to the dataset."""
+
+    mock: MockComicVine = None
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, data: dict, status: int = 200):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_status(self, status: int):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        parts = [part for part in parsed.path.split("/") if part]
+
+        if len(parts) == 2 and parts[0] == "covers":
+            self.handle_cover(parts[1])
+        elif len(parts) >= 2 and parts[0] == "api":
+            self.handle_api(parts[1:], params)
+        else:
+            self.send_error_status(404)
+
+    def handle_api(self, parts: list[str], params: dict):
+        mock = self.mock
+        time.sleep(mock.api_latency)
+
+        resource = parts[0]
+        if mock.check_rate_limit(resource):
+            self.send_json(envelope([], STATUS_RATE_LIMIT, "Rate limit exceeded.  Slow down cowboy."),
+                           status=420)
+            return
+
+        if mock.error_rate and random.random() < mock.error_rate:
+            self.send_error_status(503)
+            return
+
+        limit = min(int(params.get("limit", PAGE_LIMIT)), PAGE_LIMIT)
+        offset = int(params.get("offset", 0))
+        field_list = params.get("field_list")
+        key, _, value = params.get("filter", "").partition(":")
+
+        if resource == "volumes":
+            if key == "name":
+                results = [v for v in mock.volumes.values() if value.lower() in v["name"].lower()]
+            elif key == "id":
+                ids = {int(i) for i in value.split("|") if i.isdigit()}
+                results = [v for v in mock.volumes.values() if v["id"] in ids]
+            else:
+                results = list(mock.volumes.values())
+        elif resource == "issues":
+            if key == "volume" and value.isdigit():
+                results = [mock.issues[i] for i in mock.volume_issues.get(int(value), [])]
+            elif key == "id":
+                ids = [int(i) for i in value.split("|") if i.isdigit()]
+                results = [mock.issues[i] for i in ids if i in mock.issues]
+            elif key:
+                self.send_json(envelope([], STATUS_FILTER_ERROR, "Filter Error"))
+                return
+            else:
+                results = list(mock.issues.values())
+            results = [mock.issue_view(issue) for issue in results]
+        elif resource == "issue" and len(parts) == 2:
+            issue_id = parts[1].rpartition("-")[2]
+            issue = mock.issues.get(int(issue_id)) if issue_id.isdigit() else None
+            if not issue:
+                self.send_json(envelope([], STATUS_NOT_FOUND, "Object Not Found"))
+                return
+            self.send_json(envelope(select_fields(mock.issue_view(issue), field_list)))
+            return
+        else:
+            self.send_json(envelope([], STATUS_NOT_FOUND, "Object Not Found"))
+            return
+
+        page = [select_fields(item, field_list) for item in results[offset:offset + limit]]
+        self.send_json(envelope(page, limit=limit, offset=offset, total=len(results)))
+
+    def handle_cover(self, filename: str):
+        mock = self.mock
+        time.sleep(mock.image_latency)
+
+        issue_id = filename.split(".")[0]
+        if not issue_id.isdigit() or int(issue_id) not in mock.issues:
+            self.send_error_status(404)
+            return
+
+        if mock.error_rate and random.random() < mock.error_rate:
+            self.send_error_status(503)
+            return
+
+        data = mock.cover_bytes(int(issue_id))
+        start = 0
+        range_header = self.headers.get("Range", "")
+        if range_header.startswith("bytes="):
+            start = int(range_header[6:].split("-")[0] or 0)
+            if start >= len(data):
+                self.send_error_status(416)
+                return
+
+        body = data[start:]
+        self.send_response(206 if start else 200)
+        self.send_header("Content-Type", "image/jpeg")
+        self.send_header("Content-Length", str(len(body)))
+        if start:
+            self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+        self.end_headers()
+        self.wfile.write(body)
+
+        with mock._lock:
+            mock.image_requests += 1
+            mock.image_bytes += len(body)
+
+
+def create_server(mock: MockComicVine, host: str = DEFAULT_HOST,
+                  port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    """
+    Create (but do not start) a server for a mock dataset.
+
+    Pass port=0 to bind a free port; mock.base_url is set to the bound address.
+    """
+    handler = type("BoundMockHandler", (MockHandler,), {"mock": mock})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    mock.base_url = f"http://{host}:{server.server_address[1]}"
+    return server
+
+
+def start_server(mock: MockComicVine, host: str = DEFAULT_HOST,
+                 port: int = 0) -> ThreadingHTTPServer:
+    """Start a mock server on a background thread and return it."""
+    server = create_server(mock, host, port)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    """Main execution flow."""
+    parser = argparse.ArgumentParser(
+        description="Local stand-in for the Comic Vine API and image CDN",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python comicvine_mock_server.py
+
+  # Slow API, flaky CDN and the real 200/hour limit
+  python comicvine_mock_server.py --api-latency 0.3 --error-rate 0.02 --rate-limit 200
+
+Point the downloader at it by setting API_BASE_URL to http://127.0.0.1:<port>/api
+        """
+    )
+
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--volumes", type=int, nargs="+", default=DEFAULT_VOLUME_SIZES,
+                        help="Issue counts of the generated volumes (default: 10 100 1000)")
+    parser.add_argument("--api-latency", type=float, default=0.0, help="Seconds added to each API response")
+    parser.add_argument("--image-latency", type=float, default=0.0, help="Seconds added to each cover response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with HTTP 503")
+    parser.add_argument("--rate-limit", type=int, default=0,
+                        help="API requests per resource per window before HTTP 420 (0: unlimited)")
+    parser.add_argument("--rate-window", type=float, default=3600, help="Rate limit window in seconds")
+
+    args = parser.parse_args()
+
+    mock = MockComicVine(args.volumes, args.api_latency, args.image_latency,
+                         args.error_rate, args.rate_limit, args.rate_window)
+    server = create_server(mock, args.host, args.port)
+
+    print(f"Mock Comic Vine listening on {mock.base_url}")
+    for volume in mock.volumes.values():
+        print(f"  {volume['id']}: {volume['name']} ({volume['count_of_issues']} issues)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(f"\nStats: {json.dumps(mock.stats())}")
+        sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Comic Vine Rate Limiting
+
+Rate limiters shared by the scripts in this directory:
+
+- TokenBucket: in-process limiter for request velocity (API or image CDN)
+- QuotaScheduler: per-resource hourly quota for the Comic Vine API, tracked
+  in a sliding one-hour window persisted to disk so consecutive (and
+  concurrent) runs share it
+
+Both expose acquire(resource) and rate_limited(resource, retry_after), so
+either can be passed wherever an API limiter is expected.
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+
+# Configuration
+SCRIPT_DIR = Path(__file__).parent
+QUOTA_PATH = SCRIPT_DIR / ".cache" / "comicvine_quota.sqlite3"
+QUOTA_LIMIT = 200  # Requests per resource per window (Comic Vine API terms)
+QUOTA_WINDOW = 3600  # Seconds
+RATE_LIMIT_BACKOFF = 60.0  # Seconds to pause when a rate limit hits and nothing better is known
+RATE_LIMIT_BACKOFF_MAX = 900.0  # Cap for repeated (doubling) rate-limit backoffs
+QUOTA_NEAR_FULL = 0.9  # Fraction of the quota from which a rate limit is blamed on our own requests
+
+
+def quota_resource(resource: str) -> str:
+    """Map detail and list endpoints onto one quota resource (e.g. "issue" -> "issues")."""
+    return resource if resource.endswith("s") else resource + "s"
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    acquire() blocks only as long as needed for a token to become available,
+    so idle time is never spent sleeping on a fixed schedule.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, resource: str | None = None):
+        """
+        Take one token, waiting until one is available.
+
+        `resource` is accepted for interface compatibility with
+        QuotaScheduler and ignored: a bucket covers every request it sees.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+    def rate_limited(self, resource: str | None = None, retry_after: float | None = None) -> float:
+        """
+        Pause the bucket after the server reported a rate limit.
+
+        Returns:
+            Seconds until the next request will be allowed
+        """
+        wait = retry_after if retry_after is not None else RATE_LIMIT_BACKOFF
+
+        with self._lock:
+            # Going into debt makes acquire() wait out the pause
+            self._tokens = min(self._tokens, 1 - wait * self.rate)
+            self._updated = time.monotonic()
+
+        return wait
+
+
+class QuotaScheduler:
+    """
+    Per-resource hourly quota for the Comic Vine API.
+
+    Every request is logged per resource in a SQLite database; acquire()
+    admits a request only while fewer than `limit` requests for that
+    resource fall inside the sliding window, and otherwise sleeps exactly
+    until the oldest one ages out. Rate-limit responses from the server
+    pause the resource (see rate_limited). An optional TokenBucket
+    smooths short-term velocity on top of the hourly quota.
+    """
+
+    def __init__(self, path: Path = QUOTA_PATH, limit: int = QUOTA_LIMIT,
+                 window: float = QUOTA_WINDOW, velocity: TokenBucket | None = None):
+        self.path = Path(path)
+        self.limit = limit
+        self.window = window
+        self.velocity = velocity
+        self._backoffs = {}  # resource -> (consecutive backoffs, end of the last pause)
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        self._conn = sqlite3.connect(str(self.path), timeout=30,
+                                     check_same_thread=False, isolation_level=None)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS requests (resource TEXT NOT NULL, ts REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS requests_resource_ts ON requests (resource, ts)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS pauses (resource TEXT PRIMARY KEY, until REAL NOT NULL)"
+        )
+
+    def _reserve(self, resource: str) -> float:
+        """
+        Record a request for `resource` if the quota allows it.
+
+        Returns:
+            0 if the request was admitted, otherwise seconds to wait
+        """
+        now = time.time()
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute("DELETE FROM requests WHERE ts <= ?", (now - self.window,))
+
+                row = self._conn.execute(
+                    "SELECT until FROM pauses WHERE resource = ?", (resource,)
+                ).fetchone()
+                if row and row[0] > now:
+                    return row[0] - now
+
+                count, oldest = self._conn.execute(
+                    "SELECT COUNT(*), MIN(ts) FROM requests WHERE resource = ?", (resource,)
+                ).fetchone()
+                if count >= self.limit:
+                    return oldest + self.window - now
+
+                self._conn.execute(
+                    "INSERT INTO requests (resource, ts) VALUES (?, ?)", (resource, now)
+                )
+                return 0.0
+            finally:
+                self._conn.execute("COMMIT")
+
+    def acquire(self, resource: str | None = None):
+        """Wait until a request for `resource` fits the quota, then record it."""
+        resource = quota_resource(resource or "default")
+
+        if self.velocity:
+            self.velocity.acquire()
+
+        announced = False
+        while True:
+            wait = self._reserve(resource)
+            if wait <= 0:
+                return
+
+            if not announced and wait > 1:
+                print(f"[WAIT] Comic Vine quota for /{resource} is full; "
+                      f"resuming in {wait:.0f}s")
+                announced = True
+
+            time.sleep(wait)
+
+    def rate_limited(self, resource: str | None = None, retry_after: float | None = None) -> float:
+        """
+        Pause a resource after the server reported a rate limit.
+
+        The pause lasts `retry_after` seconds if the server said so. When
+        the logged requests are close to `limit` (QUOTA_NEAR_FULL), it
+        lasts until the oldest one leaves the window, when capacity will
+        actually free up. Otherwise the server is counting requests this
+        log does not see, so the pause starts at RATE_LIMIT_BACKOFF and
+        doubles for every further rate limit that follows straight after
+        a pause, up to RATE_LIMIT_BACKOFF_MAX. The pause is persisted, so
+        other runs honor it too.
+
+        Returns:
+            Seconds until the resource is available again
+        """
+        resource = quota_resource(resource or "default")
+        now = time.time()
+
+        with self._lock:
+            count, oldest = self._conn.execute(
+                "SELECT COUNT(*), MIN(ts) FROM requests WHERE resource = ? AND ts > ?",
+                (resource, now - self.window)
+            ).fetchone()
+
+            backoffs, last_until = self._backoffs.get(resource, (0, 0.0))
+            if now > last_until + RATE_LIMIT_BACKOFF:
+                # The previous pause ended a while ago; start over
+                backoffs = 0
+
+            if retry_after is not None:
+                wait = retry_after
+            elif oldest is not None and count >= self.limit * QUOTA_NEAR_FULL:
+                wait = oldest + self.window - now
+            else:
+                wait = min(RATE_LIMIT_BACKOFF * 2 ** backoffs, RATE_LIMIT_BACKOFF_MAX)
+                backoffs += 1
+
+            self._backoffs[resource] = (backoffs, now + wait)
+
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pauses (resource, until) VALUES (?, ?)",
+                (resource, now + wait)
+            )
+
+        return wait
+
+    def usage(self) -> dict[str, int]:
+        """Return requests per resource within the current window."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT resource, COUNT(*) FROM requests WHERE ts > ? GROUP BY resource",
+                (time.time() - self.window,)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Anything accepted where an API limiter is expected
+ApiLimiter = TokenBucket | QuotaScheduler
@@ -7,17 +7,27 @@ Scrapes comic pages from readcomiconline.li with proper sequential ordering.
 Usage: python selenium_webscraping_pages.py "Volume Name" <issue_number> [--url URL]
 """
 
+import io
 import sys
+import base64
 import os
 import re
 import json
 import time
+import heapq
 import hashlib
 import argparse
+import fnmatch
+import queue
+import threading
+import contextlib
+import contextvars
 from pathlib import Path
+from collections import OrderedDict
 from datetime import datetime
-from urllib.parse import urlparse
-from typing import Optional
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from selenium import webdriver
@@ -26,21 +36,65 @@ try:
     from selenium.webdriver.common.by import By
     from selenium.webdriver.support.ui import WebDriverWait
     from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import (
+        TimeoutException, JavascriptException, StaleElementReferenceException,
+        WebDriverException
+    )
     from webdriver_manager.chrome import ChromeDriverManager
     import requests
+    from requests.adapters import HTTPAdapter
     from PIL import Image
 except ImportError as e:
     print(f"Error: Missing required dependency: {e}")
     print("Install with: pip install selenium webdriver-manager requests pillow")
     sys.exit(1)
 
+from comicvine_ratelimit import TokenBucket
+from stage_metrics import StageMetrics, METRICS_DIR
+
 
 # Configuration
 SCRIPT_DIR = Path(__file__).parent
 OUTPUT_BASE_PATH = SCRIPT_DIR / "assets"
+CACHE_DIR = SCRIPT_DIR / ".cache"
+DRIVER_CACHE_PATH = CACHE_DIR / "chromedriver.json"  # Resolved chromedriver path
+DEFAULT_PROFILE_DIR = CACHE_DIR / "chrome-profile"  # Persistent browser profile (--profile-dir)
 DEFAULT_COMIC_HOST = "readcomiconline.li"
-REQUEST_DELAY = 1.0  # Seconds between page loads
+COMIC_BASE_URL = f"https://{DEFAULT_COMIC_HOST}"  # Reader site root (the benchmark points it at a local fixture)
 DOWNLOAD_TIMEOUT = 15  # Seconds for image download
+DEFAULT_DOWNLOAD_WORKERS = 4  # Parallel page downloads in fast mode
+DRIVER_RECYCLE_PAGES = 500  # Restart the shared browser after this many page loads
+PAGE_LOAD_TIMEOUT = 30.0  # Max seconds to wait for the reader's first comic image
+PAGE_TURN_TIMEOUT = 15.0  # Max seconds to wait for the next page's comic image
+WAIT_POLL_INTERVAL = 0.1  # Seconds between readiness checks
+HOST_RATE = 2.0  # Reader page loads and page turns per second on the comic host (all tabs combined)
+HOST_BURST = 2
+DEFAULT_PARALLEL_ISSUES = 1  # Issues scraped at once in all-issues mode
+MAX_VOLUME_ISSUES = 100  # Safety limit when probing a volume's issues
+DISCOVERY_WORKERS = 8  # Concurrent HTTP probes during issue discovery
+PROBE_MISS_LIMIT = 3  # Consecutive missing issue numbers that end HTTP probing
+ISSUE_LOG_FILENAME = "scrape.log"  # Per-issue log in --parallel mode
+PAGE_QUEUE_SIZE = 8  # Pages discovered by navigation but not yet downloaded
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per streamed read
+PART_SUFFIX = ".part"  # Temporary file for atomic page writes
+JOURNAL_FILENAME = "journal.jsonl"  # Append-only per-page log next to metadata.json
+PAGE_RETRY_BUDGET = 8  # Page download retries allowed per issue
+PAGE_RETRY_ATTEMPTS = 3  # Retries of a single page before it is reported as failed
+RETRY_BASE_DELAY = 1.0  # Seconds before a page's first retry; doubles with every retry
+RETRY_MAX_DELAY = 16.0  # Longest wait between retries of a page
+METRICS_JOB = "comic_pages"  # Metrics file names in the metrics directory (<job>.json, <job>.prom)
+CAPTURE_RESOURCE_BUFFER = 20 * 1024 * 1024  # Max bytes Chrome keeps per response for --capture
+CAPTURE_TOTAL_BUFFER = 200 * 1024 * 1024  # Max bytes Chrome keeps across responses for --capture
+CAPTURE_TRACKED_REQUESTS = 500  # Image request ids remembered per tab
+
+# Page turn outcomes (navigate_to_next_page)
+NAV_OK = "ok"
+NAV_END = "end"  # No usable "Next" button: the issue has ended
+NAV_TIMEOUT = "timeout"  # Next page did not load in time
+NAV_ERROR = "error"  # Anything else went wrong while turning the page
+
+# Per-stage timings for this run (written to the metrics directory at the end)
+metrics = StageMetrics(METRICS_JOB)
 
 # HTTP Headers
 HEADERS = {
@@ -55,6 +109,55 @@ MIN_ASPECT_RATIO = 0.5  # Minimum aspect ratio (width/height)
 MAX_ASPECT_RATIO = 1.5  # Maximum aspect ratio (width/height)
 MIN_FILE_SIZE = 10000  # Minimum file size in bytes
 
+# Image sources that are never comic pages
+EXCLUDE_IMAGE_PATTERNS = [
+    'avatar',
+    'icon',
+    'logo',
+    'banner',
+    'button',
+]
+
+# Page load strategy: "eager" returns once the DOM is ready instead of waiting
+# for every ad and image (the comic image has its own wait condition)
+PAGE_LOAD_STRATEGY = "eager"
+
+# Third-party resources the reader does not need (Chrome DevTools URL patterns)
+BLOCKED_URL_PATTERNS = [
+    "*googletagmanager.com*",
+    "*google-analytics.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*adservice.google.com*",
+    "*amazon-adsystem.com*",
+    "*connect.facebook.net*",
+    "*disqus.com*",
+    "*disquscdn.com*",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+]
+
+# Hosts the reader needs; block patterns that would match them are dropped
+READER_ALLOWED_HOSTS = [
+    DEFAULT_COMIC_HOST,
+    "blogspot.com",
+    "googleusercontent.com",
+    "ajax.googleapis.com",
+    "code.jquery.com",
+]
+
+# Reader query params that show every page of an issue in high quality
+ALL_PAGES_PARAMS = {"readType": "1", "quality": "hq"}
+
+# Issue links on a volume landing page: /Comic/<Volume>/<Issue-segment>[?id=N]
+ISSUE_LINK_PATTERN = re.compile(r"""href=['"]((?:https?://[^/'"]+)?/Comic/([^/'"?#]+)/([^/'"?#]+)(?:\?[^'"#]*)?)['"]""",
+                                re.IGNORECASE)
+
+# Inline reader script that lists the issue's page images
+PAGE_LIST_PATTERN = re.compile(r"lstImages\.push\(\s*['\"]([^'\"]+)['\"]\s*\)")
+IMG_SRC_PATTERN = re.compile(r"<img[^>]+src=['\"](https?://[^'\"]*blogspot\.com[^'\"]*)['\"]", re.IGNORECASE)
+
 
 def sanitize_filename(name: str) -> str:
     """
@@ -95,141 +198,307 @@ def get_image_hash(image_data: bytes) -> str:
     return hashlib.md5(image_data).hexdigest()
 
 
-def is_valid_comic_image(img_element, driver) -> tuple[bool, Optional[str]]:
+def hash_file(path: Path) -> str:
+    """Calculate the MD5 hash of a file without reading it into memory at once."""
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Describes every <img> on the page in one WebDriver round trip
+IMAGE_SNAPSHOT_SCRIPT = """
+return Array.from(document.images).map(img => {
+    const rect = img.getBoundingClientRect();
+    const style = window.getComputedStyle(img);
+    return {
+        src: img.currentSrc || img.src || "",
+        naturalWidth: img.naturalWidth,
+        naturalHeight: img.naturalHeight,
+        width: rect.width,
+        height: rect.height,
+        visible: rect.width > 0 && rect.height > 0
+            && style.display !== "none" && style.visibility !== "hidden",
+        complete: img.complete
+    };
+});
+"""
+
+
+def snapshot_images(driver) -> list[dict]:
     """
-    Validate if an image element is a valid comic page.
+    Describe all images on the current page with a single execute_script.
 
-    Returns:
-        (is_valid, image_url) tuple
+    Each entry has src, natural and rendered dimensions, visibility and
+    load state, so selection can run in Python without further WebDriver
+    calls regardless of how many <img> tags the page has.
     """
-    try:
-        src = img_element.get_attribute("src")
-        if not src:
-            return (False, None)
+    return driver.execute_script(IMAGE_SNAPSHOT_SCRIPT) or []
 
-        # Must be from blogspot (main comic host)
-        if "blogspot.com" not in src.lower() and "bp.blogspot.com" not in src.lower():
-            return (False, None)
 
-        # Filter out known non-comic image sources
-        exclude_patterns = [
-            'avatar',
-            'icon',
-            'logo',
-            'banner',
-            'button',
-        ]
+def is_valid_comic_image(image: dict, decoded: bool = True) -> tuple[bool, Optional[str]]:
+    """
+    Validate if an image snapshot entry is a valid comic page.
+
+    Args:
+        image: Snapshot entry
+        decoded: False when the browser does not load images; rendered size
+            and visibility are meaningless then, so only the src is checked
 
-        src_lower = src.lower()
-        for pattern in exclude_patterns:
-            if pattern in src_lower:
-                return (False, None)
+    Returns:
+        (is_valid, image_url) tuple
+    """
+    src = image.get("src")
+    if not src:
+        return (False, None)
 
-        # Check display dimensions (use what browser reports)
-        size = img_element.size
-        width = size.get('width', 0)
-        height = size.get('height', 0)
+    # Must be from blogspot (main comic host)
+    src_lower = src.lower()
+    if "blogspot.com" not in src_lower:
+        return (False, None)
 
-        # Image must be large enough (use display size as proxy)
-        # Blogspot comic images are typically displayed at 1000+ px width
-        if width < 300:  # More permissive threshold
+    # Filter out known non-comic image sources
+    for pattern in EXCLUDE_IMAGE_PATTERNS:
+        if pattern in src_lower:
             return (False, None)
 
+    if not decoded:
         return (True, src)
 
-    except Exception as e:
+    if not image.get("visible"):
+        return (False, None)
+
+    # Image must be large enough (use display size as proxy)
+    # Blogspot comic images are typically displayed at 1000+ px width
+    if image.get("width", 0) < 300 or image.get("height", 0) < 300:
         return (False, None)
 
+    return (True, src)
+
+
+def select_comic_image(images: list[dict], decoded: bool = True) -> Optional[dict]:
+    """
+    Pick the main comic page image from a page snapshot.
+
+    Strategy: the largest valid blogspot image is typically the comic page
+    (the first one in document order when sizes are unknown).
+    """
+    best_image = None
+    best_size = None
+
+    for image in images:
+        is_valid, _ = is_valid_comic_image(image, decoded)
+        if not is_valid:
+            continue
+
+        size = (image["width"] * image["height"], image["width"])
+        if best_size is None or size > best_size:
+            best_size = size
+            best_image = image
+
+    return best_image
+
+
+def images_decoded(driver) -> bool:
+    """Return False if the driver's browser was started without image loading."""
+    return getattr(driver, "images_decoded", True)
+
 
 def find_comic_image(driver) -> Optional[str]:
     """
     Find the main comic page image on the current page.
 
-    Strategy: Find the largest blogspot image, which is typically the comic page.
+    Returns:
+        The comic image URL, or None if not found
     """
     try:
-        all_images = driver.find_elements(By.TAG_NAME, "img")
+        image = select_comic_image(snapshot_images(driver), images_decoded(driver))
+        return image["src"] if image else None
 
-        # Find all blogspot images and track the largest one
-        best_image = None
-        best_area = 0
+    except Exception as e:
+        print(f"  [WARN] Error finding comic image: {e}")
+        return None
 
-        for img in all_images:
-            src = img.get_attribute("src")
-            if not src:
-                continue
 
-            # Must be from blogspot
-            if "blogspot.com" not in src.lower() and "bp.blogspot.com" not in src.lower():
-                continue
+def comic_image_ready(previous_src: Optional[str] = None):
+    """
+    WebDriverWait condition: the comic image is a new, fully loaded image.
 
-            # Get display size
-            size = img.size
-            width = size.get('width', 0)
-            height = size.get('height', 0)
+    Holds once the main comic <img> has a src different from
+    `previous_src`, reports `complete` and has a non-zero naturalWidth.
+    When the browser does not load images, a new comic src is enough.
+    Returns the image src when satisfied.
+    """
+    def condition(driver):
+        decoded = images_decoded(driver)
+        image = select_comic_image(snapshot_images(driver), decoded)
+        if not image:
+            return False
+        if previous_src and image["src"] == previous_src:
+            return False
+        if decoded and (not image.get("complete") or not image.get("naturalWidth")):
+            return False
+        return image["src"]
 
-            # Must be larger than minimum
-            if width < 300 or height < 300:
-                continue
+    return condition
 
-            # Calculate area
-            area = width * height
 
-            # Keep the largest image
-            if area > best_area:
-                best_area = area
-                best_image = src
+def wait_for_comic_image(driver, previous_src: Optional[str] = None,
+                         timeout: float = PAGE_TURN_TIMEOUT) -> Optional[str]:
+    """
+    Wait until the comic image is loaded (and differs from `previous_src`).
 
-        return best_image
+    Returns as soon as the condition holds, so per-page latency tracks the
+    site's actual speed instead of fixed sleeps.
 
-    except Exception as e:
-        print(f"  [WARN] Error finding comic image: {e}")
+    Returns:
+        The comic image src, or None on timeout
+    """
+    try:
+        return WebDriverWait(
+            driver, timeout, poll_frequency=WAIT_POLL_INTERVAL,
+            ignored_exceptions=(JavascriptException, StaleElementReferenceException)
+        ).until(comic_image_ready(previous_src))
+    except TimeoutException:
         return None
 
 
-def download_image(url: str, output_path: Path) -> bool:
+def create_session(workers: int = DEFAULT_DOWNLOAD_WORKERS) -> requests.Session:
+    """Create a requests session whose connection pool fits all download workers."""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=max(10, workers))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+def fetch_image(url: str, session: Optional[requests.Session] = None
+                ) -> tuple[Optional[bytes], Optional[str]]:
     """
-    Download an image from URL to output path.
+    Stream an image into memory, hashing it as the chunks arrive.
+
+    Args:
+        url: Image URL
+        session: Optional pooled session (a one-off request is made otherwise)
 
     Returns:
-        True if successful, False otherwise
+        (image_data, md5_hash) tuple, or (None, None) if the download failed
+        or the image is too small
     """
     try:
-        response = requests.get(url, headers=HEADERS, timeout=DOWNLOAD_TIMEOUT)
-        response.raise_for_status()
+        with metrics.span("download") as span:
+            if session:
+                response = session.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
+            else:
+                response = requests.get(url, headers=HEADERS, timeout=DOWNLOAD_TIMEOUT, stream=True)
 
-        img_data = response.content
+            with response:
+                response.raise_for_status()
+
+                buffer = io.BytesIO()
+                digest = hashlib.md5()
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    buffer.write(chunk)
+                    digest.update(chunk)
+            span.bytes = buffer.tell()
+
+        img_data = buffer.getvalue()
 
         # Validate file size
         if len(img_data) < MIN_FILE_SIZE:
             print(f"  [WARN] Image too small ({len(img_data)} bytes)")
-            return False
+            return None, None
 
-        # Create parent directories if needed
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save image
-        with open(output_path, "wb") as f:
-            f.write(img_data)
-
-        return True
+        return img_data, digest.hexdigest()
 
     except requests.RequestException as e:
         print(f"  [FAIL] Download error: {e}")
-        return False
+        return None, None
+
+
+def write_atomic(output_path: Path, data: bytes):
+    """Write data to a temporary file and rename it into place."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_name(output_path.name + PART_SUFFIX)
+
+    with open(part_path, "wb") as f:
+        f.write(data)
+    os.replace(part_path, output_path)
+
+
+def ingest_image(url: str, output_path: Path, session: Optional[requests.Session] = None,
+                 accept: Optional[Callable[[str], bool]] = None,
+                 image_data: Optional[bytes] = None) -> tuple[str, Optional[str]]:
+    """
+    Download, validate, hash and save a page in a single pass.
+
+    The image is streamed into memory and hashed incrementally, its
+    dimensions are read from the buffered header, and only an accepted
+    image is written - once, atomically. Nothing is written for a failed,
+    invalid or rejected image.
+
+    Args:
+        url: Image URL
+        output_path: Destination file
+        session: Optional pooled session
+        accept: Optional check run on the hash before writing (e.g. duplicate
+            detection); returning False rejects the image
+        image_data: Image bytes already captured from the browser; skips
+            the download
+
+    Returns:
+        (status, md5_hash) tuple where status is "ok", "fail" (download),
+        "invalid" (validation) or "rejected" (accept returned False)
+    """
+    if image_data is None:
+        img_data, file_hash = fetch_image(url, session)
+        if img_data is None:
+            metrics.count("pages_fail")
+            return "fail", None
+    else:
+        img_data, file_hash = image_data, get_image_hash(image_data)
+        if len(img_data) < MIN_FILE_SIZE:
+            print(f"  [WARN] Image too small ({len(img_data)} bytes)")
+            metrics.count("pages_invalid")
+            return "invalid", file_hash
+
+    with metrics.span("validate"):
+        valid = validate_downloaded_image(img_data)
+    if not valid:
+        metrics.count("pages_invalid")
+        return "invalid", file_hash
+
+    if accept and not accept(file_hash):
+        return "rejected", file_hash
+
+    try:
+        with metrics.span("write") as span:
+            write_atomic(output_path, img_data)
+            span.bytes = len(img_data)
     except (IOError, OSError) as e:
         print(f"  [FAIL] File save error: {e}")
-        return False
+        metrics.count("pages_fail")
+        return "fail", file_hash
 
+    metrics.count("pages_ok")
+    return "ok", file_hash
 
-def validate_downloaded_image(image_path: Path) -> bool:
+
+def validate_downloaded_image(image: Path | bytes) -> bool:
     """
-    Validate downloaded image using PIL.
+    Validate a downloaded image using PIL.
 
     Checks that the image can be opened and has reasonable dimensions.
+    Accepts a file path or the image bytes; PIL only parses the header,
+    so in-memory images are checked without decoding or touching disk.
     """
     try:
-        with Image.open(image_path) as img:
+        source = io.BytesIO(image) if isinstance(image, bytes) else image
+        with Image.open(source) as img:
             width, height = img.size
             aspect_ratio = width / height
 
@@ -256,20 +525,687 @@ def validate_downloaded_image(image_path: Path) -> bool:
         return False
 
 
-def navigate_to_next_page(driver) -> tuple[bool, Optional[str], Optional[int], Optional[str]]:
+def image_extension(url: str) -> str:
+    """Guess a page image's file extension from its URL."""
+    if ".png" in url:
+        return ".png"
+    if ".webp" in url:
+        return ".webp"
+    return ".jpg"
+
+
+def build_reader_url(url: str) -> str:
+    """Return the reader URL in "All pages" + "High Quality" mode."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query.update(ALL_PAGES_PARAMS)
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+def clean_page_urls(urls: list) -> list[str]:
+    """Keep usable comic page URLs, in order and without repeats."""
+    pages = []
+    seen = set()
+
+    for url in urls:
+        if not isinstance(url, str) or not url.startswith(("http://", "https://")):
+            continue
+        if any(pattern in url.lower() for pattern in EXCLUDE_IMAGE_PATTERNS):
+            continue
+        if url not in seen:
+            seen.add(url)
+            pages.append(url)
+
+    return pages
+
+
+def extract_page_urls_from_html(html: str) -> list[str]:
+    """
+    Extract the ordered page image list from reader HTML.
+
+    Prefers the reader's inline `lstImages.push(...)` list and falls back
+    to blogspot <img> tags in document order.
+    """
+    urls = PAGE_LIST_PATTERN.findall(html)
+    if not urls:
+        urls = IMG_SRC_PATTERN.findall(html)
+    return clean_page_urls(urls)
+
+
+# Returns the reader's page list, or every blogspot page image in DOM order
+PAGE_LIST_SCRIPT = """
+if (Array.isArray(window.lstImages) && window.lstImages.length) {
+    return window.lstImages.slice();
+}
+const root = document.querySelector('#divImage') || document;
+return Array.from(root.querySelectorAll('img'))
+    .map(img => img.getAttribute('data-src') || img.currentSrc || img.src || '')
+    .filter(src => /blogspot\\.com/i.test(src));
+"""
+
+
+def extract_page_urls_http(url: str, session: requests.Session,
+                           limiter: Optional[TokenBucket] = None) -> list[str]:
+    """
+    Load the reader once over plain HTTP and extract every page URL.
+
+    Args:
+        url: Issue URL
+        session: HTTP session
+        limiter: Politeness limiter for the comic host
+
+    Returns:
+        Ordered page URLs, or an empty list if extraction failed
+    """
+    if limiter:
+        limiter.acquire()
+
+    try:
+        response = session.get(build_reader_url(url), timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"[INFO] Plain HTTP reader load failed: {e}")
+        return []
+
+    return extract_page_urls_from_html(response.text)
+
+
+def extract_page_urls_browser(driver) -> list[str]:
+    """
+    Extract every page URL from a reader already loaded in "All pages" mode.
+
+    Returns:
+        Ordered page URLs, or an empty list if extraction failed
+    """
+    try:
+        urls = driver.execute_script(PAGE_LIST_SCRIPT) or []
+    except Exception as e:
+        print(f"[INFO] Browser page list extraction failed: {e}")
+        return []
+
+    pages = clean_page_urls(urls)
+    if not pages:
+        pages = extract_page_urls_from_html(driver.page_source)
+    return pages
+
+
+class PageJournal:
+    """
+    Append-only per-page log of an issue (journal.jsonl next to metadata.json).
+
+    A line is appended as soon as each page lands, so an interrupted scrape
+    loses nothing: the next run knows every finished page and its hash
+    without re-reading files, and can jump straight to the first missing
+    page. A final line marks the issue complete. Entries whose file no
+    longer exists are ignored on load. Issues scraped before the journal
+    existed are seeded from their metadata.json in memory only; the
+    journal file is written on the first real append or completion, so
+    merely loading a journal (e.g. while planning a volume) never writes.
+    A legacy metadata.json that lists every page up to its recorded
+    total_pages counts as a completed issue.
+    """
+
+    def __init__(self, issue_dir: Path):
+        self.path = issue_dir / JOURNAL_FILENAME
+        self.pages_dir = issue_dir / "pages"
+        self.pages = {}  # page_number -> page entry
+        self.total_pages = None  # Set once the issue was completed
+        self.completed_pages = []  # Page numbers kept when the issue was completed
+        self._seeded = []  # Records seeded from metadata.json, not yet written
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line from a crash
+                    if "page_number" in record:
+                        self.pages[record["page_number"]] = record
+                    elif record.get("complete"):
+                        self.total_pages = record["total_pages"]
+                        self.completed_pages = record.get("pages", [])
+        else:
+            self._seed_from_metadata(issue_dir / "metadata.json")
+
+        self.pages = {n: page for n, page in self.pages.items()
+                      if (self.pages_dir / page["filename"]).exists()}
+        if self.total_pages is not None:
+            self.pages = {n: page for n, page in self.pages.items() if n <= self.total_pages}
+
+    def _seed_from_metadata(self, metadata_path: Path):
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (IOError, OSError, ValueError):
+            return
+
+        for page in metadata.get("pages", []):
+            if page.get("page_number") and page.get("filename") and page.get("hash"):
+                self.pages[page["page_number"]] = page
+                self._seeded.append(page)
+
+        # Scraped to the end: every page up to the recorded count is listed
+        total_pages = metadata.get("total_pages")
+        if (isinstance(total_pages, int) and total_pages > 0 and not metadata.get("failed_pages")
+                and sorted(self.pages) == list(range(1, total_pages + 1))):
+            self.total_pages = total_pages
+            self.completed_pages = sorted(self.pages)
+            self._seeded.append({"complete": True, "total_pages": total_pages,
+                                 "pages": self.completed_pages,
+                                 "completed_at": metadata.get("scraped_at")})
+
+    def _write(self, record: dict):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Seeded records go first, so the journal holds everything it knows
+        records, self._seeded = self._seeded + [record], []
+        with open(self.path, "a", encoding="utf-8") as f:
+            for entry in records:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def append(self, page: dict):
+        """Record a finished page, unless it is already journaled with the same file."""
+        with self._lock:
+            known = self.pages.get(page["page_number"])
+            if known and known["filename"] == page["filename"] and known["hash"] == page["hash"]:
+                return
+            self.pages[page["page_number"]] = page
+            self._write(page)
+
+    def mark_complete(self, total_pages: int):
+        """Record that the issue ended after `total_pages` pages."""
+        with self._lock:
+            self.total_pages = total_pages
+            self.completed_pages = sorted(n for n in self.pages if n <= total_pages)
+            self._write({"complete": True, "total_pages": total_pages,
+                         "pages": self.completed_pages,
+                         "completed_at": datetime.now().isoformat()})
+
+    @property
+    def complete(self) -> bool:
+        """True if the issue was completed and all its pages are still on disk."""
+        return (self.total_pages is not None
+                and all(n in self.pages for n in self.completed_pages))
+
+    def first_missing_page(self) -> int:
+        """Return the first page number with no finished page."""
+        page_num = 1
+        while page_num in self.pages:
+            page_num += 1
+        return page_num
+
+    def known_hashes(self) -> dict[str, str]:
+        """Return page hashes by filename."""
+        return {page["filename"]: page["hash"] for page in self.pages.values()}
+
+
+class RetryBudget:
+    """
+    Per-issue budget for retrying failed page downloads.
+
+    A page may be retried up to `attempts` times, waiting
+    base_delay * 2^n (capped at max_delay) before retry n + 1, and all
+    pages of the issue share `budget` retries. Thread-safe.
+    """
+
+    def __init__(self, budget: int = PAGE_RETRY_BUDGET, attempts: int = PAGE_RETRY_ATTEMPTS,
+                 base_delay: float = RETRY_BASE_DELAY, max_delay: float = RETRY_MAX_DELAY):
+        self.budget = budget
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def exhausted(self) -> bool:
+        with self._lock:
+            return self.used >= self.budget
+
+    def take(self, retries: int) -> bool:
+        """Claim a retry for a page that has already been retried `retries` times."""
+        with self._lock:
+            if retries >= self.attempts or self.used >= self.budget:
+                return False
+            self.used += 1
+        metrics.count("page_retries")
+        return True
+
+    def delay(self, retries: int) -> float:
+        """Seconds to wait before the next attempt of a page retried `retries` times."""
+        return min(self.max_delay, self.base_delay * 2 ** retries)
+
+
+def download_pages_parallel(page_urls: list[str], output_dir: Path, session: requests.Session,
+                            workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                            journal: Optional[PageJournal] = None
+                            ) -> tuple[list[dict], dict[int, str]]:
+    """
+    Download every page of an issue in parallel.
+
+    The URL list defines the issue's pages, so no issue-boundary
+    heuristics are needed. As in page-by-page mode (PagePipeline), the
+    first repeated image (same hash) ends the issue: it and every later
+    page are dropped, and pages not yet started are cancelled. The
+    duplicate check runs before a page is written (through ingest_image's
+    `accept`), against a hash -> page map shared by all workers that keeps
+    the lowest page number for each hash; a page is only removed again
+    when it turns out to lie past the cutoff. Pages that were already on
+    disk are never deleted.
+    Status lines are printed in page order as results become available.
+
+    Args:
+        page_urls: Ordered page image URLs
+        output_dir: Pages directory
+        session: Pooled HTTP session
+        workers: Parallel downloads
+        journal: The issue's page journal; finished pages are appended, and
+            existing pages take their hashes from it instead of being re-read
+
+    Returns:
+        (pages, failures) tuple: page entries for metadata.json, and
+        page number -> reason for pages that failed after their retries
+    """
+    known_hashes = journal.known_hashes() if journal else {}
+    retry = RetryBudget()
+    hash_pages = {}  # hash -> lowest page number with that image
+    hash_lock = threading.Lock()
+
+    def claim(file_hash: str, page_num: int) -> bool:
+        """Register a page's hash; False if a lower page has the same image."""
+        with hash_lock:
+            first_page = hash_pages.setdefault(file_hash, page_num)
+            if page_num < first_page:
+                hash_pages[file_hash] = page_num
+            return page_num <= first_page
+
+    def fetch(item):
+        page_num, page_url = item
+        filename = f"page_{page_num:03d}{image_extension(page_url)}"
+        output_path = output_dir / filename
+
+        if output_path.exists():
+            metrics.count("pages_skip")
+            file_hash = known_hashes.get(filename) or hash_file(output_path)
+            claim(file_hash, page_num)
+            return page_num, filename, page_url, file_hash, "skip"
+
+        retries = 0
+        while True:
+            status, file_hash = ingest_image(page_url, output_path, session,
+                                             accept=lambda h: claim(h, page_num))
+            if status != "fail" or not retry.take(retries):
+                return page_num, filename, page_url, file_hash, status
+
+            delay = retry.delay(retries)
+            print(f"[{page_num}] [RETRY] Download failed; retry {retries + 1} in {delay:.0f}s")
+            time.sleep(delay)
+            retries += 1
+
+    downloaded_pages = []
+    failures = {}
+    cutoff = None  # First duplicate page; it and everything after it are dropped
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        # Copy the caller's context so worker output follows its issue log
+        futures = [executor.submit(contextvars.copy_context().run, fetch, item)
+                   for item in enumerate(page_urls, 1)]
+        for future in futures:
+            if cutoff is not None:
+                if future.cancel():
+                    continue
+                _, filename, _, _, status = future.result()
+                if status == "ok":
+                    # Written this run past the end of the issue
+                    (output_dir / filename).unlink(missing_ok=True)
+                continue
+
+            page_num, filename, page_url, file_hash, status = future.result()
+            if status == "fail":
+                print(f"[{page_num}] [FAIL] Download failed")
+                failures[page_num] = "Download failed"
+                continue
+            if status == "invalid":
+                print(f"[{page_num}] [FAIL] Image validation failed")
+                failures[page_num] = "Image validation failed"
+                continue
+
+            # Lower pages are collected first, so their claims are final here
+            if status == "rejected" or hash_pages[file_hash] != page_num:
+                print(f"[{page_num}] [WARN] Duplicate of page {hash_pages[file_hash]} - "
+                      f"end of issue after page {page_num - 1}")
+                metrics.count("duplicates")
+                if status == "ok":
+                    # Written before the lower page with the same image finished
+                    (output_dir / filename).unlink(missing_ok=True)
+                cutoff = page_num
+                continue
+
+            print(f"[{page_num}] [{'SKIP' if status == 'skip' else 'OK'}] "
+                  f"{'Already downloaded' if status == 'skip' else 'Downloaded'}")
+            page = {
+                "page_number": page_num,
+                "filename": filename,
+                "url": page_url,
+                "hash": file_hash
+            }
+            downloaded_pages.append(page)
+            if journal:
+                journal.append(page)
+
+    return downloaded_pages, failures
+
+
+class PagePipeline:
+    """
+    Downloads, validates and hashes pages while the browser keeps navigating.
+
+    The navigation loop submit()s each page as soon as its image URL is
+    known; a bounded queue feeds a pool of workers, so page N downloads
+    while the browser turns to page N+1, and navigation blocks only when
+    the queue is full.
+
+    A failed download is treated as transient: the page goes into a retry
+    queue and a separate retry worker downloads it again after an
+    exponential backoff, within the issue's RetryBudget. A page that runs
+    out of retries is reported in `failures` and the rest of the issue
+    carries on; only once the whole budget is spent does a failure end
+    the issue. A duplicate image or failed validation sets a cutoff at
+    that page and the `stopped` event, which the navigation loop checks
+    before turning the next page. close() waits for queued pages and
+    pending retries and removes any page this run wrote at or past the
+    cutoff. Every accepted page is appended to the issue's journal as it
+    lands.
+    """
+
+    def __init__(self, session: requests.Session, workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                 queue_size: int = PAGE_QUEUE_SIZE,
+                 journal: Optional[PageJournal] = None,
+                 retry: Optional[RetryBudget] = None):
+        self.session = session
+        self.journal = journal
+        self.known_hashes = journal.known_hashes() if journal else {}
+        self.workers = max(1, workers)
+        self.retry = retry or RetryBudget()
+        self.stopped = threading.Event()
+        self.cutoff = None  # First page that ended the issue
+        self.failed = False  # A page failed (as opposed to a duplicate ending the issue)
+        self.failures = {}  # page_number -> reason, for pages given up on
+        self.pages = dict(journal.pages) if journal else {}  # page_number -> metadata entry
+        self.last_submitted = 0
+        self._hashes = {}  # hash -> page_number
+        self._written = {}  # page_number -> path written this run
+        self._lock = threading.Lock()
+
+        # Hashes from a previous run count for duplicate detection right away
+        for filename, file_hash in self.known_hashes.items():
+            match = re.search(r'page_(\d+)', filename)
+            if match:
+                self._hashes.setdefault(file_hash, int(match.group(1)))
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._retries = []  # Heap of (due_time, page_num, retries, url, output_path)
+        self._retry_ready = threading.Condition()
+        self._closing = False
+        self._executor = ThreadPoolExecutor(max_workers=self.workers + 1)
+        self._futures = [self._executor.submit(contextvars.copy_context().run, self._consume)
+                         for _ in range(self.workers)]
+        self._retry_future = self._executor.submit(contextvars.copy_context().run, self._retry_loop)
+
+    def submit(self, page_num: int, url: str, output_path: Path,
+               image_data: Optional[bytes] = None):
+        """
+        Queue a page, blocking while the queue is full.
+
+        `image_data` (bytes captured from the browser) is stored as is;
+        otherwise the page is downloaded from `url`.
+        """
+        self.last_submitted = max(self.last_submitted, page_num)
+        with metrics.span("queue_wait"):
+            self._queue.put((page_num, url, output_path, image_data))
+
+    def _stop(self, page_num: int):
+        """Cut the issue off at `page_num` and signal navigation to stop."""
+        with self._lock:
+            if self.cutoff is None or page_num < self.cutoff:
+                self.cutoff = page_num
+        self.stopped.set()
+
+    def _past_cutoff(self, page_num: int) -> bool:
+        with self._lock:
+            return self.cutoff is not None and page_num >= self.cutoff
+
+    def _consume(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            try:
+                self._process(*item)
+            except Exception as e:
+                print(f"[{item[0]}] [FAIL] {e}")
+                self.failed = True
+                self._stop(item[0])
+
+    def _retry_loop(self):
+        """Download pages from the retry queue once their backoff has passed."""
+        while True:
+            with self._retry_ready:
+                while True:
+                    if self._retries:
+                        wait = self._retries[0][0] - time.monotonic()
+                        if wait <= 0:
+                            _, page_num, retries, url, output_path = heapq.heappop(self._retries)
+                            break
+                        self._retry_ready.wait(wait)
+                    elif self._closing:
+                        return
+                    else:
+                        self._retry_ready.wait()
+
+            try:
+                self._process(page_num, url, output_path, retries=retries)
+            except Exception as e:
+                print(f"[{page_num}] [FAIL] {e}")
+                self.failed = True
+                self._stop(page_num)
+
+    def _page_failed(self, page_num: int, url: str, output_path: Path, retries: int, reason: str):
+        """Queue a failed page for another attempt, or give up on it."""
+        if self._past_cutoff(page_num):
+            return
+
+        if self.retry.take(retries):
+            delay = self.retry.delay(retries)
+            print(f"[{page_num}] [RETRY] {reason}; retry {retries + 1} in {delay:.0f}s")
+            with self._retry_ready:
+                heapq.heappush(self._retries,
+                               (time.monotonic() + delay, page_num, retries + 1, url, output_path))
+                self._retry_ready.notify()
+            return
+
+        metrics.count("pages_gave_up")
+        self.failed = True
+        with self._lock:
+            self.failures[page_num] = reason
+
+        if self.retry.exhausted:
+            # Every retry is spent: the host is failing, not a single page
+            print(f"[{page_num}] [FAIL] {reason}; retry budget exhausted - stopping")
+            self._stop(page_num)
+        else:
+            print(f"[{page_num}] [FAIL] {reason} after {retries + 1} attempts")
+
+    def _claim_hash(self, file_hash: str, page_num: int) -> bool:
+        """
+        Register a page's hash; returns False if it duplicates an earlier page.
+
+        Pages can finish out of order, so when an earlier page turns out to
+        share the hash of a later one that was already kept, the later one
+        becomes the cutoff instead.
+        """
+        with self._lock:
+            first_page = self._hashes.setdefault(file_hash, page_num)
+            if page_num < first_page:
+                self._hashes[file_hash] = page_num
+            duplicate_page = max(first_page, page_num) if first_page != page_num else None
+
+        if duplicate_page is not None:
+            metrics.count("duplicates")
+            print(f"[{duplicate_page}] [WARN] Duplicate detected (image already downloaded)")
+            print(f"[{duplicate_page}] [WARN] This is likely the next issue - stopping")
+            self._stop(duplicate_page)
+
+        return duplicate_page != page_num
+
+    def _record(self, page_num: int, url: str, output_path: Path, file_hash: str):
+        page = {
+            "page_number": page_num,
+            "filename": output_path.name,
+            "url": url,
+            "hash": file_hash
+        }
+        with self._lock:
+            self.pages[page_num] = page
+        if self.journal:
+            self.journal.append(page)
+
+    def _process(self, page_num: int, url: str, output_path: Path,
+                 image_data: Optional[bytes] = None, retries: int = 0):
+        if self._past_cutoff(page_num):
+            return
+
+        if output_path.exists():
+            print(f"[{page_num}] [SKIP] Already downloaded")
+            metrics.count("pages_skip")
+            file_hash = self.known_hashes.get(output_path.name) or hash_file(output_path)
+            if self._claim_hash(file_hash, page_num):
+                self._record(page_num, url, output_path, file_hash)
+            return
+
+        if image_data is None:
+            print(f"[{page_num}] Downloading: {url[:70]}...")
+        start_time = time.perf_counter()
+        status, file_hash = ingest_image(url, output_path, self.session,
+                                         accept=lambda h: self._claim_hash(h, page_num),
+                                         image_data=image_data)
+
+        if status == "ok":
+            with self._lock:
+                self._written[page_num] = output_path
+            self._record(page_num, url, output_path, file_hash)
+            print(f"[{page_num}] [OK] {'Captured from browser' if image_data else 'Downloaded'}")
+            metrics.page_line(f"[{page_num}] {output_path.stat().st_size / 1000:.0f} KB "
+                              f"ingested in {time.perf_counter() - start_time:.2f}s "
+                              f"(queued: {self._queue.qsize()})")
+        elif status == "fail":
+            self._page_failed(page_num, url, output_path, retries, "Download failed")
+        elif status == "invalid":
+            print(f"[{page_num}] [FAIL] Image validation failed")
+            self.failed = True
+            self._stop(page_num)
+
+    def close(self) -> tuple[list[dict], int]:
+        """
+        Wait for queued pages and pending retries, then drop everything at
+        or past the cutoff.
+
+        Returns:
+            (pages, last_page) tuple: metadata entries for the issue's kept
+            pages, and the last kept page number
+        """
+        for _ in self._futures:
+            self._queue.put(None)
+        for future in self._futures:
+            future.result()
+
+        # Workers are done; only the retry worker itself can queue more retries now
+        with self._retry_ready:
+            self._closing = True
+            self._retry_ready.notify()
+        self._retry_future.result()
+        self._executor.shutdown()
+
+        last_page = self.last_submitted or max(self.pages, default=0)
+        if self.cutoff is not None:
+            last_page = min(last_page, self.cutoff - 1)
+            for page_num, path in self._written.items():
+                if page_num > last_page:
+                    path.unlink(missing_ok=True)  # Remove duplicate or post-cutoff page
+            self.pages = {n: page for n, page in self.pages.items() if n <= last_page}
+            self.failures = {n: reason for n, reason in self.failures.items() if n <= last_page}
+
+        return [self.pages[n] for n in sorted(self.pages)], last_page
+
+
+def save_issue_metadata(volume_name: str, issue_number: str, url: str, total_pages: int,
+                        downloaded_pages: list[dict], output_dir: Path,
+                        failed_pages: Optional[dict[int, str]] = None) -> Path:
+    """
+    Write metadata.json next to the pages directory and return its path.
+
+    `failed_pages` (page number -> reason) lists pages that could not be
+    downloaded; they are retried by the next run.
+    """
+    metadata = {
+        "volume": volume_name,
+        "issue": issue_number,
+        "url": url,
+        "total_pages": total_pages,
+        "pages": downloaded_pages,
+        "scraped_at": datetime.now().isoformat(),
+        "output_directory": str(output_dir)
+    }
+    if failed_pages:
+        metadata["failed_pages"] = [{"page_number": n, "reason": reason}
+                                    for n, reason in sorted(failed_pages.items())]
+
+    metadata_path = output_dir.parent / "metadata.json"
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2, ensure_ascii=False)
+
+    return metadata_path
+
+
+def print_scrape_summary(volume_name: str, issue_number: str, total_pages: int,
+                         output_dir: Path, metadata_path: Path):
+    """Print the end-of-issue summary."""
+    print("\n" + "=" * 50)
+    print("Scrape Summary")
+    print("=" * 50)
+    print(f"Volume: {volume_name}")
+    print(f"Issue: {issue_number}")
+    print(f"Total pages: {total_pages}")
+    print(f"Output directory: {output_dir.absolute()}")
+    print(f"Metadata saved: {metadata_path.absolute()}")
+    print("=" * 50)
+
+
+def navigate_to_next_page(driver, timeout: float = PAGE_TURN_TIMEOUT,
+                          limiter: Optional[TokenBucket] = None
+                          ) -> tuple[bool, Optional[str], Optional[int], Optional[str]]:
     """
     Click the "Next" button and detect if we've moved to a new issue.
 
+    Waits until the next comic image has replaced the current one (or
+    `timeout` passes) instead of sleeping a fixed delay. The click waits
+    for `limiter` first, if given.
+
     Returns:
-        (success, issue_number, page_fragment, page_title) tuple where:
-        - success: True if navigation succeeded
+        (status, issue_number, page_fragment, page_title) tuple where:
+        - status: NAV_OK if the next page loaded, NAV_END if there is no
+          usable "Next" button (the end of the issue), NAV_TIMEOUT if the
+          next page did not load within `timeout`, NAV_ERROR on any other
+          error
         - issue_number: Current issue number after navigation, or None
         - page_fragment: Page number from URL fragment (e.g., #13 -> 13), or None
         - page_title: Page title (may contain issue info), or None
     """
-    # Get current URL before navigation
+    # Get current URL and comic image before navigation
     current_url = driver.current_url
     current_issue = extract_issue_number_from_url(current_url)
+    current_image = find_comic_image(driver)
 
     try:
         # Look for next button with multiple selectors
@@ -295,24 +1231,27 @@ def navigate_to_next_page(driver) -> tuple[bool, Optional[str], Optional[int], O
                 continue
 
         if not next_btn:
-            return (False, current_issue, None, None)
+            return (NAV_END, current_issue, None, None)
 
         # Check if button is disabled
         class_attr = next_btn.get_attribute("class") or ""
         style_attr = next_btn.get_attribute("style") or ""
 
         if "disabled" in class_attr.lower():
-            return (False, current_issue, None, None)
+            return (NAV_END, current_issue, None, None)
         if "display: none" in style_attr or "display:none" in style_attr:
-            return (False, current_issue, None, None)
+            return (NAV_END, current_issue, None, None)
 
         # Click the button
+        if limiter:
+            limiter.acquire()
         driver.execute_script("arguments[0].scrollIntoView();", next_btn)
-        time.sleep(0.5)
         next_btn.click()
 
-        # Wait for page to load
-        time.sleep(REQUEST_DELAY)
+        # Wait for the next page's image to load
+        if not wait_for_comic_image(driver, previous_src=current_image, timeout=timeout):
+            print(f"  [WARN] Next page did not load within {timeout:.0f}s")
+            return (NAV_TIMEOUT, extract_issue_number_from_url(driver.current_url), None, None)
 
         # Get new URL after navigation
         new_url = driver.current_url
@@ -336,33 +1275,367 @@ def navigate_to_next_page(driver) -> tuple[bool, Optional[str], Optional[int], O
             print(f"  [DEBUG] URL: {new_url[:80]}...")
             print(f"  [DEBUG] Title: {page_title[:60] if page_title else 'N/A'}...")
 
-        return (True, new_issue, page_fragment, page_title)
+        return (NAV_OK, new_issue, page_fragment, page_title)
 
     except Exception as e:
         print(f"  [WARN] Navigation error: {e}")
-        return (False, current_issue, None, None)
+        return (NAV_ERROR, current_issue, None, None)
+
+
+def resolve_chromedriver(refresh: bool = False) -> Optional[str]:
+    """
+    Return the chromedriver path, resolving it with webdriver-manager only when needed.
+
+    The resolved path is cached in DRIVER_CACHE_PATH so later launches skip
+    webdriver-manager's version checks (and keep working offline). Pass
+    refresh=True to resolve again, e.g. after a Chrome update.
+
+    Returns:
+        Path to chromedriver, or None to let Selenium Manager locate it
+    """
+    if not refresh and DRIVER_CACHE_PATH.exists():
+        try:
+            with open(DRIVER_CACHE_PATH, "r", encoding="utf-8") as f:
+                cached_path = json.load(f).get("path")
+            if cached_path and Path(cached_path).exists():
+                return cached_path
+        except (IOError, OSError, ValueError):
+            pass
+
+    try:
+        driver_path = ChromeDriverManager().install()
+    except Exception as e:
+        print(f"[WARN] Could not resolve chromedriver with webdriver-manager: {e}")
+        return None
+
+    DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(DRIVER_CACHE_PATH, "w", encoding="utf-8") as f:
+        json.dump({"path": driver_path, "resolved_at": datetime.now().isoformat()}, f, indent=2)
+
+    return driver_path
+
+
+class ResponseCapture:
+    """
+    Reads image responses the browser already loaded, via Chrome DevTools.
+
+    The driver must be started with performance logging (setup_driver with
+    capture=True). body() drains the log for image requests, maps their
+    URLs (including pre-redirect ones) to DevTools request ids and fetches
+    the buffered bytes with Network.getResponseBody, so the page is not
+    downloaded a second time with a different User-Agent and cookies.
+    Only call it from the thread that drives the browser.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self._request_ids = OrderedDict()  # url -> DevTools request id
+        driver.execute_cdp_cmd("Network.enable", {
+            "maxResourceBufferSize": CAPTURE_RESOURCE_BUFFER,
+            "maxTotalBufferSize": CAPTURE_TOTAL_BUFFER,
+        })
+
+    def _track(self, url: str, request_id: str):
+        self._request_ids[url] = request_id
+        self._request_ids.move_to_end(url)
+        while len(self._request_ids) > CAPTURE_TRACKED_REQUESTS:
+            self._request_ids.popitem(last=False)
+
+    def _drain(self):
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+
+            params = message.get("params", {})
+            if params.get("type") != "Image":
+                continue
+            if message.get("method") == "Network.requestWillBeSent":
+                self._track(params["request"]["url"], params["requestId"])
+            elif message.get("method") == "Network.responseReceived":
+                self._track(params["response"]["url"], params["requestId"])
 
+    def body(self, url: str) -> Optional[bytes]:
+        """
+        Return the loaded response body for `url`.
+
+        Returns:
+            The image bytes, or None if the browser has no (more) body for it
+        """
+        self._drain()
+        request_id = self._request_ids.get(url)
+        if not request_id:
+            return None
 
-def setup_driver(headless: bool = False) -> webdriver.Chrome:
-    """Set up and return Chrome WebDriver."""
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException:
+            return None
+
+        if result.get("base64Encoded"):
+            return base64.b64decode(result["body"])
+        return result["body"].encode("utf-8")
+
+
+def build_blocked_urls(extra_patterns: Optional[list[str]] = None,
+                       allowed_hosts: Optional[list[str]] = None) -> list[str]:
+    """
+    Build the list of URL patterns the browser should not load.
+
+    Starts from BLOCKED_URL_PATTERNS plus `extra_patterns` and drops any
+    pattern that would block one of the reader's allowed hosts
+    (READER_ALLOWED_HOSTS plus `allowed_hosts`).
+    """
+    hosts = READER_ALLOWED_HOSTS + (allowed_hosts or [])
+    samples = [f"https://{prefix}{host}/" for host in hosts for prefix in ("", "www.")]
+
+    patterns = []
+    for pattern in BLOCKED_URL_PATTERNS + (extra_patterns or []):
+        if any(fnmatch.fnmatchcase(sample, pattern) for sample in samples):
+            print(f"[WARN] Not blocking '{pattern}': it matches a host the reader needs")
+            continue
+        if pattern not in patterns:
+            patterns.append(pattern)
+
+    return patterns
+
+
+def enable_resource_blocking(driver, patterns: list[str]):
+    """Block matching requests in the driver's current tab via Chrome DevTools."""
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def setup_driver(headless: bool = False, profile_dir: Optional[Path] = None,
+                 debugger_address: Optional[str] = None,
+                 load_images: bool = True, capture: bool = False) -> webdriver.Chrome:
+    """
+    Set up and return Chrome WebDriver.
+
+    Args:
+        headless: Run browser in headless mode
+        profile_dir: Optional persistent user-data dir, so the site's static
+            assets stay in the browser's HTTP cache between runs
+        debugger_address: Attach to an already running Chrome ("host:port")
+            instead of launching one; browser options are then ignored
+        load_images: Let the browser fetch and decode images. Pages are
+            downloaded separately, so this can be turned off; the returned
+            driver's `images_decoded` attribute tells image waits which mode
+            is active (an attached driver inherits the launching browser's)
+        capture: Enable performance logging for ResponseCapture
+    """
+    start_time = time.monotonic()
     options = Options()
+    options.page_load_strategy = PAGE_LOAD_STRATEGY
+
+    if capture:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
-    if headless:
+    if debugger_address:
+        options.debugger_address = debugger_address
+    elif headless:
         options.add_argument("--headless")
 
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
+    if not debugger_address:
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--window-size=1920,1080")
+        if not load_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+
+    if profile_dir and not debugger_address:
+        Path(profile_dir).mkdir(parents=True, exist_ok=True)
+        options.add_argument(f"--user-data-dir={Path(profile_dir).resolve()}")
+
+    driver_path = resolve_chromedriver()
+    resolved_time = time.monotonic()
 
     driver = webdriver.Chrome(
-        service=Service(ChromeDriverManager().install()),
+        service=Service(driver_path) if driver_path else Service(),
         options=options
     )
+    driver.images_decoded = load_images
+
+    metrics.observe("browser_start", time.monotonic() - start_time)
+    action = "Attached to browser" if debugger_address else "Browser started"
+    print(f"[INFO] {action} in {time.monotonic() - start_time:.2f}s "
+          f"(driver resolve {resolved_time - start_time:.2f}s)")
 
     return driver
 
 
+class BrowserSession:
+    """
+    Long-lived Chrome session shared across issues.
+
+    get() hands out the same driver until it has served `max_pages` page
+    loads or fails a health check, then transparently starts a new one.
+    Callers report page loads with record_page() and call discard() after
+    a browser error so the next get() starts fresh.
+
+    With `debugger_address` the session attaches to a Chrome started by
+    SharedChrome and drives its own tab instead of launching a browser;
+    recycling then only replaces the tab.
+
+    `blocked_urls` are blocked in every tab the session opens. With
+    `capture`, `capture` holds a ResponseCapture for the current driver.
+    """
+
+    def __init__(self, headless: bool = False, max_pages: int = DRIVER_RECYCLE_PAGES,
+                 profile_dir: Optional[Path] = None, debugger_address: Optional[str] = None,
+                 blocked_urls: Optional[list[str]] = None, load_images: bool = True,
+                 capture: bool = False):
+        self.headless = headless
+        self.max_pages = max_pages
+        self.profile_dir = profile_dir
+        self.debugger_address = debugger_address
+        self.blocked_urls = blocked_urls
+        self.load_images = load_images
+        self.capture_images = capture
+        self.capture = None
+        self.driver = None
+        self.pages = 0
+        self.starts = 0
+
+    def get(self) -> webdriver.Chrome:
+        """Return a healthy driver, starting or recycling Chrome as needed."""
+        if self.driver and self.pages >= self.max_pages:
+            print(f"[INFO] Recycling browser after {self.pages} pages")
+            self.discard()
+        elif self.driver and not self.is_healthy():
+            print("[WARN] Browser session is unresponsive; restarting")
+            self.discard()
+
+        if not self.driver:
+            if self.debugger_address:
+                self.driver = setup_driver(debugger_address=self.debugger_address,
+                                           load_images=self.load_images,
+                                           capture=self.capture_images)
+                self.driver.switch_to.new_window("tab")
+            else:
+                self.driver = setup_driver(headless=self.headless, profile_dir=self.profile_dir,
+                                           load_images=self.load_images,
+                                           capture=self.capture_images)
+            if self.blocked_urls:
+                enable_resource_blocking(self.driver, self.blocked_urls)
+            if self.capture_images:
+                self.capture = ResponseCapture(self.driver)
+            self.pages = 0
+            self.starts += 1
+
+        return self.driver
+
+    def is_healthy(self) -> bool:
+        """Check that the browser still answers WebDriver commands."""
+        try:
+            self.driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            return False
+
+    def record_page(self, count: int = 1):
+        """Count page loads towards recycling."""
+        self.pages += count
+
+    def discard(self):
+        """Quit the current browser, ignoring errors from a crashed session."""
+        if self.driver:
+            try:
+                if self.debugger_address:
+                    # Close our tab; quitting an attached session leaves Chrome running
+                    self.driver.close()
+                self.driver.quit()
+            except WebDriverException:
+                pass
+            self.driver = None
+            self.capture = None
+
+    def quit(self):
+        """Shut the session down."""
+        self.discard()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.quit()
+
+
+class SharedChrome:
+    """
+    One Chrome process whose tabs are driven by several BrowserSessions.
+
+    The host driver launches Chrome and keeps its first tab open; session()
+    returns a BrowserSession that attaches to the same browser through its
+    DevTools address, so N concurrent issues cost N tabs rather than N
+    Chrome processes.
+    """
+
+    def __init__(self, headless: bool = False, profile_dir: Optional[Path] = None,
+                 blocked_urls: Optional[list[str]] = None, load_images: bool = True,
+                 capture: bool = False):
+        self.driver = setup_driver(headless=headless, profile_dir=profile_dir,
+                                   load_images=load_images)
+        self.debugger_address = self.driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        self.blocked_urls = blocked_urls
+        self.load_images = load_images
+        self.capture = capture
+
+    def session(self, max_pages: int = DRIVER_RECYCLE_PAGES) -> BrowserSession:
+        """Return a session that drives its own tab in this browser."""
+        return BrowserSession(max_pages=max_pages, debugger_address=self.debugger_address,
+                              blocked_urls=self.blocked_urls, load_images=self.load_images,
+                              capture=self.capture)
+
+    def quit(self):
+        """Shut the browser down."""
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.quit()
+
+
+class IssueLogRouter(io.TextIOBase):
+    """
+    sys.stdout replacement that sends each issue's output to its own log.
+
+    Code running inside capture() writes to the given file; everything else
+    goes to the original stream, so parallel issues do not interleave
+    output. The target is a context variable, so worker pools that run
+    tasks in a copy of the submitting context (PagePipeline,
+    download_pages_parallel) log to the same issue.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._log = contextvars.ContextVar("issue_log", default=None)
+
+    def write(self, text: str) -> int:
+        return (self._log.get() or self.stream).write(text)
+
+    def flush(self):
+        (self._log.get() or self.stream).flush()
+
+    @contextlib.contextmanager
+    def capture(self, log_path: Path):
+        """Route output in the current context to `log_path` (appending) while active."""
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(log_path, "a", encoding="utf-8") as f:
+            token = self._log.set(f)
+            try:
+                yield
+            finally:
+                self._log.reset(token)
+
+
 def sanitize_for_url(name: str) -> str:
     """
     Sanitize a string for use in readcomiconline.li URLs.
@@ -405,10 +1678,19 @@ def construct_comic_url(volume_name: str, issue_number: str) -> str:
     Example: "Absolute Batman" + "1" -> https://readcomiconline.li/Comic/Absolute-Batman/Issue-1
     """
     sanitized_volume = sanitize_for_url(volume_name)
-    url = f"https://{DEFAULT_COMIC_HOST}/Comic/{sanitized_volume}/Issue-{issue_number}"
+    url = f"{COMIC_BASE_URL}/Comic/{sanitized_volume}/Issue-{issue_number}"
     return url
 
 
+def issue_id_from_segment(segment: str) -> str:
+    """
+    Turn the issue part of a reader URL into an issue identifier.
+
+    Example: "Issue-12" -> "12", "Annual-1" -> "Annual-1"
+    """
+    return segment[len("Issue-"):] if segment.startswith("Issue-") else segment
+
+
 def extract_issue_number_from_url(url: str) -> Optional[str]:
     """
     Extract issue number from readcomiconline.li URL.
@@ -417,7 +1699,13 @@ def extract_issue_number_from_url(url: str) -> Optional[str]:
              -> "1"
     Example: "https://readcomiconline.li/Comic/Absolute-Batman/Issue-1#2"
              -> "1" (page fragments are ignored)
+    Example: "https://readcomiconline.li/Comic/Absolute-Batman/Annual-1"
+             -> "Annual-1"
     """
+    match = re.search(r'/Comic/[^/?#]+/([^/?#]+)', url)
+    if match:
+        return issue_id_from_segment(match.group(1))
+
     match = re.search(r'/Issue-([^/?#]+)', url)
     if match:
         return match.group(1)
@@ -479,18 +1767,110 @@ def has_issue_changed(driver: webdriver.Chrome, expected_issue: str) -> bool:
     return current_issue != expected_issue
 
 
+def jump_to_page(driver, page_num: int, timeout: float = PAGE_TURN_TIMEOUT,
+                 limiter: Optional[TokenBucket] = None) -> bool:
+    """
+    Jump the reader to a page through its "#N" URL fragment.
+
+    Returns:
+        True if the page's image loaded (and the page indicator, if any,
+        agrees), False otherwise
+    """
+    current_image = find_comic_image(driver)
+
+    if limiter:
+        limiter.acquire()
+    driver.execute_script("window.location.hash = arguments[0];", str(page_num))
+
+    if not wait_for_comic_image(driver, previous_src=current_image, timeout=timeout):
+        return False
+
+    current_page, _ = get_page_count_indicator(driver)
+    return current_page is None or current_page == page_num
+
+
+def click_reader_option(driver, xpath: str, timeout: float):
+    """
+    Click the first reader option matching `xpath`, if present.
+
+    The click may reload the reader, so wait for the comic image to be
+    ready again afterwards.
+    """
+    try:
+        buttons = driver.find_elements(By.XPATH, xpath)
+        if buttons:
+            buttons[0].click()
+            wait_for_comic_image(driver, timeout=timeout)
+    except Exception:
+        pass
+
+
+def scrape_page_list(volume_name: str, issue_number: str, url: str, page_urls: list[str],
+                     output_dir: Path, session: requests.Session,
+                     workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                     journal: Optional[PageJournal] = None):
+    """Download an extracted page list, then save metadata and print the summary."""
+    print(f"[INFO] Found {len(page_urls)} pages in the reader page list")
+    print("Starting parallel download...")
+    print("=" * 50)
+
+    downloaded_pages, failures = download_pages_parallel(page_urls, output_dir, session,
+                                                         workers, journal)
+    for failed_page, reason in sorted(failures.items()):
+        print(f"[FAIL] Page {failed_page}: {reason} (will be retried by the next run)")
+
+    # Failed pages still count towards the issue's length
+    total_pages = max([page["page_number"] for page in downloaded_pages] + list(failures), default=0)
+
+    # A duplicate cut the issue short at most; only failed pages leave it open
+    if journal and not failures:
+        journal.mark_complete(total_pages)
+    metadata_path = save_issue_metadata(volume_name, issue_number, url, total_pages,
+                                        downloaded_pages, output_dir, failures)
+    print_scrape_summary(volume_name, issue_number, total_pages, output_dir, metadata_path)
+
+
 def scrape_issue(volume_name: str, issue_number: str, url: Optional[str] = None,
-                 headless: bool = False, stop_at_next_issue: bool = True):
+                 headless: bool = False, stop_at_next_issue: bool = True,
+                 load_timeout: float = PAGE_LOAD_TIMEOUT,
+                 page_timeout: float = PAGE_TURN_TIMEOUT,
+                 fast: bool = False, workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                 browser: Optional[BrowserSession] = None,
+                 profile_dir: Optional[Path] = None,
+                 limiter: Optional[TokenBucket] = None,
+                 blocked_urls: Optional[list[str]] = None,
+                 load_images: bool = True,
+                 capture: bool = False):
     """
     Scrape all pages from a comic issue.
 
+    In fast mode the reader is loaded once in "All pages" mode (over plain
+    HTTP first, then in the browser), the ordered page URL list is
+    extracted and every page is downloaded in parallel. The page-by-page
+    "Next" loop is only used when extraction fails.
+
     Args:
         volume_name: Name of the comic volume
         issue_number: Issue number
         url: Optional URL override (auto-constructed if not provided)
         headless: Run browser in headless mode
         stop_at_next_issue: Stop when reaching next issue (default: True)
+        load_timeout: Max seconds to wait for the reader to show a comic image
+        page_timeout: Max seconds to wait for each page turn
+        fast: Extract all page URLs from one reader load
+        workers: Parallel page downloads (download/validate workers in the
+            page-by-page loop)
+        browser: Shared browser session (a private one is started and shut
+            down if not given)
+        profile_dir: Persistent browser profile for a private session
+        limiter: Politeness limiter for the comic host (shared across issues)
+        blocked_urls: URL patterns a private session blocks
+        load_images: Let a private session's browser load images
+        capture: Take page bytes from the browser's network layer in a
+            private session (a shared session decides this itself)
     """
+    start_time = time.monotonic()
+
     # Construct URL if not provided
     if not url:
         url = construct_comic_url(volume_name, issue_number)
@@ -506,61 +1886,83 @@ def scrape_issue(volume_name: str, issue_number: str, url: Optional[str] = None,
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Check for existing pages (resume capability)
-    existing_pages = sorted(output_dir.glob("page_*.jpg"))
-    if existing_pages:
-        # Extract page numbers from filenames to find the actual last page
-        page_numbers = []
-        for p in existing_pages:
-            match = re.search(r'page_(\d+)', p.name)
-            if match:
-                page_numbers.append(int(match.group(1)))
-
-        if page_numbers:
-            last_page = max(page_numbers)
-            print(f"[INFO] Found {len(existing_pages)} existing pages")
-            print(f"[INFO] Last page found: {last_page}")
-            print(f"[INFO] Resuming from page {last_page + 1}...")
-            start_page = last_page + 1
-        else:
-            start_page = 1
-    else:
-        start_page = 1
-
-    # Set up Selenium driver
-    driver = setup_driver(headless=headless)
+    # Resume from the issue's page journal
+    journal = PageJournal(output_dir.parent)
+    if journal.complete:
+        print(f"[SKIP] Issue already complete ({journal.total_pages} pages)")
+        return
+
+    start_page = journal.first_missing_page()
+    if journal.pages:
+        print(f"[INFO] Journal lists {len(journal.pages)} finished pages")
+        print(f"[INFO] Resuming from page {start_page}...")
+
+    session = create_session(workers)
+
+    # Fast path without a browser
+    if fast:
+        page_urls = extract_page_urls_http(url, session, limiter)
+        if page_urls:
+            scrape_page_list(volume_name, issue_number, url, page_urls, output_dir, session, workers,
+                             journal)
+            return
+        print("[INFO] No page list in plain HTTP response; trying the browser")
+
+    # Set up Selenium driver (reusing the shared session if given)
+    owns_browser = browser is None
+    if owns_browser:
+        browser = BrowserSession(headless=headless, profile_dir=profile_dir,
+                                 blocked_urls=blocked_urls, load_images=load_images,
+                                 capture=capture)
+    driver = browser.get()
 
     try:
+        # Fast path through the browser
+        if fast:
+            if limiter:
+                limiter.acquire()
+            driver.get(build_reader_url(url))
+            browser.record_page()
+            wait_for_comic_image(driver, timeout=load_timeout)
+            page_urls = extract_page_urls_browser(driver)
+            if page_urls:
+                scrape_page_list(volume_name, issue_number, url, page_urls, output_dir,
+                                 session, workers, journal)
+                return
+            print("[INFO] Page list extraction failed; falling back to page-by-page navigation")
+
         # Navigate to URL
-        driver.get(url)
+        if limiter:
+            limiter.acquire()
+        with metrics.span("page_load"):
+            driver.get(url)
+            browser.record_page()
 
-        # Wait for initial page load
-        time.sleep(5)
+            # Wait for initial page load
+            loaded = wait_for_comic_image(driver, timeout=load_timeout)
+        if loaded:
+            print(f"[INFO] First page ready after {time.monotonic() - start_time:.2f}s")
+        else:
+            print(f"[WARN] No comic image loaded within {load_timeout:.0f}s")
 
         # Try to click Server 1 if available
-        try:
-            server_btns = driver.find_elements(By.XPATH, "//a[contains(text(), 'Server')]")
-            if server_btns:
-                server_btns[0].click()
-                time.sleep(1)
-        except Exception:
-            pass
+        click_reader_option(driver, "//a[contains(text(), 'Server')]", page_timeout)
 
         # Try to click High Quality if available
-        try:
-            quality_btns = driver.find_elements(By.XPATH, "//a[contains(text(), 'High') or contains(text(), 'Quality')]")
-            if quality_btns:
-                quality_btns[0].click()
-                time.sleep(2)
-        except Exception:
-            pass
+        click_reader_option(driver, "//a[contains(text(), 'High') or contains(text(), 'Quality')]",
+                            page_timeout)
+
+        # Jump straight to the first missing page
+        if start_page > 1 and not jump_to_page(driver, start_page, page_timeout, limiter):
+            print(f"[WARN] Could not jump to page {start_page}; starting from page 1")
+            start_page = 1
 
-        # Scrape pages
+        # Scrape pages: navigation feeds the download pipeline
         page_num = start_page
         max_pages = 40  # Safety limit - most issues have < 40 pages
-        downloaded_pages = []
-        previous_hash = None
-        all_hashes = set()  # Track ALL hashes to detect duplicates across pages
+        pipeline = PagePipeline(session, workers, journal=journal)
+        issue_finished = False  # Loop reached the issue's end (not a failure)
+        captured_pages = 0
 
         print(f"[INFO] Starting from page {page_num} (max: {max_pages})")
         print("[INFO] Will stop if detecting next issue or reaching page limit")
@@ -579,154 +1981,406 @@ def scrape_issue(volume_name: str, issue_number: str, url: Optional[str] = None,
         print("Starting scrape...")
         print("=" * 50)
 
-        while page_num <= max_pages:
-            # Wait for image to load on each page
-            time.sleep(3)
-
-            # Find comic image
-            comic_url = find_comic_image(driver)
-
-            if not comic_url:
-                print(f"[{page_num}] [FAIL] No comic image found")
-                break
-
-            # Download page
-            ext = ".jpg"
-            if ".png" in comic_url:
-                ext = ".png"
-            elif ".webp" in comic_url:
-                ext = ".webp"
-
-            filename = f"page_{page_num:03d}{ext}"
-            output_path = output_dir / filename
+        try:
+            while page_num <= max_pages:
+                # Find comic image (navigation already waited for it to load)
+                with metrics.span("find_image"):
+                    comic_url = find_comic_image(driver)
 
-            # Check if file already exists
-            if output_path.exists():
-                print(f"[{page_num}] [SKIP] Already downloaded")
+                if not comic_url:
+                    print(f"[{page_num}] [FAIL] No comic image found")
+                    break
 
-                # Read hash for duplicate detection
-                with open(output_path, "rb") as f:
-                    file_hash = get_image_hash(f.read())
-                    previous_hash = file_hash
-                    all_hashes.add(file_hash)
+                # Hand the page to the download workers (with the browser's
+                # copy of the image when capturing)
+                filename = f"page_{page_num:03d}{image_extension(comic_url)}"
+                image_data = None
+                if browser.capture and not (output_dir / filename).exists():
+                    with metrics.span("capture") as span:
+                        image_data = browser.capture.body(comic_url)
+                        span.bytes = len(image_data or b"")
+                    if image_data:
+                        captured_pages += 1
+                        metrics.count("pages_captured")
+                pipeline.submit(page_num, comic_url, output_dir / filename, image_data)
 
                 # Check page count against indicator
-                if total_pages_expected and page_num > total_pages_expected:
+                if total_pages_expected and page_num >= total_pages_expected:
                     print(f"\n[INFO] Reached expected page count ({total_pages_expected})")
+                    issue_finished = True
                     break
 
-                # Navigate to next page
-                success, current_issue, page_fragment, page_title = navigate_to_next_page(driver)
+                # A duplicate or failed page ends the issue
+                if pipeline.stopped.is_set():
+                    issue_finished = True
+                    break
 
-                if not success:
+                # Navigate to next page while earlier pages download
+                with metrics.span("navigate"):
+                    nav_status, current_issue, page_fragment, page_title = navigate_to_next_page(driver, page_timeout, limiter)
+                    if nav_status == NAV_TIMEOUT:
+                        # The click went through; give a slow page one more
+                        # wait (clicking again could skip a page)
+                        if wait_for_comic_image(driver, previous_src=comic_url, timeout=page_timeout):
+                            nav_status = NAV_OK
+                            current_issue = extract_issue_number_from_url(driver.current_url)
+                browser.record_page()
+
+                if nav_status == NAV_END:
                     print(f"\n[INFO] No more pages")
+                    issue_finished = True
+                    break
+                if nav_status != NAV_OK:
+                    # A slow or broken page turn is not the end of the issue
+                    print(f"\n[WARN] Could not turn past page {page_num} ({nav_status}); "
+                          f"the next run resumes from here")
                     break
 
                 # Check if we've moved to a new issue
                 if stop_at_next_issue and current_issue is not None and current_issue != expected_issue:
                     print(f"\n[INFO] Reached next issue (Issue #{current_issue})")
                     print(f"[INFO] Stopping at issue boundary")
+                    issue_finished = True
+                    break
+
+                if pipeline.stopped.is_set():
+                    issue_finished = True
                     break
 
                 page_num += 1
-                continue
+        finally:
+            downloaded_pages, last_page = pipeline.close()
 
-            # Download image
-            print(f"[{page_num}] Downloading: {comic_url[:70]}...")
+        if browser.capture:
+            print(f"[INFO] Pages captured from the browser: {captured_pages}")
+        if pipeline.retry.used:
+            print(f"[INFO] Page retries used: {pipeline.retry.used}/{pipeline.retry.budget}")
+        for failed_page, reason in sorted(pipeline.failures.items()):
+            print(f"[FAIL] Page {failed_page}: {reason} (will be retried by the next run)")
 
-            if download_image(comic_url, output_path):
-                # Validate downloaded image
-                if validate_downloaded_image(output_path):
-                    print(f"[{page_num}] [OK] Downloaded")
+        # Failed pages leave the issue open so the next run resumes it
+        if issue_finished and not pipeline.failed:
+            journal.mark_complete(last_page)
 
-                    # Check for duplicates against ALL downloaded pages
-                    with open(output_path, "rb") as f:
-                        current_hash = get_image_hash(f.read())
+        # Save metadata
+        metadata_path = save_issue_metadata(volume_name, issue_number, url, last_page,
+                                            downloaded_pages, output_dir, pipeline.failures)
 
-                    if current_hash in all_hashes:
-                        print(f"[{page_num}] [WARN] Duplicate detected (image already downloaded)")
-                        print(f"[{page_num}] [WARN] This is likely the next issue - stopping")
-                        output_path.unlink()  # Remove duplicate
-                        break
+        # Print summary
+        print_scrape_summary(volume_name, issue_number, last_page, output_dir, metadata_path)
 
-                    previous_hash = current_hash
-                    all_hashes.add(current_hash)
-                    downloaded_pages.append({
-                        "page_number": page_num,
-                        "filename": filename,
-                        "url": comic_url,
-                        "hash": current_hash
-                    })
+    except WebDriverException as e:
+        print(f"\n[ERROR] Browser error: {e}")
+        browser.discard()
 
-                else:
-                    print(f"[{page_num}] [FAIL] Image validation failed")
-                    output_path.unlink()  # Remove invalid image
-                    break
-            else:
-                print(f"[{page_num}] [FAIL] Download failed")
-                break
+    except KeyboardInterrupt:
+        print("\n\nScraping cancelled by user.")
 
-            # Check page count against indicator
-            if total_pages_expected and page_num > total_pages_expected:
-                print(f"\n[INFO] Reached expected page count ({total_pages_expected})")
-                break
+    finally:
+        if owns_browser:
+            browser.quit()
 
-            # Navigate to next page
-            success, current_issue, page_fragment, page_title = navigate_to_next_page(driver)
 
-            if not success:
-                print(f"\n[INFO] No more pages")
-                break
+def probe_issue(browser: BrowserSession, issue_number: str, url: str, load_timeout: float,
+                limiter: Optional[TokenBucket] = None) -> bool:
+    """
+    Check whether an issue exists by loading its reader in the browser.
 
-            # Check if we've moved to a new issue
-            if stop_at_next_issue and current_issue is not None and current_issue != expected_issue:
-                print(f"\n[INFO] Reached next issue (Issue #{current_issue})")
-                print(f"[INFO] Stopping at issue boundary")
-                break
+    Returns:
+        True if the reader shows a comic image, False otherwise
+    """
+    driver = browser.get()
+    if limiter:
+        limiter.acquire()
+    driver.get(url)
+    browser.record_page()
+
+    # Check if we got a 404 or "Issue not found" page
+    page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
+    if "not found" in page_text or "404" in page_text:
+        print(f"[INFO] Issue #{issue_number} does not exist.")
+        return False
 
-            page_num += 1
+    # Check if comic image exists
+    if not wait_for_comic_image(driver, timeout=load_timeout):
+        print(f"[INFO] No comic images found for Issue #{issue_number}.")
+        return False
 
-        # Save metadata
-        metadata = {
-            "volume": volume_name,
-            "issue": issue_number,
-            "url": url,
-            "total_pages": page_num - 1,
-            "pages": downloaded_pages,
-            "scraped_at": datetime.now().isoformat(),
-            "output_directory": str(output_dir)
-        }
+    return True
 
-        metadata_path = output_dir.parent / "metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
 
-        # Print summary
-        print("\n" + "=" * 50)
-        print("Scrape Summary")
-        print("=" * 50)
-        print(f"Volume: {volume_name}")
-        print(f"Issue: {issue_number}")
-        print(f"Total pages: {page_num - 1}")
-        print(f"Output directory: {output_dir.absolute()}")
-        print(f"Metadata saved: {metadata_path.absolute()}")
-        print("=" * 50)
+def issue_sort_key(issue_id: str) -> tuple:
+    """Order numbered issues numerically, followed by everything else (annuals, specials)."""
+    try:
+        return (0, float(issue_id), issue_id)
+    except ValueError:
+        return (1, 0.0, issue_id)
 
-    except KeyboardInterrupt:
-        print("\n\nScraping cancelled by user.")
 
-    finally:
-        driver.quit()
+def parse_issue_links(html: str, volume_name: str) -> list[tuple[str, str]]:
+    """
+    Extract the volume's issue links from its landing page.
+
+    Returns:
+        Ordered, de-duplicated (issue_id, url) pairs
+    """
+    volume_segment = sanitize_for_url(volume_name).lower()
+    issues = {}
+
+    for url, volume, segment in ISSUE_LINK_PATTERN.findall(html):
+        if volume.lower() != volume_segment:
+            continue
+        issue_id = issue_id_from_segment(segment)
+        if issue_id not in issues:
+            if url.startswith("/"):
+                url = f"{COMIC_BASE_URL}{url}"
+            issues[issue_id] = url
+
+    return sorted(issues.items(), key=lambda item: issue_sort_key(item[0]))
+
+
+def discover_issues_landing(volume_name: str, session: requests.Session,
+                            limiter: Optional[TokenBucket] = None) -> list[tuple[str, str]]:
+    """Read the issue list from the volume's landing page (empty list on failure)."""
+    url = f"{COMIC_BASE_URL}/Comic/{sanitize_for_url(volume_name)}"
+
+    if limiter:
+        limiter.acquire()
+
+    try:
+        response = session.get(url, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"[INFO] Volume landing page unavailable: {e}")
+        return []
+
+    return parse_issue_links(response.text, volume_name)
 
 
-def scrape_all_issues(volume_name: str, start_issue: int = 1, headless: bool = False):
+def issue_exists_http(issue_id: str, url: str, session: requests.Session,
+                      limiter: Optional[TokenBucket] = None) -> bool:
+    """Check over plain HTTP whether an issue's reader page exists."""
+    if limiter:
+        limiter.acquire()
+
+    try:
+        response = session.get(url, timeout=DOWNLOAD_TIMEOUT)
+    except requests.RequestException:
+        return False
+
+    # Missing issues 404 or redirect away from the issue's reader
+    if response.status_code != 200 or extract_issue_number_from_url(response.url) != issue_id:
+        return False
+    return "lstImages" in response.text or "divImage" in response.text
+
+
+def discover_issues_probe(volume_name: str, session: requests.Session,
+                          limiter: Optional[TokenBucket] = None,
+                          workers: int = DISCOVERY_WORKERS) -> list[tuple[str, str]]:
+    """
+    Find numbered issues by probing their reader URLs concurrently.
+
+    Numbers are probed in batches of `workers`; probing stops once
+    PROBE_MISS_LIMIT consecutive numbers past the last hit are missing, so
+    small gaps in the numbering do not end discovery.
+    """
+    found = []
+    last_hit = 0
+    next_num = 1
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while next_num <= MAX_VOLUME_ISSUES and next_num - last_hit <= PROBE_MISS_LIMIT:
+            batch = range(next_num, min(next_num + workers, MAX_VOLUME_ISSUES + 1))
+            urls = {n: construct_comic_url(volume_name, str(n)) for n in batch}
+            results = executor.map(lambda n: issue_exists_http(str(n), urls[n], session, limiter), batch)
+
+            for issue_num, exists in zip(batch, results):
+                if exists:
+                    found.append((str(issue_num), urls[issue_num]))
+                    last_hit = issue_num
+
+            next_num = batch.stop
+
+    return found
+
+
+def discover_issues(volume_name: str, limiter: Optional[TokenBucket] = None) -> list[tuple[str, str]]:
+    """
+    List a volume's issues without a browser.
+
+    Tries the volume landing page first (which also finds annuals and
+    other non-numeric issues), then concurrent HTTP probes of numbered
+    issue URLs.
+
+    Returns:
+        Ordered (issue_id, url) pairs, or an empty list if neither worked
+    """
+    session = create_session(DISCOVERY_WORKERS)
+
+    issues = discover_issues_landing(volume_name, session, limiter)
+    if issues:
+        print(f"[INFO] Found {len(issues)} issues on the volume page")
+        return issues
+
+    issues = discover_issues_probe(volume_name, session, limiter)
+    if issues:
+        print(f"[INFO] Found {len(issues)} issues by probing issue URLs")
+    return issues
+
+
+def plan_volume(volume_name: str, issues: list[tuple[str, str]],
+                start_issue: int = 1) -> list[tuple[str, str]]:
+    """
+    Drop issues before `start_issue` and issues already complete on disk.
+
+    Returns:
+        The (issue_id, url) pairs still to scrape, in order
+    """
+    sanitized_volume = sanitize_filename(volume_name)
+    planned = []
+    complete = 0
+
+    for issue_id, url in issues:
+        sort_group, number, _ = issue_sort_key(issue_id)
+        if sort_group == 0 and number < start_issue:
+            continue
+        if PageJournal(OUTPUT_BASE_PATH / sanitized_volume / "issues" / issue_id).complete:
+            complete += 1
+            continue
+        planned.append((issue_id, url))
+
+    print(f"[PLAN] {len(issues)} issues found, {complete} already complete, {len(planned)} to scrape")
+    if planned:
+        print(f"[PLAN] Order: {', '.join('#' + issue_id for issue_id, _ in planned)}")
+    return planned
+
+
+def scrape_issues_parallel(volume_name: str, start_issue: int, parallel: int,
+                           headless: bool, load_timeout: float, page_timeout: float,
+                           fast: bool, workers: int, recycle_pages: int,
+                           profile_dir: Optional[Path],
+                           limiter: Optional[TokenBucket],
+                           blocked_urls: Optional[list[str]] = None,
+                           load_images: bool = True,
+                           capture: bool = False,
+                           issues: Optional[list[tuple[str, str]]] = None) -> tuple[int, int]:
+    """
+    Scrape a volume's issues `parallel` at a time in tabs of one Chrome.
+
+    With a planned `issues` list, workers take issues from it in order.
+    Otherwise each worker claims the next issue number, probes it and
+    scrapes it; the first missing issue caps the range, so workers stop
+    claiming numbers past it. Each issue's output goes to its own
+    scrape.log next to its pages; the console only gets one line per issue.
+
+    Returns:
+        (issues_scraped, browser_starts) tuple
+    """
+    sanitized_volume = sanitize_filename(volume_name)
+    router = IssueLogRouter(sys.stdout)
+    lock = threading.Lock()
+    state = {"next": start_issue, "last": MAX_VOLUME_ISSUES, "scraped": 0, "starts": 1}
+    planned = list(issues) if issues is not None else None
+
+    def claim() -> Optional[tuple[str, str, bool]]:
+        """Return the next (issue_id, url, needs_probe) to scrape, or None."""
+        with lock:
+            if planned is not None:
+                return (*planned.pop(0), False) if planned else None
+            if state["next"] > state["last"]:
+                return None
+            issue_num = state["next"]
+            state["next"] += 1
+            return str(issue_num), construct_comic_url(volume_name, str(issue_num)), True
+
+    def stop_after(issue_id: str):
+        if planned is not None:
+            return  # A planned issue failing does not say anything about the others
+        with lock:
+            state["last"] = min(state["last"], int(issue_id) - 1)
+
+    def worker(chrome: SharedChrome):
+        with chrome.session(recycle_pages) as browser:
+            while (claimed := claim()) is not None:
+                issue_id, url, needs_probe = claimed
+                log_path = OUTPUT_BASE_PATH / sanitized_volume / "issues" / issue_id / ISSUE_LOG_FILENAME
+
+                try:
+                    if needs_probe and not probe_issue(browser, issue_id, url, load_timeout, limiter):
+                        stop_after(issue_id)
+                        continue
+
+                    print(f"[START] Issue #{issue_id} (log: {log_path})")
+                    with router.capture(log_path):
+                        scrape_issue(volume_name, issue_id, url, headless,
+                                     stop_at_next_issue=True, load_timeout=load_timeout,
+                                     page_timeout=page_timeout, fast=fast, workers=workers,
+                                     browser=browser, limiter=limiter)
+                    print(f"[DONE] Issue #{issue_id}")
+
+                    with lock:
+                        state["scraped"] += 1
+
+                except Exception as e:
+                    print(f"[ERROR] Error on issue #{issue_id}: {e}")
+                    browser.discard()
+                    stop_after(issue_id)
+
+            with lock:
+                state["starts"] += browser.starts
+
+    sys.stdout = router
+    try:
+        with SharedChrome(headless=headless, profile_dir=profile_dir, blocked_urls=blocked_urls,
+                          load_images=load_images, capture=capture) as chrome:
+            with ThreadPoolExecutor(max_workers=parallel) as executor:
+                for future in [executor.submit(worker, chrome) for _ in range(parallel)]:
+                    future.result()
+    finally:
+        sys.stdout = router.stream
+
+    return state["scraped"], state["starts"]
+
+
+def scrape_all_issues(volume_name: str, start_issue: int = 1, headless: bool = False,
+                      load_timeout: float = PAGE_LOAD_TIMEOUT,
+                      page_timeout: float = PAGE_TURN_TIMEOUT,
+                      fast: bool = False, workers: int = DEFAULT_DOWNLOAD_WORKERS,
+                      recycle_pages: int = DRIVER_RECYCLE_PAGES,
+                      profile_dir: Optional[Path] = None,
+                      parallel: int = DEFAULT_PARALLEL_ISSUES,
+                      limiter: Optional[TokenBucket] = None,
+                      blocked_urls: Optional[list[str]] = None,
+                      load_images: bool = True,
+                      capture: bool = False):
     """
     Scrape all issues from a comic volume starting from the specified issue.
 
+    The volume is planned up front: issues are discovered without a
+    browser (landing page, then HTTP probes) and those already complete on
+    disk are skipped. Only if discovery finds nothing does the scraper fall
+    back to probing issue 1, 2, 3... in the browser until one is missing.
+
+    One browser session is shared by the existence checks and every issue,
+    so Chrome starts once per volume (plus any recycling or crash restarts).
+    With parallel > 1, issues are scraped concurrently in tabs of a single
+    Chrome (see scrape_issues_parallel).
+
     Args:
         volume_name: Name of the comic volume
         start_issue: First issue to scrape (default: 1)
         headless: Run browser in headless mode
+        load_timeout: Max seconds to wait for the reader to show a comic image
+        page_timeout: Max seconds to wait for each page turn
+        fast: Extract all page URLs from one reader load per issue
+        workers: Parallel page downloads in fast mode
+        recycle_pages: Restart the shared browser after this many page loads
+        profile_dir: Persistent browser profile directory
+        parallel: Issues scraped at once
+        limiter: Politeness limiter for the comic host
+        blocked_urls: URL patterns the browser does not load
+        load_images: Let the browser load and decode images
+        capture: Take page bytes from the browser's network layer
     """
     current_issue_num = start_issue
     total_issues = 0
@@ -734,48 +2388,84 @@ def scrape_all_issues(volume_name: str, start_issue: int = 1, headless: bool = F
     print(f"Scraping all issues of {volume_name} (starting from #{current_issue_num})")
     print("=" * 50)
 
-    while current_issue_num <= 100:  # Safety limit
-        # Construct URL for this issue
-        url = construct_comic_url(volume_name, str(current_issue_num))
-        issue_number_str = str(current_issue_num)
-
-        print(f"\nAttempting Issue #{current_issue_num}...")
-        print(f"URL: {url}")
-
-        # Set up driver to check if issue exists
-        driver = setup_driver(headless=headless)
-
-        try:
-            driver.get(url)
-            time.sleep(5)
-
-            # Check if we got a 404 or "Issue not found" page
-            page_text = driver.find_element(By.TAG_NAME, "body").text.lower()
-            if "not found" in page_text or "404" in page_text:
-                print(f"[INFO] Issue #{current_issue_num} does not exist. Stopping.")
-                break
-
-            # Check if comic image exists
-            if not find_comic_image(driver):
-                print(f"[INFO] No comic images found for Issue #{current_issue_num}. Stopping.")
-                break
+    # Plan the volume without a browser if the issue list can be discovered
+    issues = discover_issues(volume_name, limiter)
+    planned = plan_volume(volume_name, issues, start_issue) if issues else None
+    if not issues:
+        print("[INFO] Issue discovery found nothing; probing issues in the browser")
+
+    if planned == []:
+        browser_starts = 0
+    elif parallel > 1:
+        print(f"[INFO] Scraping {parallel} issues at a time")
+        total_issues, browser_starts = scrape_issues_parallel(
+            volume_name, start_issue, parallel, headless, load_timeout, page_timeout,
+            fast, workers, recycle_pages, profile_dir, limiter, blocked_urls, load_images, capture,
+            issues=planned
+        )
+    elif planned:
+        with BrowserSession(headless=headless, max_pages=recycle_pages, profile_dir=profile_dir,
+                            blocked_urls=blocked_urls, load_images=load_images,
+                            capture=capture) as browser:
+            for issue_id, url in planned:
+                print(f"\nIssue #{issue_id}...")
+                try:
+                    scrape_issue(volume_name, issue_id, url, headless, stop_at_next_issue=True,
+                                 load_timeout=load_timeout, page_timeout=page_timeout,
+                                 fast=fast, workers=workers, browser=browser, limiter=limiter)
+                    total_issues += 1
+                except Exception as e:
+                    print(f"[ERROR] Error on issue #{issue_id}: {e}")
+                    browser.discard()
+
+            browser_starts = browser.starts
+    else:
+        with BrowserSession(headless=headless, max_pages=recycle_pages, profile_dir=profile_dir,
+                            blocked_urls=blocked_urls, load_images=load_images,
+                            capture=capture) as browser:
+            while current_issue_num <= MAX_VOLUME_ISSUES:  # Safety limit
+                # Construct URL for this issue
+                url = construct_comic_url(volume_name, str(current_issue_num))
+                issue_number_str = str(current_issue_num)
+
+                print(f"\nAttempting Issue #{current_issue_num}...")
+                print(f"URL: {url}")
+
+                try:
+                    # Check if issue exists with the shared browser
+                    if not probe_issue(browser, issue_number_str, url, load_timeout, limiter):
+                        print("[INFO] Stopping.")
+                        break
 
-            driver.quit()
+                    # Scrape this issue (with stop_at_next_issue=True to be safe)
+                    scrape_issue(volume_name, issue_number_str, url, headless, stop_at_next_issue=True,
+                                 load_timeout=load_timeout, page_timeout=page_timeout,
+                                 fast=fast, workers=workers, browser=browser, limiter=limiter)
+                    total_issues += 1
+                    current_issue_num += 1
 
-            # Scrape this issue (with stop_at_next_issue=True to be safe)
-            scrape_issue(volume_name, issue_number_str, url, headless, stop_at_next_issue=True)
-            total_issues += 1
-            current_issue_num += 1
+                except Exception as e:
+                    print(f"[ERROR] Error checking issue #{current_issue_num}: {e}")
+                    break
 
-        except Exception as e:
-            print(f"[ERROR] Error checking issue #{current_issue_num}: {e}")
-            driver.quit()
-            break
+            browser_starts = browser.starts
 
     print("\n" + "=" * 50)
     print(f"All issues scraping complete!")
     print(f"Total issues scraped: {total_issues}")
+    print(f"Browser starts: {browser_starts}")
+    print("=" * 50)
+
+
+def report_metrics(metrics_dir: Optional[Path]):
+    """Print per-stage timings and write them as JSON and a Prometheus textfile."""
+    print()
+    print("Stage Timings")
     print("=" * 50)
+    metrics.print_summary()
+    if metrics_dir:
+        json_path, prom_path = metrics.write(metrics_dir)
+        print(f"[INFO] Metrics written to {json_path} and {prom_path.name}")
 
 
 def main():
@@ -797,6 +2487,27 @@ Examples:
   # Run in headless mode
   python selenium_webscraping_pages.py "Absolute Batman" --headless
 
+  # Keep site assets cached between runs
+  python selenium_webscraping_pages.py "Absolute Batman" 7 --profile-dir
+
+  # Re-resolve chromedriver after a Chrome update
+  python selenium_webscraping_pages.py --refresh-driver
+
+  # Scrape 3 issues at a time in one browser
+  python selenium_webscraping_pages.py "Absolute Batman" --parallel 3 --headless
+
+  # Skip image decoding in the browser and block an extra ad host
+  python selenium_webscraping_pages.py "Absolute Batman" 7 --no-images --block "*popads*"
+
+  # Save the images the browser already loaded instead of downloading them again
+  python selenium_webscraping_pages.py "Absolute Batman" 7 --capture
+
+  # Fast mode: one reader load, pages downloaded in parallel
+  python selenium_webscraping_pages.py "Absolute Batman" 7 --fast --workers 8
+
+  # Print a timing line per page and write metrics for node_exporter
+  python selenium_webscraping_pages.py "Absolute Batman" 7 --live --metrics-dir /var/lib/node_exporter
+
 Output Structure:
   scripts/assets/<Volume_Name>/issues/<Issue_Number>/pages/page_001.jpg
   scripts/assets/<Volume_Name>/issues/<Issue_Number>/metadata.json
@@ -805,6 +2516,8 @@ Output Structure:
 
     parser.add_argument(
         "volume",
+        nargs='?',
+        default=None,
         help="Comic volume name (e.g., 'Absolute Batman')"
     )
 
@@ -827,15 +2540,161 @@ Output Structure:
         help="Run browser in headless mode (no GUI)"
     )
 
+    parser.add_argument(
+        "--load-timeout",
+        type=float,
+        default=PAGE_LOAD_TIMEOUT,
+        help=f"Max seconds to wait for the reader's first comic image (default: {PAGE_LOAD_TIMEOUT:.0f})"
+    )
+
+    parser.add_argument(
+        "--page-timeout",
+        type=float,
+        default=PAGE_TURN_TIMEOUT,
+        help=f"Max seconds to wait for each page turn (default: {PAGE_TURN_TIMEOUT:.0f})"
+    )
+
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Extract every page URL from one reader load and download pages in parallel"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help=f"Parallel page downloads (default: {DEFAULT_DOWNLOAD_WORKERS})"
+    )
+
+    parser.add_argument(
+        "--recycle-pages",
+        type=int,
+        default=DRIVER_RECYCLE_PAGES,
+        help=f"Restart the shared browser after this many page loads (default: {DRIVER_RECYCLE_PAGES})"
+    )
+
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=DEFAULT_PARALLEL_ISSUES,
+        help="Issues scraped at once in all-issues mode, each in its own tab of one browser "
+             f"(default: {DEFAULT_PARALLEL_ISSUES})"
+    )
+
+    parser.add_argument(
+        "--host-rate",
+        type=float,
+        default=HOST_RATE,
+        help=f"Max page loads per second on the comic host, shared by all tabs (default: {HOST_RATE})"
+    )
+
+    parser.add_argument(
+        "--no-block",
+        action="store_true",
+        help="Load ads, analytics and other third-party resources normally"
+    )
+
+    parser.add_argument(
+        "--block",
+        nargs="+",
+        default=[],
+        metavar="PATTERN",
+        help="Extra URL patterns to block (e.g. '*popads*')"
+    )
+
+    parser.add_argument(
+        "--allow-host",
+        nargs="+",
+        default=[],
+        metavar="HOST",
+        help="Hosts the reader needs; block patterns matching them are dropped"
+    )
+
+    parser.add_argument(
+        "--no-images",
+        action="store_true",
+        help="Do not load or decode images in the browser (pages are downloaded separately)"
+    )
+
+    parser.add_argument(
+        "--capture",
+        action="store_true",
+        help="Save the page images the browser already loaded instead of downloading them again"
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        nargs='?',
+        const=str(DEFAULT_PROFILE_DIR),
+        default=None,
+        help=f"Use a persistent browser profile so site assets stay cached (default dir: {DEFAULT_PROFILE_DIR})"
+    )
+
+    parser.add_argument(
+        "--refresh-driver",
+        action="store_true",
+        help="Resolve chromedriver again instead of using the cached path"
+    )
+
+    parser.add_argument(
+        "--metrics-dir",
+        type=Path,
+        default=METRICS_DIR,
+        help=f"Directory for per-stage timings as JSON and Prometheus textfile (default: {METRICS_DIR})"
+    )
+
+    parser.add_argument(
+        "--no-metrics",
+        action="store_true",
+        help="Do not write the metrics files (the timing table is still printed)"
+    )
+
+    parser.add_argument(
+        "--live",
+        action="store_true",
+        help="Print a timing line for every downloaded page"
+    )
+
     args = parser.parse_args()
+    metrics.live = args.live
+
+    if args.refresh_driver:
+        driver_path = resolve_chromedriver(refresh=True)
+        print(f"[INFO] chromedriver: {driver_path or 'managed by Selenium'}")
+        if args.volume is None:
+            return
+
+    if args.volume is None:
+        parser.error("the following arguments are required: volume")
+
+    profile_dir = Path(args.profile_dir) if args.profile_dir else None
+    limiter = TokenBucket(rate=args.host_rate, capacity=HOST_BURST)
+    if args.capture and args.no_images:
+        parser.error("--capture needs the browser to load images; drop --no-images")
+
+    blocked_urls = None if args.no_block else build_blocked_urls(args.block, args.allow_host)
+    load_images = not args.no_images
 
     # Route to appropriate function based on whether issue number is provided
     if args.issue is None:
         # Scrape all issues
-        scrape_all_issues(args.volume, start_issue=1, headless=args.headless)
+        scrape_all_issues(args.volume, start_issue=1, headless=args.headless,
+                          load_timeout=args.load_timeout, page_timeout=args.page_timeout,
+                          fast=args.fast, workers=args.workers,
+                          recycle_pages=args.recycle_pages, profile_dir=profile_dir,
+                          parallel=args.parallel, limiter=limiter,
+                          blocked_urls=blocked_urls, load_images=load_images,
+                          capture=args.capture)
     else:
         # Scrape single issue
-        scrape_issue(args.volume, args.issue, args.url, args.headless, stop_at_next_issue=True)
+        scrape_issue(args.volume, args.issue, args.url, args.headless, stop_at_next_issue=True,
+                     load_timeout=args.load_timeout, page_timeout=args.page_timeout,
+                     fast=args.fast, workers=args.workers, profile_dir=profile_dir,
+                     limiter=limiter, blocked_urls=blocked_urls, load_images=load_images,
+                     capture=args.capture)
+
+    report_metrics(None if args.no_metrics else args.metrics_dir)
 
 
 if __name__ == "__main__":
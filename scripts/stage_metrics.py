@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Stage Metrics
+
+Lightweight per-stage timing shared by the scripts in this directory.
+Code wraps each stage (page load, download, API request, ...) in a span;
+durations, byte counts and event counters are aggregated per stage and
+written at the end of a run as JSON and as a Prometheus textfile (for the
+node_exporter textfile collector).
+
+Usage:
+    metrics = StageMetrics("comic_pages")
+    with metrics.span("download") as span:
+        data = fetch()
+        span.bytes = len(data)
+    metrics.count("pages_ok")
+    metrics.write(METRICS_DIR)
+"""
+
+import os
+import json
+import math
+import time
+import threading
+import contextlib
+from pathlib import Path
+from datetime import datetime
+from collections import defaultdict
+
+
+# Configuration
+SCRIPT_DIR = Path(__file__).parent
+METRICS_DIR = SCRIPT_DIR / ".cache" / "metrics"
+METRIC_PREFIX = "comic"
+QUANTILES = (0.5, 0.95)
+
+
+class Span:
+    """One timed stage; set `bytes` inside the block to record transferred bytes."""
+
+    def __init__(self, stage: str):
+        self.stage = stage
+        self.bytes = 0
+        self.seconds = 0.0
+        self._start = time.perf_counter()
+
+    def stop(self) -> float:
+        self.seconds = time.perf_counter() - self._start
+        return self.seconds
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """Nearest-rank percentile of a sorted list (0.0 if empty)."""
+    if not samples:
+        return 0.0
+    rank = min(len(samples), max(1, math.ceil(q * len(samples))))
+    return samples[rank - 1]
+
+
+class StageMetrics:
+    """
+    Thread-safe collection of per-stage durations, bytes and counters.
+
+    Every sample is kept (runs are at most a few thousand pages or covers),
+    so quantiles are exact. With `live` set, page_line() prints a status
+    line per page or cover.
+    """
+
+    def __init__(self, job: str, live: bool = False):
+        self.job = job
+        self.live = live
+        self.started_at = time.time()
+        self._durations = defaultdict(list)
+        self._bytes = defaultdict(int)
+        self._counters = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, stage: str):
+        """Time the enclosed block as one sample of `stage` (also on exceptions)."""
+        span = Span(stage)
+        try:
+            yield span
+        finally:
+            self.observe(stage, span.stop(), span.bytes)
+
+    def observe(self, stage: str, seconds: float, nbytes: int = 0):
+        """Record one sample of `stage`."""
+        with self._lock:
+            self._durations[stage].append(seconds)
+            self._bytes[stage] += nbytes
+
+    def count(self, name: str, amount: int = 1):
+        """Increment an event counter (e.g. pages_ok, api_cache_hits)."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def quantile(self, stage: str, q: float) -> float:
+        """Return the q-quantile of a stage's durations so far."""
+        with self._lock:
+            samples = sorted(self._durations.get(stage, []))
+        return percentile(samples, q)
+
+    def page_line(self, text: str):
+        """Print a live per-item line when live output is on."""
+        if self.live:
+            print(f"[LIVE] {text}")
+
+    def summary(self) -> dict:
+        """Aggregate all stages and counters into a JSON-serializable dict."""
+        with self._lock:
+            durations = {stage: sorted(samples) for stage, samples in self._durations.items()}
+            stage_bytes = dict(self._bytes)
+            counters = dict(self._counters)
+
+        stages = {}
+        for stage, samples in sorted(durations.items()):
+            stages[stage] = {
+                "count": len(samples),
+                "total_seconds": round(sum(samples), 6),
+                "p50_seconds": round(percentile(samples, 0.5), 6),
+                "p95_seconds": round(percentile(samples, 0.95), 6),
+                "max_seconds": round(samples[-1], 6) if samples else 0.0,
+                "bytes": stage_bytes.get(stage, 0),
+            }
+
+        return {
+            "job": self.job,
+            "started_at": datetime.fromtimestamp(self.started_at).isoformat(),
+            "duration_seconds": round(time.time() - self.started_at, 3),
+            "stages": stages,
+            "counters": dict(sorted(counters.items())),
+        }
+
+    def prometheus_text(self) -> str:
+        """Render the summary in the Prometheus text exposition format."""
+        summary = self.summary()
+        job = self.job
+        lines = [
+            f"# HELP {METRIC_PREFIX}_stage_seconds Duration of each pipeline stage.",
+            f"# TYPE {METRIC_PREFIX}_stage_seconds summary",
+        ]
+
+        with self._lock:
+            durations = {stage: sorted(samples) for stage, samples in self._durations.items()}
+
+        for stage, stats in summary["stages"].items():
+            labels = f'job="{job}",stage="{stage}"'
+            for q in QUANTILES:
+                lines.append(f'{METRIC_PREFIX}_stage_seconds{{{labels},quantile="{q}"}} '
+                             f'{percentile(durations[stage], q):.6f}')
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_sum{{{labels}}} {stats['total_seconds']:.6f}")
+            lines.append(f"{METRIC_PREFIX}_stage_seconds_count{{{labels}}} {stats['count']}")
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_stage_max_seconds Slowest sample of each stage.",
+            f"# TYPE {METRIC_PREFIX}_stage_max_seconds gauge",
+        ]
+        for stage, stats in summary["stages"].items():
+            lines.append(f'{METRIC_PREFIX}_stage_max_seconds{{job="{job}",stage="{stage}"}} '
+                         f"{stats['max_seconds']:.6f}")
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_stage_bytes Bytes transferred or written per stage.",
+            f"# TYPE {METRIC_PREFIX}_stage_bytes gauge",
+        ]
+        for stage, stats in summary["stages"].items():
+            lines.append(f'{METRIC_PREFIX}_stage_bytes{{job="{job}",stage="{stage}"}} {stats["bytes"]}')
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_events Event counts for the run.",
+            f"# TYPE {METRIC_PREFIX}_events gauge",
+        ]
+        for name, value in summary["counters"].items():
+            lines.append(f'{METRIC_PREFIX}_events{{job="{job}",event="{name}"}} {value}')
+
+        lines += [
+            f"# HELP {METRIC_PREFIX}_run_duration_seconds Wall time of the run.",
+            f"# TYPE {METRIC_PREFIX}_run_duration_seconds gauge",
+            f'{METRIC_PREFIX}_run_duration_seconds{{job="{job}"}} {summary["duration_seconds"]}',
+            f"# HELP {METRIC_PREFIX}_run_finished_timestamp_seconds When the run finished.",
+            f"# TYPE {METRIC_PREFIX}_run_finished_timestamp_seconds gauge",
+            f'{METRIC_PREFIX}_run_finished_timestamp_seconds{{job="{job}"}} {time.time():.0f}',
+        ]
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory: Path = METRICS_DIR) -> tuple[Path, Path]:
+        """
+        Write <job>.json and <job>.prom into `directory`.
+
+        Both files are written to a temporary name and renamed into place,
+        so a textfile collector never reads a partial file.
+
+        Returns:
+            (json_path, prom_path) tuple
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        json_path = directory / f"{self.job}.json"
+        prom_path = directory / f"{self.job}.prom"
+
+        for path, content in ((json_path, json.dumps(self.summary(), indent=2) + "\n"),
+                              (prom_path, self.prometheus_text())):
+            tmp_path = path.with_name(path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+        return json_path, prom_path
+
+    def print_summary(self):
+        """Print a per-stage table."""
+        summary = self.summary()
+        if not summary["stages"]:
+            return
+
+        print(f"{'Stage':<16} {'Count':>6} {'p50 s':>8} {'p95 s':>8} {'Max s':>8} {'Total s':>9} {'MB':>8}")
+        for stage, stats in summary["stages"].items():
+            print(f"{stage:<16} {stats['count']:>6} {stats['p50_seconds']:>8.3f} "
+                  f"{stats['p95_seconds']:>8.3f} {stats['max_seconds']:>8.3f} "
+                  f"{stats['total_seconds']:>9.2f} {stats['bytes'] / 1_000_000:>8.2f}")
+        if summary["counters"]:
+            print(", ".join(f"{name}: {value}" for name, value in summary["counters"].items()))